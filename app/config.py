@@ -7,6 +7,15 @@ class Settings(BaseSettings):
     database_url: str = os.getenv("DATABASE_URL", "postgresql://localhost/cloudhire_nexus")
     
     openai_api_key: Optional[str] = os.getenv("OPENAI_API_KEY", None)
+    openai_base_url: Optional[str] = os.getenv("OPENAI_BASE_URL", None)
+    openai_timeout: float = float(os.getenv("OPENAI_TIMEOUT", "60"))
+    openai_connect_timeout: float = float(os.getenv("OPENAI_CONNECT_TIMEOUT", "5"))
+    openai_max_connections: int = int(os.getenv("OPENAI_MAX_CONNECTIONS", "20"))
+    openai_max_retries: int = int(os.getenv("OPENAI_MAX_RETRIES", "2"))
+    
+    ai_call_deadline: float = float(os.getenv("AI_CALL_DEADLINE", "15"))
+    ai_breaker_failure_threshold: int = int(os.getenv("AI_BREAKER_FAILURE_THRESHOLD", "5"))
+    ai_breaker_reset_seconds: float = float(os.getenv("AI_BREAKER_RESET_SECONDS", "30"))
     
     session_secret: str = os.getenv("SESSION_SECRET", "change-this-in-production")
     
@@ -15,6 +24,41 @@ class Settings(BaseSettings):
     smtp_username: Optional[str] = os.getenv("SMTP_USERNAME", None)
     smtp_password: Optional[str] = os.getenv("SMTP_PASSWORD", None)
     
+    smtp_workers: int = int(os.getenv("SMTP_WORKERS", "4"))
+    ai_workers: int = int(os.getenv("AI_WORKERS", "8"))
+    pdf_workers: int = int(os.getenv("PDF_WORKERS", "2"))
+    scrape_workers: int = int(os.getenv("SCRAPE_WORKERS", "4"))
+    db_workers: int = int(os.getenv("DB_WORKERS", "4"))
+    parse_workers: int = int(os.getenv("PARSE_WORKERS", "2"))
+    
+    pdf_render_mode: str = os.getenv("PDF_RENDER_MODE", "process")
+    pdf_max_pending: int = int(os.getenv("PDF_MAX_PENDING", "16"))
+    resume_dir: str = os.getenv("RESUME_DIR", "generated_resumes")
+    resume_gc_grace_seconds: int = int(os.getenv("RESUME_GC_GRACE_SECONDS", "3600"))
+    resume_disk_copy: bool = os.getenv("RESUME_DISK_COPY", "true").lower() == "true"
+    pdf_memory_cache_mb: int = int(os.getenv("PDF_MEMORY_CACHE_MB", "64"))
+    attachment_cache_entries: int = int(os.getenv("ATTACHMENT_CACHE_ENTRIES", "128"))
+    
+    ai_batch_concurrency: int = int(os.getenv("AI_BATCH_CONCURRENCY", "4"))
+    
+    ai_task_workers: int = int(os.getenv("AI_TASK_WORKERS", "4"))
+    ai_task_user_concurrency: int = int(os.getenv("AI_TASK_USER_CONCURRENCY", "2"))
+    ai_task_max_active_per_user: int = int(os.getenv("AI_TASK_MAX_ACTIVE_PER_USER", "100"))
+    ai_task_max_attempts: int = int(os.getenv("AI_TASK_MAX_ATTEMPTS", "3"))
+    ai_task_retry_delay: float = float(os.getenv("AI_TASK_RETRY_DELAY", "5"))
+    ai_task_lease_seconds: int = int(os.getenv("AI_TASK_LEASE_SECONDS", "300"))
+    ai_task_poll_interval: float = float(os.getenv("AI_TASK_POLL_INTERVAL", "1"))
+    ai_task_run_in_api: bool = os.getenv("AI_TASK_RUN_IN_API", "false").lower() == "true"
+    
+    ai_cache_enabled: bool = os.getenv("AI_CACHE_ENABLED", "true").lower() == "true"
+    ai_cache_ttl_seconds: int = int(os.getenv("AI_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+    ai_cache_max_entries: int = int(os.getenv("AI_CACHE_MAX_ENTRIES", "1024"))
+    
+    ai_metrics_window: int = int(os.getenv("AI_METRICS_WINDOW", "1000"))
+    
+    ai_prompt_compression: bool = os.getenv("AI_PROMPT_COMPRESSION", "true").lower() == "true"
+    ai_prompt_token_budget: int = int(os.getenv("AI_PROMPT_TOKEN_BUDGET", "350"))
+    
     environment: str = os.getenv("ENVIRONMENT", "development")
     log_level: str = os.getenv("LOG_LEVEL", "INFO")
     
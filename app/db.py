@@ -1,5 +1,23 @@
+from typing import Any, Callable, TypeVar
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlmodel import create_engine, SQLModel, Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from app.config import settings
+from app.utils.fulltext import ensure_search_index
+from app.utils.metrics_rollup import ensure_metrics_rollups
+from app.utils.dedup import ensure_dedup_schema
+from app.utils.pagination import ensure_keyset_indexes
+from app.utils.resume_store import ensure_resume_store_schema
+from app.utils.batch_scoring import ensure_score_profile_schema
+
+T = TypeVar("T")
+
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite"
+}
 
 engine = create_engine(
     settings.database_url,
@@ -10,10 +28,53 @@ engine = create_engine(
 )
 
 
+def _async_database_url(database_url: str):
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for {backend}")
+    return url.set(drivername=ASYNC_DRIVERS[backend])
+
+
+async_engine = create_async_engine(
+    _async_database_url(settings.database_url),
+    echo=settings.environment == "development",
+    pool_pre_ping=True,
+    pool_size=10,
+    max_overflow=20
+)
+
+
+def _begin_sqlite_savepoint(connection, name):
+    if not connection.connection.driver_connection.in_transaction:
+        connection.exec_driver_sql("BEGIN IMMEDIATE")
+
+
+if engine.dialect.name == "sqlite":
+    event.listen(engine, "savepoint", _begin_sqlite_savepoint)
+    event.listen(async_engine.sync_engine, "savepoint", _begin_sqlite_savepoint)
+
+
 def create_db_and_tables():
     SQLModel.metadata.create_all(engine)
+    ensure_search_index(engine)
+    ensure_dedup_schema(engine)
+    ensure_keyset_indexes(engine)
+    ensure_metrics_rollups(engine)
+    ensure_resume_store_schema(engine)
+    ensure_score_profile_schema(engine)
 
 
 def get_session():
     with Session(engine) as session:
         yield session
+
+
+async def get_async_session():
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        yield session
+
+
+def run_in_session(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    with Session(engine) as session:
+        return func(session, *args, **kwargs)
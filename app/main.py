@@ -1,8 +1,17 @@
+import asyncio
+import threading
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
-from app.db import create_db_and_tables
+from app.config import settings as app_settings
+from app.db import create_db_and_tables, async_engine
 from app.routes import health, jobs, resumes, apply, followups, settings, ai, dashboard
+from app.utils.concurrency import shutdown_blocking_pools
+from app.utils.pdf_pool import shutdown_pdf_pool, start_pdf_pool
+from app.utils.scraper import close_http_client
+from app.utils.openai_clients import close_openai_clients
+from app.utils.ai_tasks import AITaskWorker
+from app.utils.pagination import NEXT_CURSOR_HEADER
 from app.utils.logger import logger
 
 
@@ -11,8 +20,23 @@ async def lifespan(app: FastAPI):
     logger.info("Starting CloudHire Nexus Backend...")
     create_db_and_tables()
     logger.info("Database tables created/verified")
+    start_pdf_pool()
+    
+    ai_task_stop = threading.Event()
+    ai_task_worker = None
+    if app_settings.ai_task_run_in_api:
+        ai_task_worker = asyncio.ensure_future(AITaskWorker().run(ai_task_stop))
+    
     yield
     logger.info("Shutting down CloudHire Nexus Backend...")
+    if ai_task_worker:
+        ai_task_stop.set()
+        await ai_task_worker
+    await close_http_client()
+    close_openai_clients()
+    shutdown_pdf_pool()
+    shutdown_blocking_pools()
+    await async_engine.dispose()
 
 
 app = FastAPI(
@@ -28,6 +52,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 app.include_router(health.router)
@@ -4,5 +4,9 @@ from app.models.resume import Resume
 from app.models.email_log import EmailLog
 from app.models.followup import Followup
 from app.models.settings import Settings
+from app.models.metrics_rollup import MetricsRollup
+from app.models.job_duplicate import JobDuplicate, JobLshBand
+from app.models.ai_response_cache import AIResponseCache
+from app.models.ai_task import AITask
 
-__all__ = ["User", "Job", "Resume", "EmailLog", "Followup", "Settings"]
+__all__ = ["User", "Job", "Resume", "EmailLog", "Followup", "Settings", "MetricsRollup", "JobDuplicate", "JobLshBand", "AIResponseCache", "AITask"]
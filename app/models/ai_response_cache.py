@@ -0,0 +1,21 @@
+from typing import Optional
+from datetime import datetime
+from sqlmodel import SQLModel, Field
+
+
+class AIResponseCache(SQLModel, table=True):
+    __tablename__ = "ai_response_cache"
+    
+    id: Optional[int] = Field(default=None, primary_key=True)
+    
+    cache_key: str = Field(max_length=64, unique=True, index=True)
+    content_type: str = Field(max_length=50, index=True)
+    model: str = Field(max_length=100)
+    template_version: str = Field(max_length=20)
+    
+    response: str = Field(max_length=10000)
+    
+    hit_count: int = Field(default=0)
+    
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    expires_at: Optional[datetime] = Field(default=None, index=True)
@@ -0,0 +1,42 @@
+from typing import Optional, Dict, Any
+from datetime import datetime
+from sqlalchemy import Index, text
+from sqlmodel import SQLModel, Field, Column, JSON
+
+
+class AITask(SQLModel, table=True):
+    __tablename__ = "ai_tasks"
+    
+    id: Optional[int] = Field(default=None, primary_key=True)
+    user_id: int = Field(default=1, index=True)
+    
+    task_type: str = Field(max_length=50)
+    payload: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSON))
+    dedup_key: str = Field(max_length=64)
+    
+    status: str = Field(default="queued", max_length=20)
+    attempts: int = Field(default=0)
+    max_attempts: int = Field(default=3)
+    run_after: datetime = Field(default_factory=datetime.utcnow)
+    
+    result: Optional[Dict[str, Any]] = Field(default=None, sa_column=Column(JSON))
+    error: Optional[str] = Field(default=None, max_length=1000)
+    
+    locked_by: Optional[str] = Field(default=None, max_length=100)
+    locked_at: Optional[datetime] = Field(default=None)
+    
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    started_at: Optional[datetime] = Field(default=None)
+    finished_at: Optional[datetime] = Field(default=None)
+
+
+ACTIVE_TASK_CONDITION = text("status IN ('queued', 'running')")
+
+Index(
+    "ux_ai_tasks_active_dedup_key",
+    AITask.dedup_key,
+    unique=True,
+    postgresql_where=ACTIVE_TASK_CONDITION,
+    sqlite_where=ACTIVE_TASK_CONDITION
+)
+Index("ix_ai_tasks_status_run_after", AITask.status, AITask.run_after, AITask.id)
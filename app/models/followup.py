@@ -1,10 +1,13 @@
 from typing import Optional
 from datetime import datetime
-from sqlmodel import SQLModel, Field
+from sqlmodel import SQLModel, Field, Index
 
 
 class Followup(SQLModel, table=True):
     __tablename__ = "followups"
+    __table_args__ = (
+        Index("ix_followups_scheduled_date_id", "scheduled_date", "id"),
+    )
     
     id: Optional[int] = Field(default=None, primary_key=True)
     job_id: int = Field(foreign_key="jobs.id")
@@ -1,10 +1,14 @@
 from typing import Optional, Dict, Any, List
 from datetime import datetime
+from sqlalchemy import Index, func, literal_column
 from sqlmodel import SQLModel, Field, Column, JSON
 
 
 class Job(SQLModel, table=True):
     __tablename__ = "jobs"
+    __table_args__ = (
+        Index("ix_jobs_created_at_id", "created_at", "id"),
+    )
     
     id: Optional[int] = Field(default=None, primary_key=True)
     
@@ -17,6 +21,10 @@ class Job(SQLModel, table=True):
     url: Optional[str] = Field(default=None, max_length=1000)
     source: str = Field(default="manual", max_length=100)
     
+    canonical_url: Optional[str] = Field(default=None, max_length=1000, unique=True, index=True)
+    content_hash: Optional[str] = Field(default=None, max_length=64, unique=True, index=True)
+    minhash: Optional[List[int]] = Field(default=None, sa_column=Column(JSON))
+    
     classification: Optional[str] = Field(default=None, max_length=100)
     
     has_visa_sponsorship: bool = Field(default=False)
@@ -37,3 +45,6 @@ class Job(SQLModel, table=True):
     
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+Index("ix_jobs_score_id", func.coalesce(Job.score, literal_column("0")), Job.id)
@@ -0,0 +1,27 @@
+from typing import Optional
+from datetime import datetime
+from sqlmodel import SQLModel, Field
+
+
+class JobDuplicate(SQLModel, table=True):
+    __tablename__ = "job_duplicates"
+    
+    id: Optional[int] = Field(default=None, primary_key=True)
+    job_id: int = Field(foreign_key="jobs.id", index=True)
+    
+    match_type: str = Field(max_length=20)
+    similarity: float = Field(default=1.0)
+    
+    title: str = Field(max_length=500)
+    company: str = Field(max_length=300)
+    url: Optional[str] = Field(default=None, max_length=1000)
+    source: str = Field(default="manual", max_length=100)
+    
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class JobLshBand(SQLModel, table=True):
+    __tablename__ = "job_lsh_bands"
+    
+    band_key: str = Field(max_length=40, primary_key=True)
+    job_id: int = Field(foreign_key="jobs.id", primary_key=True, index=True)
@@ -0,0 +1,23 @@
+from typing import Optional
+from sqlmodel import SQLModel, Field, UniqueConstraint
+
+
+class MetricsRollup(SQLModel, table=True):
+    __tablename__ = "metrics_rollups"
+    __table_args__ = (
+        UniqueConstraint(
+            "country", "classification", "template_type", "application_status", "applied", "day",
+            name="uq_metrics_rollups_key"
+        ),
+    )
+    
+    id: Optional[int] = Field(default=None, primary_key=True)
+    
+    country: str = Field(default="", max_length=100)
+    classification: str = Field(default="", max_length=100)
+    template_type: str = Field(default="", max_length=50)
+    application_status: str = Field(default="pending", max_length=50)
+    applied: bool = Field(default=False)
+    day: str = Field(default="", max_length=10)
+    
+    job_count: int = Field(default=0)
@@ -1,10 +1,13 @@
 from typing import Optional, Dict, Any, List
 from datetime import datetime
-from sqlmodel import SQLModel, Field, Column, JSON
+from sqlmodel import SQLModel, Field, Index, Column, JSON
 
 
 class Resume(SQLModel, table=True):
     __tablename__ = "resumes"
+    __table_args__ = (
+        Index("ix_resumes_created_at_id", "created_at", "id"),
+    )
     
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: Optional[int] = Field(default=1)
@@ -14,6 +17,7 @@ class Resume(SQLModel, table=True):
     template_type: str = Field(default="architect", max_length=50)
     
     file_path: Optional[str] = Field(default=None, max_length=500)
+    content_hash: Optional[str] = Field(default=None, max_length=64, index=True)
     
     content: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))
     
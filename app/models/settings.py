@@ -31,5 +31,7 @@ class Settings(SQLModel, table=True):
     
     preferences: Optional[Dict[str, Any]] = Field(default=None, sa_column=Column(JSON))
     
+    score_profile: Optional[str] = Field(default=None, max_length=64)
+    
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
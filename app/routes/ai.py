@@ -1,88 +1,250 @@
+import asyncio
+import json
+import threading
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Union
 from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session, select
-from app.db import get_session
-from app.models.settings import Settings
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.db import async_engine, get_async_session
 from app.models.job import Job
-from app.schemas.ai_schema import AIGenerateRequest, AIGenerateResponse, ManualInputRequest
-from app.utils.ai_engine import AIEngine
+from app.schemas.ai_schema import (
+    AIGenerateRequest,
+    AIGenerateResponse,
+    AIBatchGenerateRequest,
+    AIBatchGenerateResponse,
+    AITaskAccepted,
+    AITaskResponse,
+    ManualInputRequest
+)
+from app.schemas.resume_schema import ResumeCreate
+from app.config import settings as app_settings
+from app.models.ai_task import AITask
+from app.utils.ai_engine import AIEngine, TEMPLATE_VERSIONS
+from app.utils.ai_cache import cache_stats, invalidate_cached_responses
+from app.utils.ai_metrics import ai_metrics, ai_metrics_prometheus
+from app.utils.ai_batch import run_batch
+from app.utils.circuit_breaker import openai_breaker
+from app.utils.ai_generation import failed_response, generate_content, load_ai_settings
+from app.utils.ai_tasks import FINISHED_STATUSES, cancel_task, count_active_tasks, enqueue_task, find_active_task, task_dedup_key
+from app.utils.concurrency import run_blocking
 from app.utils.logger import logger
 
 router = APIRouter(prefix="/api/ai", tags=["ai"])
 
 
+def _sse_event(event: str, data: Dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def _sse_response(events: Union[Iterator[str], AsyncIterator[str]]) -> StreamingResponse:
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+async def _stream_generation(api_key: str, request: AIGenerateRequest, job: Optional[Job]) -> AsyncIterator[str]:
+    loop = asyncio.get_running_loop()
+    tokens: asyncio.Queue = asyncio.Queue()
+    disconnected = threading.Event()
+    
+    def on_token(token: str) -> None:
+        if disconnected.is_set():
+            raise ConnectionAbortedError("Client disconnected during streaming")
+        loop.call_soon_threadsafe(tokens.put_nowait, token)
+    
+    def on_finished(task: asyncio.Future) -> None:
+        if not task.cancelled():
+            task.exception()
+        tokens.put_nowait(None)
+    
+    ai_engine = AIEngine(api_key=api_key, bypass_cache=request.bypass_cache, raise_errors=True, on_token=on_token)
+    task = asyncio.ensure_future(generate_content(ai_engine, request, job))
+    task.add_done_callback(on_finished)
+    
+    try:
+        while True:
+            token = await tokens.get()
+            if token is None:
+                break
+            yield _sse_event("token", {"content": token})
+        
+        try:
+            response = task.result()
+        except Exception as e:
+            logger.error(f"Streaming AI generation failed: {str(e)}")
+            response = failed_response(request.content_type, f"AI generation error: {str(e)}", request.job_id)
+        
+        yield _sse_event("done", response.dict())
+    finally:
+        disconnected.set()
+
+
 @router.post("/generate", response_model=AIGenerateResponse)
 async def generate_ai_content(
     request: AIGenerateRequest,
-    session: Session = Depends(get_session)
+    stream: bool = False,
+    session: AsyncSession = Depends(get_async_session)
 ):
-    statement = select(Settings).where(Settings.user_id == 1)
-    settings = session.exec(statement).first()
-    
-    if not settings or not settings.ai_mode_enabled:
-        return AIGenerateResponse(
-            success=False,
-            content="",
-            content_type=request.content_type,
-            is_ai_generated=False,
-            message="AI mode is not enabled. Please enable it in settings and provide an API key."
-        )
-    
-    ai_engine = AIEngine(api_key=settings.openai_api_key)
-    
-    if not ai_engine.is_available():
-        return AIGenerateResponse(
-            success=False,
-            content="",
-            content_type=request.content_type,
-            is_ai_generated=False,
-            message="AI engine not available. Please check your API key."
-        )
-    
-    job_description = ""
-    job_title = "Cloud Engineer"
-    company = "Company"
-    
-    if request.job_id:
-        job = session.get(Job, request.job_id)
-        if job:
-            job_description = job.description
-            job_title = job.title
-            company = job.company
-    
-    content = ""
-    
-    if request.content_type == "resume_bullets":
-        template_type = request.context or "architect"
-        content = ai_engine.generate_resume_bullets(job_description, template_type, "")
-    
-    elif request.content_type == "summary":
-        content = ai_engine.generate_summary(job_description or request.context or "")
-    
-    elif request.content_type == "recruiter_message":
-        tone = request.tone or "professional"
-        content = ai_engine.generate_recruiter_message(job_title, company, tone)
-    
-    elif request.content_type == "followup_message":
-        content = ai_engine.generate_followup_message(job_title, company, 7)
+    settings, error = await load_ai_settings(session)
+    if error:
+        response = failed_response(request.content_type, error)
+        if stream:
+            return _sse_response(iter([_sse_event("done", response.dict())]))
+        return response
     
-    else:
-        return AIGenerateResponse(
-            success=False,
-            content="",
-            content_type=request.content_type,
-            is_ai_generated=False,
-            message=f"Unknown content type: {request.content_type}"
-        )
-    
-    return AIGenerateResponse(
-        success=True,
-        content=content,
-        content_type=request.content_type,
-        is_ai_generated=True,
-        message="Content generated successfully"
+    job = await session.get(Job, request.job_id) if request.job_id else None
+    
+    if stream:
+        return _sse_response(_stream_generation(settings.openai_api_key, request, job))
+    
+    ai_engine = AIEngine(api_key=settings.openai_api_key, bypass_cache=request.bypass_cache)
+    return await generate_content(ai_engine, request, job)
+
+
+@router.post("/generate/batch")
+async def generate_ai_content_batch(
+    request: AIBatchGenerateRequest,
+    stream: bool = False,
+    session: AsyncSession = Depends(get_async_session)
+):
+    settings, error = await load_ai_settings(session)
+    
+    job_ids = {item.job_id for item in request.items if item.job_id}
+    jobs = {}
+    if job_ids and not error:
+        jobs = {job.id: job for job in (await session.exec(select(Job).where(Job.id.in_(job_ids)))).all()}
+    
+    async def generate_item(item: AIGenerateRequest) -> AIGenerateResponse:
+        ai_engine = AIEngine(api_key=settings.openai_api_key, bypass_cache=item.bypass_cache, raise_errors=True)
+        return await generate_content(ai_engine, item, jobs.get(item.job_id))
+    
+    async def results():
+        if error:
+            for index, item in enumerate(request.items):
+                yield index, failed_response(item.content_type, error, item.job_id)
+            return
+        
+        async for indexes, response, exception in run_batch(
+            request.items,
+            key=lambda item: item.json(),
+            call=generate_item,
+            concurrency=request.concurrency
+        ):
+            for index in indexes:
+                item = request.items[index]
+                if exception:
+                    logger.error(f"Batch AI generation failed for item {index}: {str(exception)}")
+                    yield index, failed_response(item.content_type, f"AI generation error: {str(exception)}", item.job_id)
+                else:
+                    yield index, response
+    
+    if stream:
+        async def result_lines():
+            succeeded = 0
+            failed = 0
+            async for index, response in results():
+                if response.success:
+                    succeeded += 1
+                else:
+                    failed += 1
+                yield json.dumps({"index": index, **response.dict()}) + "\n"
+            yield json.dumps({"done": True, "succeeded": succeeded, "failed": failed}) + "\n"
+        
+        return StreamingResponse(result_lines(), media_type="application/x-ndjson")
+    
+    responses: List[Optional[AIGenerateResponse]] = [None] * len(request.items)
+    async for index, response in results():
+        responses[index] = response
+    
+    return AIBatchGenerateResponse(
+        results=responses,
+        succeeded=sum(1 for response in responses if response.success),
+        failed=sum(1 for response in responses if not response.success)
     )
 
 
+async def _submit_task(session: AsyncSession, task_type: str, payload: Dict[str, Any]) -> AITaskAccepted:
+    user_id = 1
+    existing = await find_active_task(session, task_dedup_key(user_id, task_type, payload))
+    
+    if not existing and await count_active_tasks(session, user_id) >= app_settings.ai_task_max_active_per_user:
+        raise HTTPException(status_code=429, detail="Too many AI tasks in progress, try again once some have finished")
+    
+    if existing:
+        task, deduplicated = existing, True
+    else:
+        task, deduplicated = await enqueue_task(session, user_id, task_type, payload)
+    
+    return AITaskAccepted(task_id=task.id, task_type=task.task_type, status=task.status, deduplicated=deduplicated)
+
+
+@router.post("/tasks/generate", response_model=AITaskAccepted, status_code=202)
+async def submit_generate_task(
+    request: AIGenerateRequest,
+    session: AsyncSession = Depends(get_async_session)
+):
+    return await _submit_task(session, "generate", request.dict())
+
+
+@router.post("/tasks/resume", response_model=AITaskAccepted, status_code=202)
+async def submit_resume_task(
+    resume_data: ResumeCreate,
+    session: AsyncSession = Depends(get_async_session)
+):
+    return await _submit_task(session, "resume", resume_data.dict())
+
+
+@router.get("/tasks/{task_id}", response_model=AITaskResponse)
+async def get_task(task_id: int, session: AsyncSession = Depends(get_async_session)):
+    task = await session.get(AITask, task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    return task
+
+
+@router.get("/tasks/{task_id}/events")
+async def stream_task_events(task_id: int, session: AsyncSession = Depends(get_async_session)):
+    if not await session.get(AITask, task_id):
+        raise HTTPException(status_code=404, detail="Task not found")
+    
+    async def events():
+        last_status = None
+        while True:
+            async with AsyncSession(async_engine) as poll_session:
+                task = await poll_session.get(AITask, task_id)
+            
+            if task is None:
+                yield _sse_event("done", {"id": task_id, "status": "deleted"})
+                return
+            
+            if task.status != last_status:
+                last_status = task.status
+                data = AITaskResponse.model_validate(task).model_dump(mode="json")
+                if task.status in FINISHED_STATUSES:
+                    yield _sse_event("done", data)
+                    return
+                yield _sse_event("status", data)
+            
+            await asyncio.sleep(app_settings.ai_task_poll_interval)
+    
+    return _sse_response(events())
+
+
+@router.delete("/tasks/{task_id}")
+async def delete_task(task_id: int, session: AsyncSession = Depends(get_async_session)):
+    task = await session.get(AITask, task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    
+    if not await cancel_task(session, task_id):
+        raise HTTPException(status_code=409, detail=f"Task is already {task.status} and can no longer be cancelled")
+    
+    return {"message": "Task cancelled", "task_id": task_id}
+
+
 @router.post("/manual-input")
 async def submit_manual_input(request: ManualInputRequest):
     return {
@@ -91,3 +253,31 @@ async def submit_manual_input(request: ManualInputRequest):
         "message": "Manual content received and stored successfully",
         "content_length": len(request.content)
     }
+
+
+@router.get("/cache")
+async def get_ai_cache_stats():
+    return await run_blocking("db", cache_stats)
+
+
+@router.delete("/cache")
+async def invalidate_ai_cache(content_type: Optional[str] = None):
+    if content_type and content_type not in TEMPLATE_VERSIONS:
+        raise HTTPException(status_code=400, detail=f"Unknown content type: {content_type}")
+    
+    removed = await run_blocking("db", invalidate_cached_responses, content_type)
+    
+    return {
+        "message": f"Invalidated {removed} cached responses",
+        "removed": removed
+    }
+
+
+@router.get("/metrics")
+async def get_ai_metrics(format: str = "json"):
+    if format == "prometheus":
+        return PlainTextResponse(ai_metrics_prometheus(), media_type="text/plain; version=0.0.4")
+    if format != "json":
+        raise HTTPException(status_code=400, detail=f"Unknown metrics format: {format}")
+    
+    return {**ai_metrics(), "circuit_breaker": openai_breaker.snapshot()}
@@ -1,14 +1,18 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from datetime import datetime
-from app.db import get_session
+from app.db import get_async_session
 from app.models.job import Job
 from app.models.resume import Resume
 from app.models.email_log import EmailLog
 from app.models.settings import Settings
 from app.schemas.apply_schema import ApplicationRequest, ApplicationResponse
+from app.utils.attachment_cache import resume_attachment
 from app.utils.email_sender import EmailSender
 from app.utils.message_builder import build_application_message
+from app.utils.metrics_rollup import record_job_change, rollup_key, APPLIED_TEMPLATE_KEY
+from app.utils.concurrency import run_blocking
 from app.utils.logger import logger
 
 router = APIRouter(prefix="/api/apply", tags=["apply"])
@@ -18,20 +22,20 @@ router = APIRouter(prefix="/api/apply", tags=["apply"])
 async def apply_to_job(
     job_id: int,
     request: ApplicationRequest,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_async_session)
 ):
-    job = session.get(Job, job_id)
+    job = await session.get(Job, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     
     if job.applied:
         raise HTTPException(status_code=400, detail="Already applied to this job")
     
-    settings = session.exec(select(Settings).where(Settings.user_id == 1)).first()
+    settings = (await session.exec(select(Settings).where(Settings.user_id == 1))).first()
     
     resume = None
     if request.resume_id:
-        resume = session.get(Resume, request.resume_id)
+        resume = await session.get(Resume, request.resume_id)
         if not resume:
             raise HTTPException(status_code=404, detail="Resume not found")
     
@@ -40,7 +44,9 @@ async def apply_to_job(
     use_ai = request.use_ai_message and settings and settings.ai_mode_enabled
     tone = settings.message_tone if settings else "professional"
     
-    message = build_application_message(
+    built = await run_blocking(
+        "ai",
+        build_application_message,
         job_title=job.title,
         company=job.company,
         custom_message=request.custom_message,
@@ -48,6 +54,7 @@ async def apply_to_job(
         tone=tone,
         ai_api_key=settings.openai_api_key if settings else None
     )
+    message = built["message"]
     
     subject = f"Application for {job.title} position"
     
@@ -55,12 +62,15 @@ async def apply_to_job(
     email_sender = EmailSender(email_identities)
     
     attachment_path = resume.file_path if resume else None
+    attachment = await resume_attachment(session, resume) if resume else None
     
-    result = email_sender.send_email(
+    result = await run_blocking(
+        "smtp",
+        email_sender.send_email,
         recipient=recipient,
         subject=subject,
         body=message,
-        attachment_path=attachment_path
+        attachment=attachment
     )
     
     email_log = EmailLog(
@@ -71,8 +81,9 @@ async def apply_to_job(
         subject=subject,
         body=message,
         email_type="application",
-        has_attachment=attachment_path is not None,
+        has_attachment=attachment is not None,
         attachment_path=attachment_path,
+        email_metadata={"message_source": built["source"], "ai_fallback_reason": built["fallback_reason"]},
         status="sent" if result["success"] else "failed",
         error_message=result.get("error"),
         sent_at=datetime.utcnow() if result["success"] else None
@@ -81,24 +92,30 @@ async def apply_to_job(
     session.add(email_log)
     
     if result["success"]:
+        previous_key = rollup_key(job)
+        
         job.applied = True
         job.application_date = datetime.utcnow()
         job.application_status = "applied"
         
         if resume:
             resume.times_used += 1
+            job.job_metadata = {**(job.job_metadata or {}), APPLIED_TEMPLATE_KEY: resume.template_type}
         
+        await session.run_sync(record_job_change, previous_key, rollup_key(job))
         session.add(job)
         if resume:
             session.add(resume)
     
-    session.commit()
-    session.refresh(email_log)
+    await session.commit()
+    await session.refresh(email_log)
     
     return ApplicationResponse(
         success=result["success"],
         job_id=job.id,
         email_log_id=email_log.id,
         resume_path=attachment_path,
-        message="Application submitted successfully" if result["success"] else f"Application failed: {result.get('error')}"
+        message="Application submitted successfully" if result["success"] else f"Application failed: {result.get('error')}",
+        message_source=built["source"],
+        ai_fallback_used=built["fallback_used"]
     )
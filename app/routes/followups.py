@@ -1,14 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session, select
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import List, Optional
 from datetime import datetime, timedelta
-from app.db import get_session
+from app.db import get_async_session
 from app.models.followup import Followup
 from app.models.job import Job
 from app.models.email_log import EmailLog
 from app.models.settings import Settings
 from app.utils.email_sender import EmailSender
 from app.utils.message_builder import build_followup_message
+from app.utils.concurrency import run_blocking
+from app.utils.pagination import NEXT_CURSOR_HEADER, keyset_query, split_page
 from app.utils.logger import logger
 
 router = APIRouter(prefix="/api/followups", tags=["followups"])
@@ -16,15 +19,29 @@ router = APIRouter(prefix="/api/followups", tags=["followups"])
 
 @router.get("", response_model=List[Followup])
 async def list_followups(
+    response: Response,
     pending_only: bool = False,
-    session: Session = Depends(get_session)
+    skip: int = Query(default=0, ge=0),
+    limit: int = Query(default=50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    session: AsyncSession = Depends(get_async_session)
 ):
-    statement = select(Followup).order_by(Followup.scheduled_date)
+    statement = select(Followup)
     
     if pending_only:
         statement = statement.where(Followup.is_sent == False)
     
-    followups = session.exec(statement).all()
+    try:
+        statement = keyset_query(
+            statement, "followups", [Followup.scheduled_date, Followup.id], limit, cursor, skip
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    followups, next_cursor = split_page((await session.execute(statement)).all(), "followups", limit)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    
     return followups
 
 
@@ -32,9 +49,9 @@ async def list_followups(
 async def schedule_followup(
     job_id: int,
     days_delay: int = 7,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_async_session)
 ):
-    job = session.get(Job, job_id)
+    job = await session.get(Job, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     
@@ -51,8 +68,8 @@ async def schedule_followup(
     )
     
     session.add(followup)
-    session.commit()
-    session.refresh(followup)
+    await session.commit()
+    await session.refresh(followup)
     
     return followup
 
@@ -60,26 +77,28 @@ async def schedule_followup(
 @router.post("/{followup_id}/send")
 async def send_followup(
     followup_id: int,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_async_session)
 ):
-    followup = session.get(Followup, followup_id)
+    followup = await session.get(Followup, followup_id)
     if not followup:
         raise HTTPException(status_code=404, detail="Follow-up not found")
     
     if followup.is_sent:
         raise HTTPException(status_code=400, detail="Follow-up already sent")
     
-    job = session.get(Job, followup.job_id)
+    job = await session.get(Job, followup.job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    settings = session.exec(select(Settings).where(Settings.user_id == 1)).first()
+    settings = (await session.exec(select(Settings).where(Settings.user_id == 1))).first()
     
     days_since = (datetime.utcnow() - job.application_date).days if job.application_date else 7
     
     use_ai = settings and settings.ai_mode_enabled
     
-    message = build_followup_message(
+    built = await run_blocking(
+        "ai",
+        build_followup_message,
         job_title=job.title,
         company=job.company,
         days_since=days_since,
@@ -87,6 +106,7 @@ async def send_followup(
         use_ai=use_ai,
         ai_api_key=settings.openai_api_key if settings else None
     )
+    message = built["message"]
     
     followup.message = message
     
@@ -96,7 +116,9 @@ async def send_followup(
     subject = f"Following up on {job.title} application"
     recipient = "hr@example.com"
     
-    result = email_sender.send_email(
+    result = await run_blocking(
+        "smtp",
+        email_sender.send_email,
         recipient=recipient,
         subject=subject,
         body=message
@@ -109,6 +131,7 @@ async def send_followup(
         subject=subject,
         body=message,
         email_type="followup",
+        email_metadata={"message_source": built["source"], "ai_fallback_reason": built["fallback_reason"]},
         status="sent" if result["success"] else "failed",
         error_message=result.get("error"),
         sent_at=datetime.utcnow() if result["success"] else None
@@ -125,25 +148,27 @@ async def send_followup(
         followup.status = "failed"
     
     session.add(followup)
-    session.commit()
+    await session.commit()
     
     return {
         "success": result["success"],
         "followup_id": followup.id,
-        "message": "Follow-up sent successfully" if result["success"] else f"Failed: {result.get('error')}"
+        "message": "Follow-up sent successfully" if result["success"] else f"Failed: {result.get('error')}",
+        "message_source": built["source"],
+        "ai_fallback_used": built["fallback_used"]
     }
 
 
 @router.delete("/{followup_id}")
 async def cancel_followup(
     followup_id: int,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_async_session)
 ):
-    followup = session.get(Followup, followup_id)
+    followup = await session.get(Followup, followup_id)
     if not followup:
         raise HTTPException(status_code=404, detail="Follow-up not found")
     
-    session.delete(followup)
-    session.commit()
+    await session.delete(followup)
+    await session.commit()
     
     return {"message": "Follow-up cancelled successfully"}
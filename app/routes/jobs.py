@@ -1,45 +1,71 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
+import json
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Query, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session, select
-from typing import List, Optional
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import BinaryIO, List, Optional
 from datetime import datetime
-from app.db import get_session
+from app.db import get_async_session, engine, run_in_session
 from app.models.job import Job
 from app.models.user import User
-from app.schemas.job_schema import JobCreate, JobUpdate, JobResponse, JobSearch
-from app.utils.classification import classify_job, is_excluded_role
-from app.utils.visa_detector import detect_visa_sponsorship
+from app.schemas.job_schema import JobCreate, JobUpdate, JobResponse, JobSearch, BulkUrlImport
+from app.utils.classification import analyze_job
 from app.utils.scoring import calculate_job_score
-from app.utils.parser import parse_csv_jobs, extract_job_from_text
-from app.utils.scraper import scrape_job_from_url
+from app.utils.parser import CsvParseError, iter_csv_jobs, extract_job_from_text, validate_csv_encoding
+from app.utils.job_importer import import_csv_batches, build_job_row, score_job_rows, ingest_job
+from app.utils.batch_scoring import rescore_jobs_if_profile_changed
+from app.utils.fulltext import build_job_search
+from app.utils.metrics_rollup import record_job_change, rollup_key, compute_status_overview
+from app.utils.dedup import dedup_keys, refresh_job_dedup, remove_job_dedup_entries
+from app.utils.pagination import NEXT_CURSOR_HEADER, keyset_query, split_page
+from app.utils.scraper import scrape_job_from_url, scrape_jobs_concurrently
+from app.utils.concurrency import run_blocking, iterate_blocking
 from app.utils.logger import logger
 
 router = APIRouter(prefix="/api/jobs", tags=["jobs"])
 
+CSV_IMPORT_BATCH_SIZE = 500
+
+DEDUP_FIELDS = {"title", "company", "location", "country", "description", "url"}
+
 
 @router.get("", response_model=List[JobResponse])
 async def list_jobs(
-    skip: int = 0,
-    limit: int = 50,
-    session: Session = Depends(get_session)
+    response: Response,
+    skip: int = Query(default=0, ge=0),
+    limit: int = Query(default=50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    session: AsyncSession = Depends(get_async_session)
 ):
-    statement = select(Job).offset(skip).limit(limit).order_by(Job.created_at.desc())
-    jobs = session.exec(statement).all()
+    try:
+        statement = keyset_query(
+            select(Job), "jobs", [Job.created_at, Job.id], limit, cursor, skip, descending=True
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    jobs, next_cursor = split_page((await session.execute(statement)).all(), "jobs", limit)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    
     return jobs
 
 
 @router.post("", response_model=JobResponse)
 async def create_job(
     job_data: JobCreate,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_async_session)
 ):
-    user = session.exec(select(User).where(User.id == 1)).first()
+    user = (await session.exec(select(User).where(User.id == 1))).first()
     
-    classification = classify_job(job_data.title, job_data.description)
+    analysis = analyze_job(job_data.title, job_data.description)
+    classification = analysis["classification"]
     
-    if is_excluded_role(job_data.title, job_data.description):
+    if analysis["is_excluded"]:
         raise HTTPException(status_code=400, detail="This job role is excluded based on your preferences")
     
-    has_visa, visa_keywords = detect_visa_sponsorship(job_data.description)
+    has_visa, visa_keywords = analysis["has_visa"], analysis["visa_keywords"]
     
     score_data = {"score": 50, "breakdown": {}}
     if user:
@@ -64,22 +90,25 @@ async def create_job(
         has_visa_sponsorship=has_visa,
         visa_keywords=visa_keywords,
         score=score_data["score"],
-        score_breakdown=score_data["breakdown"]
+        score_breakdown=score_data["breakdown"],
+        **dedup_keys(job_data.title, job_data.company, job_data.location, job_data.country, job_data.description, job_data.url)
     )
     
-    session.add(job)
-    session.commit()
-    session.refresh(job)
+    job, _ = await session.run_sync(ingest_job, job)
+    await session.commit()
+    await session.refresh(job)
     
     return job
 
 
 @router.get("/search", response_model=List[JobResponse])
 async def search_jobs(
+    response: Response,
     search: JobSearch = Depends(),
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_async_session)
 ):
-    statement = select(Job)
+    dialect = session.bind.dialect.name
+    statement, ranking = build_job_search(search.query, dialect)
     
     if search.classification:
         statement = statement.where(Job.classification == search.classification)
@@ -96,20 +125,23 @@ async def search_jobs(
     if search.applied is not None:
         statement = statement.where(Job.applied == search.applied)
     
-    if search.query:
-        statement = statement.where(
-            Job.title.contains(search.query) | Job.description.contains(search.query)
+    try:
+        statement = keyset_query(
+            statement, "jobs/search", [ranking, Job.id], search.limit, search.cursor, search.offset, descending=True
         )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
-    statement = statement.offset(search.offset).limit(search.limit).order_by(Job.score.desc())
+    jobs, next_cursor = split_page((await session.execute(statement)).all(), "jobs/search", search.limit)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
     
-    jobs = session.exec(statement).all()
     return jobs
 
 
 @router.get("/{job_id}", response_model=JobResponse)
-async def get_job(job_id: int, session: Session = Depends(get_session)):
-    job = session.get(Job, job_id)
+async def get_job(job_id: int, session: AsyncSession = Depends(get_async_session)):
+    job = await session.get(Job, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     return job
@@ -119,12 +151,14 @@ async def get_job(job_id: int, session: Session = Depends(get_session)):
 async def update_job(
     job_id: int,
     job_update: JobUpdate,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_async_session)
 ):
-    job = session.get(Job, job_id)
+    job = await session.get(Job, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     
+    previous_key = rollup_key(job)
+    
     update_data = job_update.dict(exclude_unset=True)
     for key, value in update_data.items():
         setattr(job, key, value)
@@ -132,88 +166,101 @@ async def update_job(
     job.updated_at = datetime.utcnow()
     
     session.add(job)
-    session.commit()
-    session.refresh(job)
+    
+    try:
+        if DEDUP_FIELDS.intersection(update_data):
+            await session.run_sync(refresh_job_dedup, job)
+        await session.run_sync(record_job_change, previous_key, rollup_key(job))
+        await session.commit()
+    except IntegrityError:
+        await session.rollback()
+        raise HTTPException(status_code=409, detail="Another job already has this URL or content")
+    
+    await session.refresh(job)
     
     return job
 
 
 @router.delete("/{job_id}")
-async def delete_job(job_id: int, session: Session = Depends(get_session)):
-    job = session.get(Job, job_id)
+async def delete_job(job_id: int, session: AsyncSession = Depends(get_async_session)):
+    job = await session.get(Job, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    session.delete(job)
-    session.commit()
+    await session.run_sync(record_job_change, rollup_key(job), None)
+    await session.run_sync(remove_job_dedup_entries, job.id)
+    await session.delete(job)
+    await session.commit()
     
     return {"message": "Job deleted successfully"}
 
 
+def _import_csv_batches(binary_file: BinaryIO, batch_size: int):
+    with Session(engine) as session:
+        user = session.exec(select(User).where(User.id == 1)).first()
+        yield from import_csv_batches(session, iter_csv_jobs(binary_file), batch_size, user)
+
+
 @router.post("/import/csv")
 async def import_jobs_from_csv(
     file: UploadFile = File(...),
-    session: Session = Depends(get_session)
+    stream: bool = False,
+    batch_size: int = Query(default=CSV_IMPORT_BATCH_SIZE, ge=1, le=5000)
 ):
+    await file.seek(0)
     try:
-        content = await file.read()
-        csv_text = content.decode('utf-8')
-        
-        jobs_data = parse_csv_jobs(csv_text)
-        
-        created_jobs = []
-        for job_data in jobs_data:
-            job_create = JobCreate(**job_data)
-            
-            classification = classify_job(job_create.title, job_create.description)
-            has_visa, visa_keywords = detect_visa_sponsorship(job_create.description)
-            
-            job = Job(
-                **job_create.dict(),
-                classification=classification,
-                has_visa_sponsorship=has_visa,
-                visa_keywords=visa_keywords,
-                score=50
-            )
-            
-            session.add(job)
-            created_jobs.append(job)
-        
-        session.commit()
+        await run_blocking("parse", validate_csv_encoding, file.file)
+    except CsvParseError as e:
+        raise HTTPException(status_code=400, detail=f"Import failed: {str(e)}")
+    
+    batches = _import_csv_batches(file.file, batch_size)
+    
+    if stream:
+        async def progress_lines():
+            async for batch in iterate_blocking("db", batches):
+                yield json.dumps(batch) + "\n"
         
-        return {
-            "message": f"Successfully imported {len(created_jobs)} jobs",
-            "count": len(created_jobs)
-        }
+        return StreamingResponse(progress_lines(), media_type="application/x-ndjson")
     
+    try:
+        batch_reports = await run_blocking("db", list, batches)
     except Exception as e:
         logger.error(f"CSV import failed: {str(e)}")
         raise HTTPException(status_code=400, detail=f"Import failed: {str(e)}")
+    
+    imported = batch_reports[-1]["total_imported"] if batch_reports else 0
+    errors = [error for batch in batch_reports for error in batch["errors"]]
+    duplicates = [duplicate for batch in batch_reports for duplicate in batch["duplicate_rows"]]
+    
+    return {
+        "message": f"Successfully imported {imported} jobs",
+        "count": imported,
+        "failed": len(errors),
+        "duplicates": duplicates,
+        "batches": [
+            {k: v for k, v in batch.items() if k not in ("errors", "duplicate_rows")}
+            for batch in batch_reports
+        ],
+        "errors": errors
+    }
 
 
 @router.post("/import/text")
 async def import_job_from_text(
     text: str,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_async_session)
 ):
     try:
         job_data = extract_job_from_text(text)
         job_create = JobCreate(**job_data)
         
-        classification = classify_job(job_create.title, job_create.description)
-        has_visa, visa_keywords = detect_visa_sponsorship(job_create.description)
-        
-        job = Job(
-            **job_create.dict(),
-            classification=classification,
-            has_visa_sponsorship=has_visa,
-            visa_keywords=visa_keywords,
-            score=50
-        )
+        user = (await session.exec(select(User).where(User.id == 1))).first()
         
-        session.add(job)
-        session.commit()
-        session.refresh(job)
+        job_row = build_job_row(job_create)
+        score_job_rows([job_row], user)
+        job, _ = await session.run_sync(ingest_job, Job(**job_row))
+        await session.commit()
+        await session.refresh(job)
         
         return job
     
@@ -225,50 +272,83 @@ async def import_job_from_text(
 @router.post("/import/url")
 async def import_job_from_url(
     url: str,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_async_session)
 ):
-    job_data = scrape_job_from_url(url)
+    job_data = await scrape_job_from_url(url)
     
     if not job_data:
         raise HTTPException(status_code=400, detail="Failed to scrape job from URL")
     
     job_create = JobCreate(**job_data)
     
-    classification = classify_job(job_create.title, job_create.description)
-    has_visa, visa_keywords = detect_visa_sponsorship(job_create.description)
+    user = (await session.exec(select(User).where(User.id == 1))).first()
     
-    job = Job(
-        **job_create.dict(),
-        classification=classification,
-        has_visa_sponsorship=has_visa,
-        visa_keywords=visa_keywords,
-        score=50
-    )
-    
-    session.add(job)
-    session.commit()
-    session.refresh(job)
+    job_row = build_job_row(job_create)
+    score_job_rows([job_row], user)
+    job, _ = await session.run_sync(ingest_job, Job(**job_row))
+    await session.commit()
+    await session.refresh(job)
     
     return job
 
 
-@router.get("/status/overview")
-async def get_status_overview(session: Session = Depends(get_session)):
-    total_jobs = session.exec(select(Job)).all()
+@router.post("/import/urls")
+async def import_jobs_from_urls(
+    request: BulkUrlImport,
+    session: AsyncSession = Depends(get_async_session)
+):
+    user = (await session.exec(select(User).where(User.id == 1))).first()
     
-    total_count = len(total_jobs)
-    applied_count = len([j for j in total_jobs if j.applied])
-    pending_count = total_count - applied_count
+    async def result_lines():
+        imported = 0
+        failed = 0
+        duplicates = 0
+        
+        async for result in scrape_jobs_concurrently(
+            request.urls,
+            per_host_limit=request.per_host_limit,
+            politeness_delay=request.politeness_delay,
+            timeout_budget=request.timeout_budget
+        ):
+            line = {"url": result["url"], "status": "failed", "job_id": None, "error": result["error"]}
+            
+            if result["job"]:
+                try:
+                    job_row = build_job_row(JobCreate(**result["job"]))
+                    score_job_rows([job_row], user)
+                    job, duplicate = await session.run_sync(ingest_job, Job(**job_row))
+                    await session.commit()
+                    
+                    line.update(status="duplicate" if duplicate else "imported", job_id=job.id)
+                    if duplicate:
+                        line["match"] = duplicate.match_type
+                except Exception as e:
+                    await session.rollback()
+                    logger.error(f"Failed to import job from {result['url']}: {str(e)}")
+                    line["error"] = str(e)
+            
+            if line["status"] == "imported":
+                imported += 1
+            elif line["status"] == "duplicate":
+                duplicates += 1
+            else:
+                failed += 1
+            
+            yield json.dumps(line) + "\n"
+        
+        yield json.dumps({"done": True, "imported": imported, "duplicates": duplicates, "failed": failed}) + "\n"
     
-    return {
-        "total_jobs": total_count,
-        "applied": applied_count,
-        "pending": pending_count,
-        "by_status": {
-            "pending": len([j for j in total_jobs if j.application_status == "pending"]),
-            "applied": len([j for j in total_jobs if j.application_status == "applied"]),
-            "interviewing": len([j for j in total_jobs if j.application_status == "interviewing"]),
-            "offered": len([j for j in total_jobs if j.application_status == "offered"]),
-            "rejected": len([j for j in total_jobs if j.application_status == "rejected"])
-        }
-    }
+    return StreamingResponse(result_lines(), media_type="application/x-ndjson")
+
+
+@router.post("/rescore")
+async def rescore_jobs(
+    force: bool = False,
+    chunk_size: int = Query(default=1000, ge=1, le=10000)
+):
+    return await run_blocking("db", run_in_session, rescore_jobs_if_profile_changed, force, chunk_size)
+
+
+@router.get("/status/overview")
+async def get_status_overview(session: AsyncSession = Depends(get_async_session)):
+    return await session.run_sync(compute_status_overview)
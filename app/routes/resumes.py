@@ -1,18 +1,22 @@
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import FileResponse
-from sqlmodel import Session, select
-from typing import List
+import json
+import re
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import FileResponse, StreamingResponse
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import List, Optional
 from datetime import datetime
 from pathlib import Path
-from app.db import get_session
-from app.models.resume import Resume
+from app.db import get_async_session
 from app.models.job import Job
-from app.models.user import User
-from app.models.settings import Settings
-from app.schemas.resume_schema import ResumeCreate, ResumeResponse
-from app.utils.pdf_resume import generate_resume_pdf
-from app.utils.ai_engine import AIEngine
-from app.utils.logger import logger
+from app.models.resume import Resume
+from app.schemas.resume_schema import ResumeBatchCreate, ResumeCreate, ResumeResponse
+from app.utils.resume_builder import build_resume, build_resume_batch, plan_resume_batch
+from app.utils.pdf_pool import PdfPoolBusy, get_pdf_pool
+from app.utils.resume_store import remove_unreferenced_file, resume_pdf_bytes, resume_store_stats
+from app.utils.attachment_cache import attachment_cache_stats, invalidate_resume_attachment
+from app.utils.pagination import NEXT_CURSOR_HEADER, keyset_query, split_page
+from app.utils.zip_stream import ZipStream
 
 router = APIRouter(prefix="/api/resumes", tags=["resumes"])
 
@@ -20,146 +24,140 @@ router = APIRouter(prefix="/api/resumes", tags=["resumes"])
 @router.post("/new", response_model=ResumeResponse)
 async def create_resume(
     resume_data: ResumeCreate,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_async_session)
 ):
-    user = session.exec(select(User).where(User.id == 1)).first()
-    if not user:
-        user = User(
-            name="Vishwas",
-            email="user@example.com",
-            role_preferences=["cloud engineer"]
-        )
-        session.add(user)
-        session.commit()
-        session.refresh(user)
-    
-    settings = session.exec(select(Settings).where(Settings.user_id == 1)).first()
-    
-    bullets = resume_data.bullets
-    summary = resume_data.summary or "Experienced cloud professional"
-    is_ai_generated = False
-    
-    job_title = None
-    if resume_data.job_id:
-        job = session.get(Job, resume_data.job_id)
-        if job:
-            job_title = job.title
+    try:
+        return await build_resume(session, resume_data)
+    except PdfPoolBusy as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+    except RuntimeError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/batch")
+async def create_resume_batch(
+    batch: ResumeBatchCreate,
+    session: AsyncSession = Depends(get_async_session)
+):
+    try:
+        plan = await plan_resume_batch(session, batch)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
     
-    if resume_data.use_ai and settings and settings.ai_mode_enabled:
-        ai_engine = AIEngine(api_key=settings.openai_api_key)
+    async def archive_chunks():
+        archive = ZipStream()
+        results = []
         
-        if ai_engine.is_available():
-            if not bullets or len(bullets) == 0:
-                job_desc = ""
-                if resume_data.job_id:
-                    job = session.get(Job, resume_data.job_id)
-                    if job:
-                        job_desc = job.description
-                
-                bullets_text = ai_engine.generate_resume_bullets(
-                    job_desc,
-                    resume_data.template_type,
-                    ""
-                )
-                bullets = [b.strip() for b in bullets_text.split('\n') if b.strip()]
+        async for result in build_resume_batch(session, plan):
+            results.append(result)
+            if result.resume is None:
+                continue
             
-            if not summary or summary == "Experienced cloud professional":
-                job_desc = ""
-                if resume_data.job_id:
-                    job = session.get(Job, resume_data.job_id)
-                    if job:
-                        job_desc = job.description
-                
-                summary = ai_engine.generate_summary(job_desc)
-            
-            is_ai_generated = True
-    
-    resume_count = len(session.exec(select(Resume)).all()) + 1
-    resume_name = f"Vishwas_Cloud_Resume_{resume_count:03d}.pdf"
-    
-    output_path = f"generated_resumes/{resume_name}"
-    
-    try:
-        generate_resume_pdf(
-            name=user.name,
-            email=user.email,
-            phone=user.phone,
-            linkedin_url=user.linkedin_url,
-            summary=summary,
-            bullets=bullets,
-            template_type=resume_data.template_type,
-            output_path=output_path,
-            job_title=job_title
-        )
-    except Exception as e:
-        logger.error(f"PDF generation failed: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Failed to generate PDF: {str(e)}")
+            entry_name = _batch_entry_name(result.job, batch.template_type)
+            if result.resume.file_path:
+                for chunk in archive.add_file(entry_name, result.resume.file_path):
+                    yield chunk
+            else:
+                yield archive.add_bytes(entry_name, await resume_pdf_bytes(session, result.resume))
+        
+        manifest = [
+            {
+                "job_id": result.job.id,
+                "file": _batch_entry_name(result.job, batch.template_type) if result.resume else None,
+                "resume_id": result.resume.id if result.resume else None,
+                "resume_name": result.resume.resume_name if result.resume else None,
+                "error": result.error
+            }
+            for result in sorted(results, key=lambda result: plan.jobs.index(result.job))
+        ]
+        yield archive.add_bytes("manifest.json", json.dumps(manifest, indent=2).encode())
+        yield archive.close()
     
-    resume = Resume(
-        user_id=user.id,
-        job_id=resume_data.job_id,
-        resume_name=resume_name,
-        template_type=resume_data.template_type,
-        file_path=output_path,
-        content=resume_data.content or {},
-        bullets=bullets,
-        summary=summary,
-        is_ai_generated=is_ai_generated,
-        generation_mode="ai" if is_ai_generated else "manual"
+    return StreamingResponse(
+        archive_chunks(),
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="resumes_{datetime.utcnow():%Y%m%d_%H%M%S}.zip"'}
     )
-    
-    session.add(resume)
-    session.commit()
-    session.refresh(resume)
-    
-    return resume
+
+
+def _batch_entry_name(job: Job, template_type: str) -> str:
+    slug = re.sub(r"[^A-Za-z0-9]+", "_", f"{job.company}_{job.title}").strip("_")[:80]
+    return f"{job.id:04d}_{slug}_{template_type}.pdf"
+
+
+@router.get("/render-metrics")
+async def get_render_metrics():
+    return {
+        **get_pdf_pool().stats(),
+        "file_store": resume_store_stats(),
+        "attachments": attachment_cache_stats()
+    }
 
 
 @router.get("/history", response_model=List[ResumeResponse])
 async def get_resume_history(
-    skip: int = 0,
-    limit: int = 50,
-    session: Session = Depends(get_session)
+    response: Response,
+    skip: int = Query(default=0, ge=0),
+    limit: int = Query(default=50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    session: AsyncSession = Depends(get_async_session)
 ):
-    statement = select(Resume).offset(skip).limit(limit).order_by(Resume.created_at.desc())
-    resumes = session.exec(statement).all()
+    try:
+        statement = keyset_query(
+            select(Resume), "resumes", [Resume.created_at, Resume.id], limit, cursor, skip, descending=True
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    resumes, next_cursor = split_page((await session.execute(statement)).all(), "resumes", limit)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    
     return resumes
 
 
 @router.get("/{resume_id}", response_model=ResumeResponse)
-async def get_resume(resume_id: int, session: Session = Depends(get_session)):
-    resume = session.get(Resume, resume_id)
+async def get_resume(resume_id: int, session: AsyncSession = Depends(get_async_session)):
+    resume = await session.get(Resume, resume_id)
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
     return resume
 
 
 @router.get("/{resume_id}/download")
-async def download_resume(resume_id: int, session: Session = Depends(get_session)):
-    resume = session.get(Resume, resume_id)
+async def download_resume(resume_id: int, session: AsyncSession = Depends(get_async_session)):
+    resume = await session.get(Resume, resume_id)
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
     
-    if not resume.file_path or not Path(resume.file_path).exists():
+    if resume.file_path and Path(resume.file_path).exists():
+        return FileResponse(
+            path=resume.file_path,
+            media_type="application/pdf",
+            filename=resume.resume_name
+        )
+    
+    data = await resume_pdf_bytes(session, resume)
+    if data is None:
         raise HTTPException(status_code=404, detail="Resume file not found")
     
-    return FileResponse(
-        path=resume.file_path,
+    return Response(
+        content=data,
         media_type="application/pdf",
-        filename=resume.resume_name
+        headers={"Content-Disposition": f'attachment; filename="{resume.resume_name}"'}
     )
 
 
 @router.delete("/{resume_id}")
-async def delete_resume(resume_id: int, session: Session = Depends(get_session)):
-    resume = session.get(Resume, resume_id)
+async def delete_resume(resume_id: int, session: AsyncSession = Depends(get_async_session)):
+    resume = await session.get(Resume, resume_id)
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
     
-    if resume.file_path and Path(resume.file_path).exists():
-        Path(resume.file_path).unlink()
+    await session.delete(resume)
+    await session.commit()
     
-    session.delete(resume)
-    session.commit()
+    await session.run_sync(remove_unreferenced_file, resume.file_path)
+    invalidate_resume_attachment(resume_id)
     
     return {"message": "Resume deleted successfully"}
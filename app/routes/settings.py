@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session, select
-from app.db import get_session
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.db import get_async_session
 from app.models.settings import Settings
 from app.schemas.settings_schema import SettingsUpdate, SettingsResponse
 from datetime import datetime
@@ -9,15 +10,15 @@ router = APIRouter(prefix="/api/settings", tags=["settings"])
 
 
 @router.get("", response_model=SettingsResponse)
-async def get_settings(session: Session = Depends(get_session)):
+async def get_settings(session: AsyncSession = Depends(get_async_session)):
     statement = select(Settings).where(Settings.user_id == 1)
-    settings = session.exec(statement).first()
+    settings = (await session.exec(statement)).first()
     
     if not settings:
         settings = Settings(user_id=1)
         session.add(settings)
-        session.commit()
-        session.refresh(settings)
+        await session.commit()
+        await session.refresh(settings)
     
     return settings
 
@@ -25,10 +26,10 @@ async def get_settings(session: Session = Depends(get_session)):
 @router.put("", response_model=SettingsResponse)
 async def update_settings(
     settings_update: SettingsUpdate,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_async_session)
 ):
     statement = select(Settings).where(Settings.user_id == 1)
-    settings = session.exec(statement).first()
+    settings = (await session.exec(statement)).first()
     
     if not settings:
         settings = Settings(user_id=1)
@@ -41,7 +42,7 @@ async def update_settings(
     settings.updated_at = datetime.utcnow()
     
     session.add(settings)
-    session.commit()
-    session.refresh(settings)
+    await session.commit()
+    await session.refresh(settings)
     
     return settings
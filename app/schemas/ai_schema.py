@@ -1,5 +1,6 @@
-from typing import Optional, List
-from pydantic import BaseModel
+from typing import Optional, List, Dict, Any
+from datetime import datetime
+from pydantic import BaseModel, Field
 
 
 class AIGenerateRequest(BaseModel):
@@ -7,6 +8,7 @@ class AIGenerateRequest(BaseModel):
     job_id: Optional[int] = None
     context: Optional[str] = None
     tone: Optional[str] = "professional"
+    bypass_cache: bool = False
 
 
 class AIGenerateResponse(BaseModel):
@@ -15,6 +17,42 @@ class AIGenerateResponse(BaseModel):
     content_type: str
     is_ai_generated: bool
     message: Optional[str] = None
+    job_id: Optional[int] = None
+
+
+class AIBatchGenerateRequest(BaseModel):
+    items: List[AIGenerateRequest] = Field(min_length=1, max_length=200)
+    concurrency: Optional[int] = Field(default=None, ge=1, le=32)
+
+
+class AIBatchGenerateResponse(BaseModel):
+    results: List[AIGenerateResponse]
+    succeeded: int
+    failed: int
+
+
+class AITaskAccepted(BaseModel):
+    task_id: int
+    task_type: str
+    status: str
+    deduplicated: bool
+
+
+class AITaskResponse(BaseModel):
+    id: int
+    task_type: str
+    status: str
+    attempts: int
+    max_attempts: int
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    run_after: datetime
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
 
 
 class ManualInputRequest(BaseModel):
@@ -16,3 +16,5 @@ class ApplicationResponse(BaseModel):
     email_log_id: Optional[int] = None
     resume_path: Optional[str] = None
     message: str
+    message_source: str
+    ai_fallback_used: bool = False
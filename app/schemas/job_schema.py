@@ -56,5 +56,13 @@ class JobSearch(BaseModel):
     min_score: Optional[int] = None
     has_visa_sponsorship: Optional[bool] = None
     applied: Optional[bool] = None
-    limit: int = Field(default=50, le=200)
+    limit: int = Field(default=50, ge=1, le=200)
     offset: int = Field(default=0, ge=0)
+    cursor: Optional[str] = None
+
+
+class BulkUrlImport(BaseModel):
+    urls: List[str] = Field(min_length=1, max_length=1000)
+    per_host_limit: int = Field(default=2, ge=1, le=10)
+    politeness_delay: float = Field(default=0.5, ge=0, le=30)
+    timeout_budget: float = Field(default=120, gt=0, le=600)
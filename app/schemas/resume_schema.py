@@ -1,5 +1,5 @@
 from typing import Optional, Dict, Any, List
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
 
 
@@ -12,6 +12,15 @@ class ResumeCreate(BaseModel):
     content: Optional[Dict[str, Any]] = None
 
 
+class ResumeBatchCreate(BaseModel):
+    job_ids: List[int] = Field(min_length=1, max_length=100)
+    template_type: str = "architect"
+    bullets: List[str] = []
+    summary: Optional[str] = None
+    use_ai: bool = False
+    concurrency: Optional[int] = Field(default=None, ge=1, le=32)
+
+
 class ResumeResponse(BaseModel):
     id: int
     user_id: int
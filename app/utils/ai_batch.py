@@ -0,0 +1,91 @@
+import asyncio
+import random
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+from openai import RateLimitError
+from app.config import settings
+from app.utils.logger import logger
+
+RATE_LIMIT_BASE_DELAY = 1.0
+RATE_LIMIT_MAX_DELAY = 60.0
+RATE_LIMIT_MAX_RETRIES = 4
+
+
+def _retry_after(error: RateLimitError) -> Optional[float]:
+    response = getattr(error, "response", None)
+    value = response.headers.get("retry-after") if response is not None else None
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except ValueError:
+        return None
+
+
+class RateLimitBackoff:
+    def __init__(self, base_delay: float = RATE_LIMIT_BASE_DELAY, max_delay: float = RATE_LIMIT_MAX_DELAY):
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.resume_at = 0.0
+        self.rate_limited = 0
+    
+    async def wait(self) -> None:
+        loop = asyncio.get_running_loop()
+        while self.resume_at > loop.time():
+            await asyncio.sleep(self.resume_at - loop.time())
+    
+    def penalize(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        delay = retry_after
+        if delay is None:
+            delay = min(self.max_delay, self.base_delay * 2 ** attempt) * random.uniform(0.5, 1.0)
+        
+        self.rate_limited += 1
+        self.resume_at = max(self.resume_at, asyncio.get_running_loop().time() + delay)
+        return delay
+
+
+async def call_with_backoff(
+    call: Callable[[], Awaitable[Any]],
+    semaphore: asyncio.Semaphore,
+    backoff: RateLimitBackoff,
+    max_retries: int = RATE_LIMIT_MAX_RETRIES
+) -> Any:
+    attempt = 0
+    while True:
+        await backoff.wait()
+        async with semaphore:
+            try:
+                return await call()
+            except RateLimitError as e:
+                if attempt >= max_retries:
+                    raise
+                delay = backoff.penalize(attempt, _retry_after(e))
+                logger.warning(f"Rate limited by OpenAI, pausing batch for {delay:.1f}s (retry {attempt + 1}/{max_retries})")
+        attempt += 1
+
+
+async def run_batch(
+    items: Sequence[Any],
+    key: Callable[[Any], Hashable],
+    call: Callable[[Any], Awaitable[Any]],
+    concurrency: Optional[int] = None,
+    backoff: Optional[RateLimitBackoff] = None,
+    max_retries: int = RATE_LIMIT_MAX_RETRIES
+) -> AsyncIterator[Tuple[List[int], Any, Optional[BaseException]]]:
+    semaphore = asyncio.Semaphore(concurrency or settings.ai_batch_concurrency)
+    backoff = backoff or RateLimitBackoff()
+    
+    indexes_by_key: Dict[Hashable, List[int]] = {}
+    for index, item in enumerate(items):
+        indexes_by_key.setdefault(key(item), []).append(index)
+    
+    async def run(indexes: List[int]):
+        try:
+            return indexes, await call_with_backoff(lambda: call(items[indexes[0]]), semaphore, backoff, max_retries), None
+        except Exception as e:
+            return indexes, None, e
+    
+    tasks = [asyncio.ensure_future(run(indexes)) for indexes in indexes_by_key.values()]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,155 @@
+import hashlib
+import json
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import delete, func, update
+from sqlmodel import Session, select
+from app.config import settings
+from app.db import engine
+from app.models.ai_response_cache import AIResponseCache
+from app.utils.lru import Counters, LRUCache
+from app.utils.upsert import UPSERT_INSERTS
+from app.utils.logger import logger
+
+CACHE_COUNTERS = ["memory_hits", "db_hits", "misses", "bypasses", "stores", "invalidations", "errors"]
+
+
+class ResponseLRU(LRUCache[str, Tuple[str, datetime, str]]):
+    def _expired(self, value: Tuple[str, datetime, str]) -> bool:
+        return value[1] <= datetime.utcnow()
+    
+    def invalidate(self, content_type: Optional[str] = None) -> int:
+        return self.discard(lambda key, value: content_type is None or value[0] == content_type)
+
+
+_memory = ResponseLRU(max_entries=settings.ai_cache_max_entries)
+_counters = Counters(CACHE_COUNTERS)
+
+
+def cache_key(model: str, messages: List[Dict[str, str]], params: Dict[str, Any], template_version: str) -> str:
+    payload = json.dumps(
+        {"model": model, "messages": messages, "params": params, "template_version": template_version},
+        sort_keys=True,
+        separators=(",", ":")
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def get_cached_response(key: str, bypass: bool = False) -> Optional[str]:
+    if not settings.ai_cache_enabled:
+        return None
+    
+    if bypass:
+        _counters.count("bypasses")
+        return None
+    
+    entry = _memory.get(key)
+    if entry is not None:
+        _counters.count("memory_hits")
+        return entry[2]
+    
+    try:
+        with Session(engine) as session:
+            entry = session.exec(
+                select(AIResponseCache).where(
+                    AIResponseCache.cache_key == key,
+                    AIResponseCache.expires_at > datetime.utcnow()
+                )
+            ).first()
+            
+            if entry:
+                session.execute(
+                    update(AIResponseCache)
+                    .where(AIResponseCache.id == entry.id)
+                    .values(hit_count=AIResponseCache.hit_count + 1)
+                )
+                session.commit()
+                _memory.set(key, (entry.content_type, entry.expires_at, entry.response))
+                _counters.count("db_hits")
+                return entry.response
+    except Exception as e:
+        _counters.count("errors")
+        logger.warning(f"AI cache lookup failed: {str(e)}")
+    
+    _counters.count("misses")
+    return None
+
+
+def store_response(key: str, content_type: str, model: str, template_version: str, response: str) -> None:
+    if not settings.ai_cache_enabled:
+        return
+    
+    expires_at = datetime.utcnow() + timedelta(seconds=settings.ai_cache_ttl_seconds)
+    _memory.set(key, (content_type, expires_at, response))
+    _counters.count("stores")
+    
+    row = {
+        "cache_key": key,
+        "content_type": content_type,
+        "model": model,
+        "template_version": template_version,
+        "response": response,
+        "hit_count": 0,
+        "created_at": datetime.utcnow(),
+        "expires_at": expires_at
+    }
+    
+    try:
+        with Session(engine) as session:
+            statement = UPSERT_INSERTS[session.get_bind().dialect.name](AIResponseCache)
+            statement = statement.on_conflict_do_update(
+                index_elements=["cache_key"],
+                set_={column: statement.excluded[column] for column in row if column != "cache_key"}
+            )
+            session.execute(statement, row)
+            session.commit()
+    except Exception as e:
+        _counters.count("errors")
+        logger.warning(f"Failed to persist AI cache entry: {str(e)}")
+
+
+def invalidate_cached_responses(content_type: Optional[str] = None) -> int:
+    removed_memory = _memory.invalidate(content_type)
+    
+    with Session(engine) as session:
+        statement = delete(AIResponseCache)
+        if content_type:
+            statement = statement.where(AIResponseCache.content_type == content_type)
+        removed = session.execute(statement).rowcount
+        session.commit()
+    
+    _counters.count("invalidations", max(removed, removed_memory))
+    logger.info(f"Invalidated {removed} cached AI responses ({content_type or 'all content types'})")
+    return removed
+
+
+def purge_expired_responses() -> int:
+    with Session(engine) as session:
+        removed = session.execute(
+            delete(AIResponseCache).where(AIResponseCache.expires_at <= datetime.utcnow())
+        ).rowcount
+        session.commit()
+    return removed
+
+
+def cache_stats() -> Dict[str, Any]:
+    counters = _counters.snapshot()
+    
+    lookups = counters["memory_hits"] + counters["db_hits"] + counters["misses"]
+    
+    with Session(engine) as session:
+        rows_by_type = dict(session.exec(
+            select(AIResponseCache.content_type, func.count())
+            .where(AIResponseCache.expires_at > datetime.utcnow())
+            .group_by(AIResponseCache.content_type)
+        ).all())
+    
+    return {
+        "enabled": settings.ai_cache_enabled,
+        "ttl_seconds": settings.ai_cache_ttl_seconds,
+        "memory_entries": len(_memory),
+        "memory_capacity": _memory.max_entries,
+        "persistent_entries": rows_by_type,
+        **counters,
+        "hit_rate": round((counters["memory_hits"] + counters["db_hits"]) / lookups, 4) if lookups else 0
+    }
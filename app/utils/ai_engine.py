@@ -1,23 +1,197 @@
-from typing import Optional, Dict, Any
+import json
+import time
+import httpx
 from openai import OpenAI
+from typing import Optional, Dict, Any, Callable, List, Tuple
 from app.config import settings
+from app.utils.openai_clients import get_openai_client
+from app.utils.ai_cache import cache_key, get_cached_response, store_response
+from app.utils.ai_metrics import record_ai_call
+from app.utils.circuit_breaker import CircuitOpenError, openai_breaker
 from app.utils.logger import logger
 
+MODEL = "gpt-3.5-turbo"
+
+TEMPLATE_VERSIONS = {
+    "resume_bullets": "1",
+    "recruiter_message": "1",
+    "followup_message": "1",
+    "summary": "1",
+    "resume_content": "1"
+}
+
+
+def parse_resume_content(content: str) -> Dict[str, Any]:
+    text = content.strip()
+    if text.startswith("```"):
+        text = text.strip("`")
+        text = text[text.find("{"):]
+    
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Resume content is not valid JSON: {str(e)}")
+    
+    if not isinstance(data, dict):
+        raise ValueError("Resume content must be a JSON object")
+    
+    bullets = data.get("bullets")
+    summary = data.get("summary")
+    
+    if not isinstance(bullets, list) or not all(isinstance(bullet, str) for bullet in bullets):
+        raise ValueError("Resume content bullets must be a list of strings")
+    
+    bullets = [bullet.strip() for bullet in bullets if bullet.strip()]
+    if not bullets:
+        raise ValueError("Resume content has no bullets")
+    
+    if not isinstance(summary, str) or not summary.strip():
+        raise ValueError("Resume content has no summary")
+    
+    return {"bullets": bullets, "summary": summary.strip()}
+
+
+def _call_outcome(error: Exception) -> str:
+    if isinstance(error, ConnectionAbortedError):
+        return "cancelled"
+    if isinstance(error, CircuitOpenError):
+        return "short_circuited"
+    return "error"
+
 
 class AIEngine:
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        bypass_cache: bool = False,
+        raise_errors: bool = False,
+        on_token: Optional[Callable[[str], None]] = None,
+        deadline: Optional[float] = None
+    ):
         self.api_key = api_key or settings.openai_api_key
+        self.bypass_cache = bypass_cache
+        self.raise_errors = raise_errors
+        self.on_token = on_token
+        self.deadline = deadline
         self.client = None
         
         if self.api_key:
             try:
-                self.client = OpenAI(api_key=self.api_key)
+                self.client = get_openai_client(self.api_key)
             except Exception as e:
                 logger.error(f"Failed to initialize OpenAI client: {str(e)}")
     
     def is_available(self) -> bool:
         return self.client is not None
     
+    def _complete(
+        self,
+        content_type: str,
+        system_prompt: str,
+        prompt: str,
+        max_tokens: int,
+        temperature: float = 0.7,
+        validate: Optional[Callable[[str], Any]] = None
+    ) -> str:
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": prompt}
+        ]
+        template_version = TEMPLATE_VERSIONS[content_type]
+        key = cache_key(MODEL, messages, {"max_tokens": max_tokens, "temperature": temperature}, template_version)
+        
+        start = time.perf_counter()
+        first_token = None
+        prompt_tokens = None
+        completion_tokens = None
+        
+        try:
+            cached = get_cached_response(key, bypass=self.bypass_cache)
+            if cached is not None:
+                if self.on_token:
+                    self.on_token(cached)
+                record_ai_call(content_type, MODEL, "cache_hit", time.perf_counter() - start)
+                return cached
+            
+            openai_breaker.before_call()
+            try:
+                if self.on_token:
+                    content, first_token, completion_tokens = self._stream_completion(messages, max_tokens, temperature, start)
+                    content = content.strip()
+                else:
+                    response = self._client().chat.completions.create(
+                        model=MODEL,
+                        messages=messages,
+                        max_tokens=max_tokens,
+                        temperature=temperature
+                    )
+                    content = response.choices[0].message.content.strip()
+                    if response.usage:
+                        prompt_tokens = response.usage.prompt_tokens
+                        completion_tokens = response.usage.completion_tokens
+            except Exception as e:
+                openai_breaker.record(e)
+                raise
+            openai_breaker.record_success()
+            
+            if validate:
+                validate(content)
+        
+        except Exception as e:
+            record_ai_call(
+                content_type,
+                MODEL,
+                _call_outcome(e),
+                time.perf_counter() - start,
+                first_token,
+                prompt_tokens,
+                completion_tokens,
+                error_type=e.__class__.__name__
+            )
+            raise
+        
+        record_ai_call(content_type, MODEL, "success", time.perf_counter() - start, first_token, prompt_tokens, completion_tokens)
+        store_response(key, content_type, MODEL, template_version, content)
+        return content
+    
+    def _client(self) -> OpenAI:
+        if self.deadline is None:
+            return self.client
+        timeout = httpx.Timeout(self.deadline, connect=min(settings.openai_connect_timeout, self.deadline))
+        return self.client.with_options(timeout=timeout, max_retries=0)
+    
+    def _stream_completion(
+        self,
+        messages: List[Dict[str, str]],
+        max_tokens: int,
+        temperature: float,
+        start: float
+    ) -> Tuple[str, Optional[float], int]:
+        stream = self._client().chat.completions.create(
+            model=MODEL,
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            stream=True
+        )
+        
+        parts = []
+        first_token = None
+        try:
+            for chunk in stream:
+                if self.deadline is not None and time.perf_counter() - start > self.deadline:
+                    raise httpx.ReadTimeout(f"AI stream exceeded the {self.deadline:.0f}s deadline")
+                token = chunk.choices[0].delta.content if chunk.choices else None
+                if token:
+                    if first_token is None:
+                        first_token = time.perf_counter() - start
+                    parts.append(token)
+                    self.on_token(token)
+        finally:
+            stream.response.close()
+        
+        return "".join(parts), first_token, len(parts)
+    
     def generate_resume_bullets(self, job_description: str, template_type: str, context: str = "") -> str:
         if not self.is_available():
             return "AI mode not available. Please provide resume bullets manually."
@@ -33,23 +207,46 @@ Additional Context:
 
 Focus on cloud technologies, infrastructure, and relevant skills. Use action verbs and quantify achievements where possible.
 Format each bullet point on a new line starting with a dash (-)."""
-
-            response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": "You are a professional resume writer specializing in cloud and DevOps roles."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=500,
-                temperature=0.7
-            )
             
-            return response.choices[0].message.content.strip()
+            return self._complete("resume_bullets", "You are a professional resume writer specializing in cloud and DevOps roles.", prompt, max_tokens=500)
         
         except Exception as e:
+            if self.raise_errors:
+                raise
             logger.error(f"AI generation failed: {str(e)}")
             return f"AI generation error: {str(e)}"
     
+    def generate_resume_content(self, job_description: str, template_type: str) -> Optional[Dict[str, Any]]:
+        if not self.is_available():
+            return None
+        
+        try:
+            prompt = f"""Write resume content for a {template_type} role.
+
+Job Description:
+{job_description}
+
+Return a JSON object with exactly these keys:
+- "bullets": a list of 5-7 professional resume bullet points as plain strings. Focus on cloud technologies, infrastructure, and relevant skills. Use action verbs and quantify achievements where possible.
+- "summary": a 2-3 sentence professional summary that highlights cloud/DevOps expertise and aligns with the role requirements.
+
+Respond with the JSON object only."""
+            
+            content = self._complete(
+                "resume_content",
+                "You are a professional resume writer specializing in cloud and DevOps roles. You reply with valid JSON only.",
+                prompt,
+                max_tokens=650,
+                validate=parse_resume_content
+            )
+            return parse_resume_content(content)
+        
+        except Exception as e:
+            if self.raise_errors:
+                raise
+            logger.warning(f"Combined resume generation failed, falling back to separate calls: {str(e)}")
+            return None
+    
     def generate_recruiter_message(self, job_title: str, company: str, tone: str = "professional") -> str:
         if not self.is_available():
             return "AI mode not available. Please provide message manually."
@@ -76,20 +273,12 @@ The email should:
 - Be personalized to the company
 
 Do not include subject line, just the email body."""
-
-            response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": "You are an expert at writing professional job application emails."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=300,
-                temperature=0.7
-            )
             
-            return response.choices[0].message.content.strip()
+            return self._complete("recruiter_message", "You are an expert at writing professional job application emails.", prompt, max_tokens=300)
         
         except Exception as e:
+            if self.raise_errors:
+                raise
             logger.error(f"AI generation failed: {str(e)}")
             return f"AI generation error: {str(e)}"
     
@@ -109,20 +298,12 @@ The email should:
 - Remain professional and not pushy
 
 Do not include subject line, just the email body."""
-
-            response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": "You are an expert at writing professional follow-up emails."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=200,
-                temperature=0.7
-            )
             
-            return response.choices[0].message.content.strip()
+            return self._complete("followup_message", "You are an expert at writing professional follow-up emails.", prompt, max_tokens=200)
         
         except Exception as e:
+            if self.raise_errors:
+                raise
             logger.error(f"AI generation failed: {str(e)}")
             return f"AI generation error: {str(e)}"
     
@@ -136,19 +317,11 @@ Do not include subject line, just the email body."""
 {job_description}
 
 The summary should highlight cloud/DevOps expertise and align with the role requirements."""
-
-            response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": "You are a professional resume writer."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=150,
-                temperature=0.7
-            )
             
-            return response.choices[0].message.content.strip()
+            return self._complete("summary", "You are a professional resume writer.", prompt, max_tokens=150)
         
         except Exception as e:
+            if self.raise_errors:
+                raise
             logger.error(f"AI generation failed: {str(e)}")
             return f"AI generation error: {str(e)}"
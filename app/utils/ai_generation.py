@@ -0,0 +1,69 @@
+from typing import Optional, Tuple
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.models.settings import Settings
+from app.models.job import Job
+from app.schemas.ai_schema import AIGenerateRequest, AIGenerateResponse
+from app.utils.ai_engine import AIEngine
+from app.utils.concurrency import run_blocking
+from app.utils.prompt_compression import job_prompt_description
+
+
+def failed_response(content_type: str, message: str, job_id: Optional[int] = None) -> AIGenerateResponse:
+    return AIGenerateResponse(
+        success=False,
+        content="",
+        content_type=content_type,
+        is_ai_generated=False,
+        message=message,
+        job_id=job_id
+    )
+
+
+async def load_ai_settings(session: AsyncSession) -> Tuple[Optional[Settings], Optional[str]]:
+    statement = select(Settings).where(Settings.user_id == 1)
+    settings = (await session.exec(statement)).first()
+    
+    if not settings or not settings.ai_mode_enabled:
+        return None, "AI mode is not enabled. Please enable it in settings and provide an API key."
+    
+    if not AIEngine(api_key=settings.openai_api_key).is_available():
+        return None, "AI engine not available. Please check your API key."
+    
+    return settings, None
+
+
+async def generate_content(
+    ai_engine: AIEngine,
+    request: AIGenerateRequest,
+    job: Optional[Job]
+) -> AIGenerateResponse:
+    job_description = job_prompt_description(job)
+    job_title = job.title if job else "Cloud Engineer"
+    company = job.company if job else "Company"
+    
+    if request.content_type == "resume_bullets":
+        template_type = request.context or "architect"
+        content = await run_blocking("ai", ai_engine.generate_resume_bullets, job_description, template_type, "")
+    
+    elif request.content_type == "summary":
+        content = await run_blocking("ai", ai_engine.generate_summary, job_description or request.context or "")
+    
+    elif request.content_type == "recruiter_message":
+        tone = request.tone or "professional"
+        content = await run_blocking("ai", ai_engine.generate_recruiter_message, job_title, company, tone)
+    
+    elif request.content_type == "followup_message":
+        content = await run_blocking("ai", ai_engine.generate_followup_message, job_title, company, 7)
+    
+    else:
+        return failed_response(request.content_type, f"Unknown content type: {request.content_type}", request.job_id)
+    
+    return AIGenerateResponse(
+        success=True,
+        content=content,
+        content_type=request.content_type,
+        is_ai_generated=True,
+        message="Content generated successfully",
+        job_id=request.job_id
+    )
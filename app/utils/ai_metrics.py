@@ -0,0 +1,159 @@
+import threading
+from collections import Counter, deque
+from typing import Any, Dict, List, Optional, Tuple
+from app.config import settings
+from app.utils.logger import logger
+
+LATENCY_BUCKETS = [0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 10.0, 20.0, 30.0, 60.0]
+QUANTILES = [0.5, 0.95, 0.99]
+
+
+class Histogram:
+    def __init__(self, buckets: List[float], window: int):
+        self.buckets = buckets
+        self.bucket_counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+        self.recent: deque = deque(maxlen=window)
+    
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.sum += value
+        self.recent.append(value)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.bucket_counts[i] += 1
+                break
+    
+    def cumulative_buckets(self) -> List[Tuple[float, int]]:
+        total = 0
+        cumulative = []
+        for bound, count in zip(self.buckets, self.bucket_counts):
+            total += count
+            cumulative.append((bound, total))
+        return cumulative
+    
+    def summary(self) -> Dict[str, Any]:
+        ordered = sorted(self.recent)
+        result = {
+            "count": self.count,
+            "mean_ms": round(self.sum / self.count * 1000, 1) if self.count else None
+        }
+        for quantile in QUANTILES:
+            key = f"p{int(quantile * 100)}_ms"
+            result[key] = round(ordered[min(len(ordered) - 1, int(len(ordered) * quantile))] * 1000, 1) if ordered else None
+        return result
+
+
+class AICallStats:
+    def __init__(self, window: int):
+        self.latency = Histogram(LATENCY_BUCKETS, window)
+        self.first_token = Histogram(LATENCY_BUCKETS, window)
+        self.outcomes: Counter = Counter()
+        self.errors: Counter = Counter()
+        self.tokens: Counter = Counter()
+
+
+_stats: Dict[Tuple[str, str], AICallStats] = {}
+_lock = threading.Lock()
+
+
+def record_ai_call(
+    content_type: str,
+    model: str,
+    outcome: str,
+    duration: float,
+    first_token: Optional[float] = None,
+    prompt_tokens: Optional[int] = None,
+    completion_tokens: Optional[int] = None,
+    error_type: Optional[str] = None
+) -> None:
+    with _lock:
+        stats = _stats.get((content_type, model))
+        if stats is None:
+            stats = _stats[(content_type, model)] = AICallStats(settings.ai_metrics_window)
+        
+        stats.outcomes[outcome] += 1
+        if error_type:
+            stats.errors[error_type] += 1
+        
+        if outcome != "cache_hit":
+            stats.latency.observe(duration)
+            if first_token is not None:
+                stats.first_token.observe(first_token)
+        
+        stats.tokens["prompt"] += prompt_tokens or 0
+        stats.tokens["completion"] += completion_tokens or 0
+    
+    fields = {
+        "content_type": content_type,
+        "model": model,
+        "outcome": outcome,
+        "duration_ms": f"{duration * 1000:.1f}",
+        "ttft_ms": f"{first_token * 1000:.1f}" if first_token is not None else None,
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "error": error_type
+    }
+    logger.info("AI call " + " ".join(f"{name}={value}" for name, value in fields.items() if value is not None))
+
+
+def ai_metrics() -> Dict[str, Any]:
+    with _lock:
+        return {
+            "window": settings.ai_metrics_window,
+            "calls": [
+                {
+                    "content_type": content_type,
+                    "model": model,
+                    "outcomes": dict(stats.outcomes),
+                    "errors": dict(stats.errors),
+                    "latency": stats.latency.summary(),
+                    "time_to_first_token": stats.first_token.summary(),
+                    "prompt_tokens": stats.tokens["prompt"],
+                    "completion_tokens": stats.tokens["completion"]
+                }
+                for (content_type, model), stats in sorted(_stats.items())
+            ]
+        }
+
+
+def _prometheus_histogram(lines: List[str], name: str, labels: str, histogram: Histogram) -> None:
+    for bound, count in histogram.cumulative_buckets():
+        lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {count}')
+    lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+    lines.append(f"{name}_sum{{{labels}}} {histogram.sum}")
+    lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+
+
+def ai_metrics_prometheus() -> str:
+    with _lock:
+        series = [
+            (f'content_type="{content_type}",model="{model}"', stats)
+            for (content_type, model), stats in sorted(_stats.items())
+        ]
+        
+        lines = ["# TYPE ai_calls_total counter"]
+        for labels, stats in series:
+            for outcome, count in sorted(stats.outcomes.items()):
+                lines.append(f'ai_calls_total{{{labels},outcome="{outcome}"}} {count}')
+        
+        lines.append("# TYPE ai_call_errors_total counter")
+        for labels, stats in series:
+            for error_type, count in sorted(stats.errors.items()):
+                lines.append(f'ai_call_errors_total{{{labels},error="{error_type}"}} {count}')
+        
+        lines.append("# TYPE ai_tokens_total counter")
+        for labels, stats in series:
+            for kind in ("prompt", "completion"):
+                lines.append(f'ai_tokens_total{{{labels},kind="{kind}"}} {stats.tokens[kind]}')
+        
+        lines.append("# TYPE ai_call_duration_seconds histogram")
+        for labels, stats in series:
+            _prometheus_histogram(lines, "ai_call_duration_seconds", labels, stats.latency)
+        
+        lines.append("# TYPE ai_time_to_first_token_seconds histogram")
+        for labels, stats in series:
+            _prometheus_histogram(lines, "ai_time_to_first_token_seconds", labels, stats.first_token)
+    
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,326 @@
+import asyncio
+import hashlib
+import json
+import os
+import socket
+import threading
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+import openai
+from sqlalchemy import func, update
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.config import settings
+from app.db import async_engine
+from app.models.ai_task import AITask
+from app.models.job import Job
+from app.schemas.ai_schema import AIGenerateRequest
+from app.schemas.resume_schema import ResumeCreate, ResumeResponse
+from app.utils.ai_engine import AIEngine
+from app.utils.ai_generation import generate_content, load_ai_settings
+from app.utils.resume_builder import build_resume
+from app.utils.logger import logger
+
+ACTIVE_STATUSES = ["queued", "running"]
+FINISHED_STATUSES = ["succeeded", "failed", "cancelled"]
+
+PERMANENT_ERRORS = (
+    ValueError,
+    openai.BadRequestError,
+    openai.AuthenticationError,
+    openai.PermissionDeniedError,
+    openai.NotFoundError
+)
+
+
+def task_dedup_key(user_id: int, task_type: str, payload: Dict[str, Any]) -> str:
+    encoded = json.dumps(
+        {"user_id": user_id, "task_type": task_type, "payload": payload},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str
+    )
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+async def find_active_task(session: AsyncSession, dedup_key: str) -> Optional[AITask]:
+    statement = select(AITask).where(AITask.dedup_key == dedup_key, AITask.status.in_(ACTIVE_STATUSES))
+    return (await session.exec(statement)).first()
+
+
+async def count_active_tasks(session: AsyncSession, user_id: int) -> int:
+    statement = select(func.count()).select_from(AITask).where(
+        AITask.user_id == user_id,
+        AITask.status.in_(ACTIVE_STATUSES)
+    )
+    return (await session.exec(statement)).one()
+
+
+async def enqueue_task(session: AsyncSession, user_id: int, task_type: str, payload: Dict[str, Any]) -> Tuple[AITask, bool]:
+    if task_type not in TASK_HANDLERS:
+        raise ValueError(f"Unknown task type: {task_type}")
+    
+    dedup_key = task_dedup_key(user_id, task_type, payload)
+    existing = await find_active_task(session, dedup_key)
+    if existing:
+        return existing, True
+    
+    task = AITask(
+        user_id=user_id,
+        task_type=task_type,
+        payload=payload,
+        dedup_key=dedup_key,
+        max_attempts=settings.ai_task_max_attempts
+    )
+    session.add(task)
+    
+    try:
+        await session.commit()
+    except IntegrityError:
+        await session.rollback()
+        existing = await find_active_task(session, dedup_key)
+        if existing:
+            return existing, True
+        raise
+    
+    await session.refresh(task)
+    logger.info(f"Queued AI task {task.id} ({task_type}) for user {user_id}")
+    return task, False
+
+
+async def cancel_task(session: AsyncSession, task_id: int) -> bool:
+    result = await session.execute(
+        update(AITask)
+        .where(AITask.id == task_id, AITask.status == "queued")
+        .values(status="cancelled", finished_at=datetime.utcnow())
+    )
+    await session.commit()
+    return result.rowcount == 1
+
+
+async def _run_generate_task(session: AsyncSession, payload: Dict[str, Any]) -> Dict[str, Any]:
+    request = AIGenerateRequest(**payload)
+    
+    ai_settings, error = await load_ai_settings(session)
+    if error:
+        raise ValueError(error)
+    
+    job = await session.get(Job, request.job_id) if request.job_id else None
+    
+    ai_engine = AIEngine(api_key=ai_settings.openai_api_key, bypass_cache=request.bypass_cache, raise_errors=True)
+    response = await generate_content(ai_engine, request, job)
+    if not response.success:
+        raise ValueError(response.message)
+    
+    return response.dict()
+
+
+async def _run_resume_task(session: AsyncSession, payload: Dict[str, Any]) -> Dict[str, Any]:
+    resume = await build_resume(session, ResumeCreate(**payload))
+    return ResumeResponse.model_validate(resume).model_dump(mode="json")
+
+
+TASK_HANDLERS: Dict[str, Callable[[AsyncSession, Dict[str, Any]], Awaitable[Dict[str, Any]]]] = {
+    "generate": _run_generate_task,
+    "resume": _run_resume_task
+}
+
+
+class AITaskWorker:
+    def __init__(
+        self,
+        concurrency: Optional[int] = None,
+        user_concurrency: Optional[int] = None,
+        poll_interval: Optional[float] = None
+    ):
+        self.concurrency = concurrency or settings.ai_task_workers
+        self.user_concurrency = user_concurrency or settings.ai_task_user_concurrency
+        self.poll_interval = poll_interval or settings.ai_task_poll_interval
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{id(self):x}"
+        self.running: Dict[int, asyncio.Task] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+    
+    async def run(self, stop: threading.Event) -> None:
+        self._wakeup = asyncio.Event()
+        logger.info(f"AI task worker {self.worker_id} started with {self.concurrency} slots")
+        
+        while not stop.is_set():
+            try:
+                await self.requeue_expired()
+                free_slots = self.concurrency - len(self.running)
+                if free_slots > 0:
+                    for task_id in await self.claim(free_slots):
+                        self.running[task_id] = asyncio.ensure_future(self.execute(task_id))
+            except Exception as e:
+                logger.error(f"AI task worker poll failed: {str(e)}")
+            
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+        
+        if self.running:
+            await asyncio.gather(*self.running.values(), return_exceptions=True)
+        logger.info(f"AI task worker {self.worker_id} stopped")
+    
+    async def claim(self, limit: int) -> List[int]:
+        now = datetime.utcnow()
+        
+        async with AsyncSession(async_engine) as session:
+            running = Counter(dict((await session.execute(
+                select(AITask.user_id, func.count())
+                .where(AITask.status == "running")
+                .group_by(AITask.user_id)
+            )).all()))
+            saturated = [user_id for user_id, count in running.items() if count >= self.user_concurrency]
+            
+            candidates = (await session.execute(
+                select(AITask.id, AITask.user_id)
+                .where(
+                    AITask.status == "queued",
+                    AITask.run_after <= now,
+                    AITask.user_id.not_in(saturated)
+                )
+                .order_by(AITask.run_after, AITask.id)
+                .limit(limit * 4)
+            )).all()
+            
+            claimed = []
+            for task_id, user_id in candidates:
+                if len(claimed) >= limit:
+                    break
+                if running[user_id] >= self.user_concurrency:
+                    continue
+                
+                result = await session.execute(
+                    update(AITask)
+                    .where(AITask.id == task_id, AITask.status == "queued")
+                    .values(
+                        status="running",
+                        attempts=AITask.attempts + 1,
+                        locked_by=self.worker_id,
+                        locked_at=now,
+                        started_at=now
+                    )
+                )
+                await session.commit()
+                
+                if result.rowcount == 1:
+                    claimed.append(task_id)
+                    running[user_id] += 1
+            
+            return claimed
+    
+    async def requeue_expired(self) -> None:
+        expired_before = datetime.utcnow() - timedelta(seconds=settings.ai_task_lease_seconds)
+        expired = (AITask.status == "running") & (AITask.locked_at < expired_before)
+        
+        async with AsyncSession(async_engine) as session:
+            failed = await session.execute(
+                update(AITask)
+                .where(expired, AITask.attempts >= AITask.max_attempts)
+                .values(status="failed", error="Task lease expired", locked_by=None, finished_at=datetime.utcnow())
+            )
+            requeued = await session.execute(
+                update(AITask)
+                .where(expired)
+                .values(status="queued", locked_by=None, locked_at=None, run_after=datetime.utcnow())
+            )
+            await session.commit()
+        
+        if failed.rowcount or requeued.rowcount:
+            logger.warning(f"Recovered expired AI tasks: {requeued.rowcount} requeued, {failed.rowcount} failed")
+    
+    async def execute(self, task_id: int) -> None:
+        try:
+            async with AsyncSession(async_engine, expire_on_commit=False) as session:
+                task = await session.get(AITask, task_id)
+                task_type, payload, attempts, max_attempts = task.task_type, task.payload, task.attempts, task.max_attempts
+                
+                lease = asyncio.ensure_future(self.renew_lease(task_id))
+                try:
+                    try:
+                        result = await TASK_HANDLERS[task_type](session, payload)
+                    finally:
+                        lease.cancel()
+                except Exception as e:
+                    await session.rollback()
+                    await self.record_failure(task_id, task_type, attempts, max_attempts, e)
+                    return
+            
+            if await self.finish(task_id, status="succeeded", result=result, error=None, finished_at=datetime.utcnow()):
+                logger.info(f"AI task {task_id} ({task_type}) succeeded on attempt {attempts}")
+        except Exception as e:
+            logger.error(f"AI task {task_id} could not be executed: {str(e)}")
+        finally:
+            self.running.pop(task_id, None)
+            self._wakeup.set()
+    
+    async def renew_lease(self, task_id: int) -> None:
+        while True:
+            await asyncio.sleep(settings.ai_task_lease_seconds / 3)
+            try:
+                async with AsyncSession(async_engine) as session:
+                    result = await session.execute(
+                        update(AITask)
+                        .where(AITask.id == task_id, AITask.locked_by == self.worker_id)
+                        .values(locked_at=datetime.utcnow())
+                    )
+                    await session.commit()
+            except Exception as e:
+                logger.error(f"Failed to renew the lease on AI task {task_id}: {str(e)}")
+                continue
+            
+            if result.rowcount == 0:
+                logger.warning(f"AI task {task_id} is no longer leased by {self.worker_id}")
+                return
+    
+    async def record_failure(self, task_id: int, task_type: str, attempts: int, max_attempts: int, error: Exception) -> None:
+        message = str(error)[:1000] or error.__class__.__name__
+        
+        if isinstance(error, PERMANENT_ERRORS) or attempts >= max_attempts:
+            await self.finish(task_id, status="failed", error=message, finished_at=datetime.utcnow())
+            logger.error(f"AI task {task_id} ({task_type}) failed on attempt {attempts} of {max_attempts}: {message}")
+            return
+        
+        delay = settings.ai_task_retry_delay * 2 ** (attempts - 1)
+        await self.finish(
+            task_id,
+            status="queued",
+            error=message,
+            locked_at=None,
+            run_after=datetime.utcnow() + timedelta(seconds=delay)
+        )
+        logger.warning(f"AI task {task_id} ({task_type}) attempt {attempts} failed, retrying in {delay:.1f}s: {message}")
+    
+    async def finish(self, task_id: int, **values: Any) -> bool:
+        async with AsyncSession(async_engine) as session:
+            result = await session.execute(
+                update(AITask)
+                .where(AITask.id == task_id, AITask.locked_by == self.worker_id)
+                .values(locked_by=None, **values)
+            )
+            await session.commit()
+        
+        if result.rowcount == 0:
+            logger.warning(f"AI task {task_id} is no longer leased by {self.worker_id}, dropped its {values['status']} result")
+            return False
+        return True
+
+
+def start_ai_task_worker(worker: Optional[AITaskWorker] = None) -> Tuple[threading.Event, threading.Thread]:
+    worker = worker or AITaskWorker()
+    stop = threading.Event()
+    
+    async def run() -> None:
+        try:
+            await worker.run(stop)
+        finally:
+            await async_engine.dispose()
+    
+    thread = threading.Thread(target=asyncio.run, args=(run(),), name="ai-task-worker", daemon=True)
+    thread.start()
+    return stop, thread
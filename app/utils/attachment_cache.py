@@ -0,0 +1,52 @@
+from email.mime.application import MIMEApplication
+from typing import Any, Dict, Optional, Tuple
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.config import settings
+from app.models.resume import Resume
+from app.utils.concurrency import run_blocking
+from app.utils.email_sender import pdf_attachment
+from app.utils.lru import Counters, LRUCache
+from app.utils.resume_store import resume_pdf_bytes
+
+ATTACHMENT_COUNTERS = ["hits", "misses", "unavailable", "invalidations"]
+
+AttachmentKey = Tuple[int, str]
+
+_attachments: LRUCache[AttachmentKey, MIMEApplication] = LRUCache(max_entries=settings.attachment_cache_entries)
+_counters = Counters(ATTACHMENT_COUNTERS)
+
+
+async def resume_attachment(session: AsyncSession, resume: Resume) -> Optional[MIMEApplication]:
+    key = (resume.id, resume.content_hash or resume.file_path or "")
+    part = _attachments.get(key)
+    if part is not None:
+        _counters.count("hits")
+        return part
+    
+    data = await resume_pdf_bytes(session, resume)
+    if data is None:
+        _counters.count("unavailable")
+        return None
+    
+    part = await run_blocking("pdf", pdf_attachment, data, resume.resume_name)
+    _attachments.set(key, part)
+    _counters.count("misses")
+    return part
+
+
+def invalidate_resume_attachment(resume_id: int) -> int:
+    removed = _attachments.discard(lambda key, part: key[0] == resume_id)
+    _counters.count("invalidations", removed)
+    return removed
+
+
+def attachment_cache_stats() -> Dict[str, Any]:
+    counters = _counters.snapshot()
+    
+    lookups = counters["hits"] + counters["misses"]
+    return {
+        **counters,
+        "hit_rate": round(counters["hits"] / lookups, 3) if lookups else 0.0,
+        "entries": len(_attachments),
+        "capacity": _attachments.max_entries
+    }
@@ -0,0 +1,283 @@
+import hashlib
+import json
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+import numpy as np
+from sqlalchemy import inspect, text, update
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, select
+from app.models.job import Job
+from app.models.settings import Settings
+from app.models.user import User
+from app.utils.scoring import CLOUD_KEYWORDS
+from app.utils.logger import logger
+
+SCORE_COMPONENTS = ["role_match", "cloud_match", "visa_match", "salary_match", "location_match", "jd_quality"]
+
+SCORE_FEATURE_COLUMNS = [
+    Job.id,
+    Job.title,
+    Job.description,
+    Job.classification,
+    Job.location,
+    Job.country,
+    Job.has_visa_sponsorship,
+    Job.salary_min
+]
+
+def _any_in(preferences: List[str], value: str) -> bool:
+    value_lower = value.lower()
+    return any(pref in value_lower for pref in preferences)
+
+
+def extract_score_features(
+    jobs: Sequence[Mapping[str, Any]],
+    user_role_preferences: List[str],
+    user_country_preferences: List[str]
+) -> Dict[str, np.ndarray]:
+    role_prefs = [pref.lower() for pref in user_role_preferences or []]
+    country_prefs = [pref.lower() for pref in user_country_preferences or []]
+    
+    class_matches: Dict[str, bool] = {}
+    country_matches: Dict[str, bool] = {}
+    
+    has_classification = []
+    class_match = []
+    title_match = []
+    cloud_count = []
+    has_country = []
+    location_match = []
+    desc_length = []
+    
+    for job in jobs:
+        description = job["description"] or ""
+        desc_lower = description.lower()
+        
+        classification = job["classification"]
+        matched_class = False
+        matched_title = False
+        if classification:
+            matched_class = class_matches.get(classification)
+            if matched_class is None:
+                matched_class = class_matches[classification] = _any_in(role_prefs, classification)
+            if role_prefs and not matched_class:
+                matched_title = _any_in(role_prefs, job["title"])
+        
+        country = job["country"]
+        matched_location = False
+        if country and country_prefs:
+            matched_location = country_matches.get(country)
+            if matched_location is None:
+                matched_location = country_matches[country] = _any_in(country_prefs, country)
+            matched_location = matched_location or _any_in(country_prefs, job["location"])
+        
+        has_classification.append(bool(classification))
+        class_match.append(matched_class)
+        title_match.append(matched_title)
+        cloud_count.append(sum(1 for kw in CLOUD_KEYWORDS if kw in desc_lower))
+        has_country.append(bool(country))
+        location_match.append(matched_location)
+        desc_length.append(len(description))
+    
+    return {
+        "has_classification": np.array(has_classification, dtype=bool),
+        "class_match": np.array(class_match, dtype=bool),
+        "title_match": np.array(title_match, dtype=bool),
+        "cloud_count": np.array(cloud_count, dtype=np.int64),
+        "has_visa": np.array([bool(job["has_visa_sponsorship"]) for job in jobs], dtype=bool),
+        "salary_min": np.array([job["salary_min"] or 0 for job in jobs], dtype=np.int64),
+        "has_country": np.array(has_country, dtype=bool),
+        "location_match": np.array(location_match, dtype=bool),
+        "desc_length": np.array(desc_length, dtype=np.int64)
+    }
+
+
+def score_features(
+    features: Dict[str, np.ndarray],
+    has_role_preferences: bool,
+    has_country_preferences: bool,
+    user_min_salary: Optional[int],
+    user_visa_required: bool
+) -> Dict[str, np.ndarray]:
+    n = len(features["cloud_count"])
+    
+    if has_role_preferences:
+        role_match = np.where(
+            features["has_classification"],
+            np.where(features["class_match"], 30, np.where(features["title_match"], 20, 0)),
+            15
+        )
+    else:
+        role_match = np.full(n, 15)
+    
+    cloud_match = np.minimum(features["cloud_count"] * 3, 20)
+    
+    if user_visa_required:
+        visa_match = np.where(features["has_visa"], 25, 0)
+    else:
+        visa_match = np.full(n, 15)
+    
+    salary = features["salary_min"]
+    if user_min_salary:
+        salary_match = np.where(
+            salary != 0,
+            np.where(salary >= user_min_salary, 15, np.where(salary >= user_min_salary * 0.8, 10, 5)),
+            10
+        )
+    else:
+        salary_match = np.full(n, 10)
+    
+    if has_country_preferences:
+        location_match = np.where(
+            features["has_country"],
+            np.where(features["location_match"], 15, 0),
+            5
+        )
+    else:
+        location_match = np.full(n, 5)
+    
+    desc_length = features["desc_length"]
+    jd_quality = np.where(desc_length > 1000, 10, np.where(desc_length > 500, 7, 4))
+    
+    components = {
+        "role_match": role_match,
+        "cloud_match": cloud_match,
+        "visa_match": visa_match,
+        "salary_match": salary_match,
+        "location_match": location_match,
+        "jd_quality": jd_quality
+    }
+    
+    components["score"] = np.minimum(sum(components[name] for name in SCORE_COMPONENTS), 100)
+    return components
+
+
+def calculate_job_scores(
+    jobs: Sequence[Mapping[str, Any]],
+    user_role_preferences: List[str],
+    user_country_preferences: List[str],
+    user_min_salary: Optional[int],
+    user_visa_required: bool
+) -> List[Dict[str, Any]]:
+    if not jobs:
+        return []
+    
+    features = extract_score_features(jobs, user_role_preferences, user_country_preferences)
+    scored = score_features(
+        features,
+        has_role_preferences=bool(user_role_preferences),
+        has_country_preferences=bool(user_country_preferences),
+        user_min_salary=user_min_salary,
+        user_visa_required=user_visa_required
+    )
+    
+    columns = {name: scored[name].tolist() for name in SCORE_COMPONENTS}
+    scores = scored["score"].tolist()
+    
+    return [
+        {
+            "score": scores[i],
+            "breakdown": {name: columns[name][i] for name in SCORE_COMPONENTS}
+        }
+        for i in range(len(jobs))
+    ]
+
+
+def calculate_job_scores_for_user(jobs: Sequence[Mapping[str, Any]], user: Optional[User]) -> List[Dict[str, Any]]:
+    if not user:
+        return [{"score": 50, "breakdown": {}} for _ in jobs]
+    
+    return calculate_job_scores(
+        jobs,
+        user_role_preferences=user.role_preferences,
+        user_country_preferences=user.country_preferences,
+        user_min_salary=user.min_salary,
+        user_visa_required=user.visa_required
+    )
+
+
+def score_profile_fingerprint(user: User) -> str:
+    profile = {
+        "role_preferences": user.role_preferences or [],
+        "country_preferences": user.country_preferences or [],
+        "min_salary": user.min_salary,
+        "visa_required": user.visa_required
+    }
+    return hashlib.sha256(json.dumps(profile, sort_keys=True).encode()).hexdigest()
+
+
+def rescore_all_jobs(session: Session, user: User, chunk_size: int = 1000) -> int:
+    last_id = 0
+    rescored = 0
+    
+    while True:
+        statement = (
+            select(*SCORE_FEATURE_COLUMNS)
+            .where(Job.id > last_id)
+            .order_by(Job.id)
+            .limit(chunk_size)
+        )
+        rows = [row._mapping for row in session.exec(statement).all()]
+        if not rows:
+            break
+        
+        results = calculate_job_scores_for_user(rows, user)
+        
+        session.execute(
+            update(Job),
+            [
+                {"id": row["id"], "score": result["score"], "score_breakdown": result["breakdown"]}
+                for row, result in zip(rows, results)
+            ]
+        )
+        session.commit()
+        
+        last_id = rows[-1]["id"]
+        rescored += len(rows)
+    
+    return rescored
+
+
+def rescore_jobs_if_profile_changed(session: Session, force: bool = False, chunk_size: int = 1000) -> Dict[str, Any]:
+    user = session.exec(select(User).where(User.id == 1)).first()
+    if not user:
+        return {"rescored": 0, "profile_changed": False, "message": "No user profile to score against"}
+    
+    settings = session.exec(select(Settings).where(Settings.user_id == 1)).first()
+    if not settings:
+        settings = Settings(user_id=1)
+    
+    fingerprint = score_profile_fingerprint(user)
+    profile_changed = settings.score_profile != fingerprint
+    
+    if not profile_changed and not force:
+        return {"rescored": 0, "profile_changed": False, "message": "Scoring profile unchanged"}
+    
+    rescored = rescore_all_jobs(session, user, chunk_size)
+    
+    settings.score_profile = fingerprint
+    session.add(settings)
+    session.commit()
+    
+    logger.info(f"Rescored {rescored} jobs against the current user profile")
+    
+    return {"rescored": rescored, "profile_changed": profile_changed, "message": f"Rescored {rescored} jobs"}
+
+
+def ensure_score_profile_schema(engine: Engine) -> None:
+    existing = {column["name"] for column in inspect(engine).get_columns("settings")}
+    if "score_profile" in existing:
+        return
+    
+    with engine.begin() as connection:
+        column_type = Settings.__table__.c["score_profile"].type.compile(dialect=engine.dialect)
+        connection.execute(text(f"ALTER TABLE settings ADD COLUMN score_profile {column_type}"))
+    
+    with Session(engine) as session:
+        for settings in session.exec(select(Settings)).all():
+            preferences = dict(settings.preferences or {})
+            if "score_profile" not in preferences:
+                continue
+            settings.score_profile = preferences.pop("score_profile")
+            settings.preferences = preferences
+            session.add(settings)
+        session.commit()
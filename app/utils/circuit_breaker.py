@@ -0,0 +1,94 @@
+import threading
+import time
+from typing import Any, Dict
+import httpx
+import openai
+from app.config import settings
+from app.utils.logger import logger
+
+UPSTREAM_FAILURES = (
+    openai.APIConnectionError,
+    openai.InternalServerError,
+    httpx.TimeoutException,
+    httpx.TransportError
+)
+
+
+class CircuitOpenError(Exception):
+    pass
+
+
+class CircuitBreaker:
+    def __init__(self, name: str, failure_threshold: int, reset_timeout: float):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self.trips = 0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+    
+    def before_call(self) -> None:
+        with self._lock:
+            if self.state == "open":
+                remaining = self.opened_at + self.reset_timeout - time.monotonic()
+                if remaining > 0:
+                    raise CircuitOpenError(f"{self.name} circuit is open, retrying in {remaining:.0f}s")
+                self.state = "half_open"
+                logger.info(f"{self.name} circuit half-open, sending a probe request")
+            
+            if self.state == "half_open":
+                if self._probe_in_flight:
+                    raise CircuitOpenError(f"{self.name} circuit is half-open and a probe is in flight")
+                self._probe_in_flight = True
+    
+    def record_success(self) -> None:
+        with self._lock:
+            if self.state != "closed":
+                logger.info(f"{self.name} circuit closed")
+            self.state = "closed"
+            self.failures = 0
+            self._probe_in_flight = False
+    
+    def record_failure(self) -> None:
+        with self._lock:
+            self._probe_in_flight = False
+            self.failures += 1
+            if self.state == "half_open" or (self.state == "closed" and self.failures >= self.failure_threshold):
+                self.state = "open"
+                self.opened_at = time.monotonic()
+                self.trips += 1
+                logger.warning(
+                    f"{self.name} circuit opened after {self.failures} consecutive failures, "
+                    f"failing fast for {self.reset_timeout:.0f}s"
+                )
+    
+    def release(self) -> None:
+        with self._lock:
+            self._probe_in_flight = False
+    
+    def record(self, error: BaseException) -> None:
+        if isinstance(error, UPSTREAM_FAILURES):
+            self.record_failure()
+        elif isinstance(error, openai.APIStatusError) and not isinstance(error, openai.RateLimitError):
+            self.record_success()
+        else:
+            self.release()
+    
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            retry_in = self.opened_at + self.reset_timeout - time.monotonic() if self.state == "open" else 0
+            return {
+                "name": self.name,
+                "state": self.state,
+                "consecutive_failures": self.failures,
+                "failure_threshold": self.failure_threshold,
+                "reset_timeout": self.reset_timeout,
+                "retry_in": round(max(0.0, retry_in), 1),
+                "trips": self.trips
+            }
+
+
+openai_breaker = CircuitBreaker("openai", settings.ai_breaker_failure_threshold, settings.ai_breaker_reset_seconds)
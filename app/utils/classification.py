@@ -1,4 +1,7 @@
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Set, Tuple
+from app.utils.keyword_matcher import KeywordMatcher
+from app.utils.visa_detector import VISA_KEYWORDS
 
 CLOUD_ROLES = [
     "cloud engineer",
@@ -58,19 +61,36 @@ ROLE_CLASSIFICATIONS = {
 }
 
 
-def classify_job(title: str, description: str) -> Optional[str]:
-    title_lower = title.lower()
-    desc_lower = description.lower()
-    combined = f"{title_lower} {desc_lower}"
-    
-    for coding_role in CODING_HEAVY_ROLES:
-        if coding_role in title_lower:
-            return None
+CODING_HEAVY_ROLE_SET = frozenset(CODING_HEAVY_ROLES)
+
+VISA_KEYWORD_SET = frozenset(VISA_KEYWORDS)
+
+
+@lru_cache(maxsize=32)
+def get_job_matcher(excluded_roles: Tuple[str, ...] = ()) -> KeywordMatcher:
+    keywords = list(CLOUD_ROLES) + list(CODING_HEAVY_ROLES)
+    for role_keywords in ROLE_CLASSIFICATIONS.values():
+        keywords.extend(role_keywords)
+    keywords.extend(excluded_roles)
+    return KeywordMatcher(keywords)
+
+
+@lru_cache(maxsize=32)
+def get_description_matcher(excluded_roles: Tuple[str, ...] = ()) -> KeywordMatcher:
+    return KeywordMatcher(list(VISA_KEYWORDS) + list(excluded_roles))
+
+
+def _normalize_excluded(excluded_roles: Optional[list]) -> Tuple[str, ...]:
+    return tuple(excluded.lower() for excluded in excluded_roles or [])
+
+
+def _classify(title_hits: Set[str], desc_lower: str) -> Optional[str]:
+    if not title_hits.isdisjoint(CODING_HEAVY_ROLE_SET):
+        return None
     
     for classification, keywords in ROLE_CLASSIFICATIONS.items():
-        for keyword in keywords:
-            if keyword in title_lower:
-                return classification
+        if not title_hits.isdisjoint(keywords):
+            return classification
     
     for classification, keywords in ROLE_CLASSIFICATIONS.items():
         for keyword in keywords:
@@ -80,19 +100,44 @@ def classify_job(title: str, description: str) -> Optional[str]:
     return None
 
 
+def classify_job(title: str, description: str) -> Optional[str]:
+    title_hits = set(get_job_matcher().find_all(title))
+    return _classify(title_hits, description.lower())
+
+
 def is_excluded_role(title: str, description: str, excluded_roles: list = None) -> bool:
-    if excluded_roles is None:
-        excluded_roles = []
+    excluded = _normalize_excluded(excluded_roles)
+    title_hits = get_job_matcher(excluded).find_all(title)
+    
+    if not CODING_HEAVY_ROLE_SET.isdisjoint(title_hits):
+        return True
     
-    title_lower = title.lower()
+    if not excluded:
+        return False
+    
+    if not set(excluded).isdisjoint(title_hits):
+        return True
+    
+    desc_lower = description.lower()
+    return any(role in desc_lower for role in excluded)
+
+
+def analyze_job(title: str, description: str, excluded_roles: list = None) -> Dict[str, Any]:
+    excluded = _normalize_excluded(excluded_roles)
     desc_lower = description.lower()
     
-    for coding_role in CODING_HEAVY_ROLES:
-        if coding_role in title_lower:
-            return True
+    title_hits = set(get_job_matcher(excluded).find_all(title))
+    desc_hits: List[str] = get_description_matcher(excluded).find_all_lower(desc_lower)
+    
+    visa_keywords = [keyword for keyword in desc_hits if keyword in VISA_KEYWORD_SET]
     
-    for excluded in excluded_roles:
-        if excluded.lower() in title_lower or excluded.lower() in desc_lower:
-            return True
+    is_excluded = not title_hits.isdisjoint(CODING_HEAVY_ROLE_SET) or any(
+        role in title_hits or role in desc_hits for role in excluded
+    )
     
-    return False
+    return {
+        "classification": _classify(title_hits, desc_lower),
+        "is_excluded": is_excluded,
+        "has_visa": len(visa_keywords) > 0,
+        "visa_keywords": visa_keywords
+    }
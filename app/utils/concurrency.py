@@ -0,0 +1,51 @@
+import asyncio
+import functools
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, TypeVar
+from app.config import settings
+
+T = TypeVar("T")
+
+BLOCKING_POOL_SIZES = {
+    "smtp": settings.smtp_workers,
+    "ai": settings.ai_workers,
+    "pdf": settings.pdf_workers,
+    "scrape": settings.scrape_workers,
+    "db": settings.db_workers,
+    "parse": settings.parse_workers
+}
+
+_executors: Dict[str, Executor] = {}
+
+_EXHAUSTED = object()
+
+
+def get_executor(pool: str) -> Executor:
+    executor = _executors.get(pool)
+    if executor is None:
+        if pool not in BLOCKING_POOL_SIZES:
+            raise ValueError(f"Unknown blocking pool: {pool}")
+        executor = _executors[pool] = ThreadPoolExecutor(
+            max_workers=BLOCKING_POOL_SIZES[pool],
+            thread_name_prefix=f"{pool}-pool"
+        )
+    return executor
+
+
+async def run_blocking(pool: str, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(pool), functools.partial(func, *args, **kwargs))
+
+
+async def iterate_blocking(pool: str, iterator: Iterator[T]) -> AsyncIterator[T]:
+    while True:
+        item = await run_blocking(pool, next, iterator, _EXHAUSTED)
+        if item is _EXHAUSTED:
+            break
+        yield item
+
+
+def shutdown_blocking_pools() -> None:
+    for executor in _executors.values():
+        executor.shutdown(wait=False, cancel_futures=True)
+    _executors.clear()
@@ -0,0 +1,92 @@
+from typing import Any, Dict, List
+from sqlalchemy import func
+from sqlmodel import Session, select
+from app.models.job import Job
+from app.models.resume import Resume
+
+CALLBACK_STATUSES = ["interviewing", "offered"]
+OFFER_STATUS = "offered"
+
+
+def _status_counts():
+    return (
+        func.count().filter(Job.application_status.in_(CALLBACK_STATUSES)),
+        func.count().filter(Job.application_status == OFFER_STATUS)
+    )
+
+
+def _applied_breakdown(session: Session, column) -> Dict[str, Dict[str, int]]:
+    callbacks, offers = _status_counts()
+    statement = (
+        select(column, func.count(), callbacks, offers)
+        .where(Job.applied == True, column.is_not(None), column != "")
+        .group_by(column)
+    )
+    
+    return {
+        key: {"applied": applied, "callbacks": callback_count, "offers": offer_count}
+        for key, applied, callback_count, offer_count in session.exec(statement).all()
+    }
+
+
+def _application_day(session: Session):
+    if session.get_bind().dialect.name == "postgresql":
+        return func.date_trunc("day", Job.application_date)
+    return func.date(Job.application_date)
+
+
+def _timeline(session: Session) -> List[Dict[str, Any]]:
+    day = _application_day(session).label("day")
+    statement = (
+        select(day, func.count())
+        .where(Job.applied == True, Job.application_date.is_not(None))
+        .group_by(day)
+        .order_by(day)
+    )
+    
+    timeline = []
+    for day_value, applications in session.exec(statement).all():
+        date_key = day_value if isinstance(day_value, str) else day_value.strftime("%Y-%m-%d")
+        timeline.append({"date": date_key, "applications": applications})
+    
+    return timeline
+
+
+def compute_dashboard_metrics(session: Session) -> Dict[str, Any]:
+    callbacks, offers = _status_counts()
+    total_jobs, total_applications, callback_count, offer_count = session.exec(
+        select(func.count(), func.count().filter(Job.applied == True), callbacks, offers).select_from(Job)
+    ).one()
+    
+    callback_rate = (callback_count / total_applications * 100) if total_applications > 0 else 0
+    offer_rate = (offer_count / total_applications * 100) if total_applications > 0 else 0
+    
+    template_statement = (
+        select(
+            Resume.template_type,
+            func.coalesce(func.sum(Resume.times_used), 0),
+            func.coalesce(func.sum(Resume.callback_count), 0),
+            func.coalesce(func.sum(Resume.offer_count), 0)
+        )
+        .group_by(Resume.template_type)
+    )
+    template_stats = {
+        template: {"used": int(used), "callbacks": int(template_callbacks), "offers": int(template_offers)}
+        for template, used, template_callbacks, template_offers in session.exec(template_statement).all()
+    }
+    
+    return {
+        "overview": {
+            "total_jobs": total_jobs,
+            "total_applications": total_applications,
+            "pending_applications": total_jobs - total_applications,
+            "callback_count": callback_count,
+            "offer_count": offer_count,
+            "callback_rate": round(callback_rate, 2),
+            "offer_rate": round(offer_rate, 2)
+        },
+        "country_success": _applied_breakdown(session, Job.country),
+        "role_success": _applied_breakdown(session, Job.classification),
+        "template_success": template_stats,
+        "timeline": _timeline(session)
+    }
@@ -0,0 +1,332 @@
+import hashlib
+import re
+import unicodedata
+import zlib
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+import numpy as np
+from sqlalchemy import delete, insert, inspect, text, update
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, select
+from app.models.job import Job
+from app.models.job_duplicate import JobDuplicate, JobLshBand
+from app.utils.logger import logger
+
+TRACKING_PARAMS = {"gclid", "fbclid", "msclkid", "ref", "refid", "referrer", "src", "source", "trk", "trackingid", "mc_cid", "mc_eid"}
+TRACKING_PREFIXES = ("utm_",)
+
+SHINGLE_SIZE = 3
+MINHASH_PERMUTATIONS = 128
+LSH_BANDS = 16
+LSH_ROWS = MINHASH_PERMUTATIONS // LSH_BANDS
+NEAR_DUPLICATE_THRESHOLD = 0.8
+MINHASH_SEED = 20240101
+
+QUERY_CHUNK_SIZE = 1000
+BACKFILL_CHUNK_SIZE = 1000
+
+UNIQUE_DEDUP_COLUMNS = ["canonical_url", "content_hash"]
+DEDUP_COLUMNS = UNIQUE_DEDUP_COLUMNS + ["minhash"]
+
+_rng = np.random.default_rng(MINHASH_SEED)
+_PERMUTATION_A = _rng.integers(0, np.iinfo(np.uint64).max, size=MINHASH_PERMUTATIONS, dtype=np.uint64, endpoint=True) | np.uint64(1)
+_PERMUTATION_B = _rng.integers(0, np.iinfo(np.uint64).max, size=MINHASH_PERMUTATIONS, dtype=np.uint64, endpoint=True)
+
+
+class DuplicateMatch(NamedTuple):
+    match_type: str
+    similarity: float
+    job_id: Optional[int] = None
+    row_index: Optional[int] = None
+
+
+def _field(job: Any, name: str) -> Any:
+    return job[name] if isinstance(job, dict) else getattr(job, name)
+
+
+def _chunks(values: Sequence[Any], size: int = QUERY_CHUNK_SIZE):
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def _is_tracking_param(name: str) -> bool:
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+
+def canonicalize_url(url: Optional[str]) -> Optional[str]:
+    if not url:
+        return None
+    
+    try:
+        parts = urlsplit(url.strip())
+        port = parts.port
+    except ValueError:
+        return None
+    
+    if parts.scheme.lower() not in ("http", "https") or not parts.hostname:
+        return None
+    
+    host = parts.hostname.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if port and port not in (80, 443):
+        host = f"{host}:{port}"
+    
+    path = re.sub(r"/{2,}", "/", parts.path).rstrip("/") or "/"
+    query = sorted(
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not _is_tracking_param(name)
+    )
+    
+    return urlunsplit(("https", host, path, urlencode(query), ""))
+
+
+def _tokens(value: Optional[str]) -> List[str]:
+    return re.findall(r"\w+", unicodedata.normalize("NFKC", value or "").lower())
+
+
+def _normalized(*values: Optional[str]) -> str:
+    return "\x1f".join(" ".join(_tokens(value)) for value in values)
+
+
+def content_hash(title: str, company: str, location: Optional[str], country: Optional[str], description: str) -> str:
+    return hashlib.sha256(_normalized(title, company, location, country, description).encode()).hexdigest()
+
+
+def minhash_signature(value: Optional[str]) -> Optional[List[int]]:
+    tokens = _tokens(value)
+    if not tokens:
+        return None
+    
+    shingles = {
+        " ".join(tokens[start:start + SHINGLE_SIZE])
+        for start in range(max(1, len(tokens) - SHINGLE_SIZE + 1))
+    }
+    hashes = np.fromiter((zlib.crc32(shingle.encode()) for shingle in shingles), dtype=np.uint64, count=len(shingles))
+    
+    permuted = (np.outer(_PERMUTATION_A, hashes) + _PERMUTATION_B[:, None]) >> np.uint64(32)
+    return permuted.min(axis=1).tolist()
+
+
+def band_keys(signature: Sequence[int]) -> List[str]:
+    values = np.asarray(signature, dtype=np.uint64)
+    return [
+        f"{band}:{hashlib.blake2b(values[band * LSH_ROWS:(band + 1) * LSH_ROWS].tobytes(), digest_size=12).hexdigest()}"
+        for band in range(LSH_BANDS)
+    ]
+
+
+def signature_similarity(first: Sequence[int], second: Sequence[int]) -> float:
+    return float(np.mean(np.asarray(first, dtype=np.uint64) == np.asarray(second, dtype=np.uint64)))
+
+
+def dedup_keys(
+    title: str,
+    company: str,
+    location: Optional[str],
+    country: Optional[str],
+    description: str,
+    url: Optional[str]
+) -> Dict[str, Any]:
+    return {
+        "canonical_url": canonicalize_url(url),
+        "content_hash": content_hash(title, company, location, country, description),
+        "minhash": minhash_signature(description)
+    }
+
+
+def _lookup(session: Session, column, values: Iterable[Any], *selected) -> List[Any]:
+    values = list(values)
+    return [
+        row
+        for chunk in _chunks(values)
+        for row in session.exec(select(*selected).where(column.in_(chunk))).all()
+    ]
+
+
+def job_ids_by_hash(session: Session, hashes: Iterable[str]) -> Dict[str, int]:
+    return {digest: job_id for job_id, digest in _lookup(session, Job.content_hash, set(hashes), Job.id, Job.content_hash)}
+
+
+def find_duplicates(session: Session, rows: Sequence[Any]) -> List[Optional[DuplicateMatch]]:
+    urls = [_field(row, "canonical_url") for row in rows]
+    hashes = [_field(row, "content_hash") for row in rows]
+    signatures = [_field(row, "minhash") for row in rows]
+    places = [_normalized(_field(row, "location"), _field(row, "country")) for row in rows]
+    keys = [band_keys(signature) if signature else [] for signature in signatures]
+    
+    existing_urls = {
+        url: job_id
+        for job_id, url in _lookup(session, Job.canonical_url, {url for url in urls if url}, Job.id, Job.canonical_url)
+    }
+    existing_hashes = job_ids_by_hash(session, {digest for digest in hashes if digest})
+    
+    candidates_by_key: Dict[str, List[int]] = defaultdict(list)
+    for band_key, job_id in _lookup(
+        session, JobLshBand.band_key, {key for row_keys in keys for key in row_keys}, JobLshBand.band_key, JobLshBand.job_id
+    ):
+        candidates_by_key[band_key].append(job_id)
+    
+    candidates = {
+        job_id: (signature, _normalized(location, country))
+        for job_id, signature, location, country in _lookup(
+            session,
+            Job.id,
+            {job_id for ids in candidates_by_key.values() for job_id in ids},
+            Job.id,
+            Job.minhash,
+            Job.location,
+            Job.country
+        )
+        if signature
+    }
+    
+    batch_urls: Dict[str, int] = {}
+    batch_hashes: Dict[str, int] = {}
+    batch_bands: Dict[str, List[int]] = defaultdict(list)
+    matches: List[Optional[DuplicateMatch]] = []
+    
+    for index, (url, digest, signature, place, row_keys) in enumerate(zip(urls, hashes, signatures, places, keys)):
+        match = None
+        
+        if url and url in existing_urls:
+            match = DuplicateMatch("url", 1.0, job_id=existing_urls[url])
+        elif digest and digest in existing_hashes:
+            match = DuplicateMatch("content", 1.0, job_id=existing_hashes[digest])
+        elif url and url in batch_urls:
+            match = DuplicateMatch("url", 1.0, row_index=batch_urls[url])
+        elif digest and digest in batch_hashes:
+            match = DuplicateMatch("content", 1.0, row_index=batch_hashes[digest])
+        elif signature:
+            for job_id in {job_id for key in row_keys for job_id in candidates_by_key.get(key, ())}:
+                if job_id in candidates and candidates[job_id][1] == place:
+                    similarity = signature_similarity(signature, candidates[job_id][0])
+                    if similarity >= NEAR_DUPLICATE_THRESHOLD and (match is None or similarity > match.similarity):
+                        match = DuplicateMatch("near", similarity, job_id=job_id)
+            
+            for other in {other for key in row_keys for other in batch_bands.get(key, ())}:
+                if places[other] != place:
+                    continue
+                similarity = signature_similarity(signature, signatures[other])
+                if similarity >= NEAR_DUPLICATE_THRESHOLD and (match is None or similarity > match.similarity):
+                    match = DuplicateMatch("near", similarity, row_index=other)
+        
+        matches.append(match)
+        
+        if match is None:
+            if url:
+                batch_urls[url] = index
+            if digest:
+                batch_hashes[digest] = index
+            for key in row_keys:
+                batch_bands[key].append(index)
+    
+    return matches
+
+
+def record_duplicate(session: Session, job_id: int, row: Any, match: DuplicateMatch) -> None:
+    session.add(JobDuplicate(
+        job_id=job_id,
+        match_type=match.match_type,
+        similarity=round(match.similarity, 4),
+        title=_field(row, "title"),
+        company=_field(row, "company"),
+        url=_field(row, "url"),
+        source=_field(row, "source")
+    ))
+
+
+def index_job_bands(session: Session, jobs: Iterable[Tuple[int, Optional[List[int]]]]) -> None:
+    rows = [
+        {"band_key": key, "job_id": job_id}
+        for job_id, signature in jobs
+        if signature
+        for key in band_keys(signature)
+    ]
+    if rows:
+        session.execute(insert(JobLshBand), rows)
+
+
+def remove_job_dedup_entries(session: Session, job_id: int) -> None:
+    session.execute(delete(JobLshBand).where(JobLshBand.job_id == job_id))
+    session.execute(delete(JobDuplicate).where(JobDuplicate.job_id == job_id))
+
+
+def refresh_job_dedup(session: Session, job: Job) -> None:
+    for key, value in dedup_keys(job.title, job.company, job.location, job.country, job.description, job.url).items():
+        setattr(job, key, value)
+    
+    session.execute(delete(JobLshBand).where(JobLshBand.job_id == job.id))
+    index_job_bands(session, [(job.id, job.minhash)])
+
+
+def backfill_dedup_keys(engine: Engine) -> Tuple[int, int]:
+    seen_urls = set()
+    seen_hashes = set()
+    backfilled = 0
+    collisions = 0
+    last_id = 0
+    
+    with Session(engine) as session:
+        while True:
+            jobs = session.exec(
+                select(Job.id, Job.title, Job.company, Job.location, Job.country, Job.description, Job.url)
+                .where(Job.id > last_id)
+                .order_by(Job.id)
+                .limit(BACKFILL_CHUNK_SIZE)
+            ).all()
+            if not jobs:
+                break
+            
+            updates = []
+            for job_id, title, company, location, country, description, url in jobs:
+                keys = dedup_keys(title, company, location, country, description, url)
+                
+                if keys["content_hash"] in seen_hashes or (keys["canonical_url"] and keys["canonical_url"] in seen_urls):
+                    keys["canonical_url"] = keys["content_hash"] = None
+                    collisions += 1
+                else:
+                    seen_hashes.add(keys["content_hash"])
+                    if keys["canonical_url"]:
+                        seen_urls.add(keys["canonical_url"])
+                
+                updates.append({"id": job_id, **keys})
+            
+            session.execute(update(Job), updates)
+            session.execute(delete(JobLshBand).where(JobLshBand.job_id.in_([row["id"] for row in updates])))
+            index_job_bands(session, [(row["id"], row["minhash"]) for row in updates])
+            session.commit()
+            
+            backfilled += len(updates)
+            last_id = jobs[-1][0]
+    
+    return backfilled, collisions
+
+
+def _dedup_keys_current(engine: Engine) -> bool:
+    with Session(engine) as session:
+        job = session.exec(select(Job).where(Job.content_hash.is_not(None)).limit(1)).first()
+    return job is None or job.content_hash == content_hash(job.title, job.company, job.location, job.country, job.description)
+
+
+def ensure_dedup_schema(engine: Engine) -> None:
+    existing = {column["name"] for column in inspect(engine).get_columns("jobs")}
+    missing = [name for name in DEDUP_COLUMNS if name not in existing]
+    if not missing and _dedup_keys_current(engine):
+        return
+    
+    with engine.begin() as connection:
+        for name in missing:
+            column_type = Job.__table__.c[name].type.compile(dialect=engine.dialect)
+            connection.execute(text(f"ALTER TABLE jobs ADD COLUMN {name} {column_type}"))
+    
+    backfilled, collisions = backfill_dedup_keys(engine)
+    
+    with engine.begin() as connection:
+        for name in UNIQUE_DEDUP_COLUMNS:
+            connection.execute(text(f"CREATE UNIQUE INDEX IF NOT EXISTS ix_jobs_{name} ON jobs ({name})"))
+    
+    logger.info(f"Added dedup keys to {backfilled} existing jobs ({collisions} existing duplicates left unkeyed)")
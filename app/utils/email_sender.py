@@ -2,12 +2,19 @@ import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.application import MIMEApplication
+from email.mime.base import MIMEBase
 from typing import Optional, Dict, List
 from pathlib import Path
 from app.utils.logger import logger
 from app.config import settings
 
 
+def pdf_attachment(data: bytes, filename: str) -> MIMEApplication:
+    attachment = MIMEApplication(data, _subtype='pdf')
+    attachment.add_header('Content-Disposition', 'attachment', filename=filename)
+    return attachment
+
+
 class EmailSender:
     def __init__(self, email_identities: Optional[List[Dict[str, str]]] = None):
         self.email_identities = email_identities or []
@@ -33,7 +40,8 @@ class EmailSender:
         subject: str,
         body: str,
         attachment_path: Optional[str] = None,
-        sender_override: Optional[str] = None
+        sender_override: Optional[str] = None,
+        attachment: Optional[MIMEBase] = None
     ) -> Dict[str, any]:
         try:
             identity = self._get_next_identity()
@@ -56,15 +64,10 @@ class EmailSender:
             
             msg.attach(MIMEText(body, 'plain'))
             
-            if attachment_path and Path(attachment_path).exists():
-                with open(attachment_path, 'rb') as f:
-                    attachment = MIMEApplication(f.read(), _subtype='pdf')
-                    attachment.add_header(
-                        'Content-Disposition',
-                        'attachment',
-                        filename=Path(attachment_path).name
-                    )
-                    msg.attach(attachment)
+            if attachment is not None:
+                msg.attach(attachment)
+            elif attachment_path and Path(attachment_path).exists():
+                msg.attach(pdf_attachment(Path(attachment_path).read_bytes(), Path(attachment_path).name))
             
             with smtplib.SMTP(smtp_server, smtp_port) as server:
                 server.starttls()
@@ -0,0 +1,115 @@
+import re
+from typing import Optional
+from sqlalchemy import func, literal_column, select as sa_select, text
+from sqlalchemy.engine import Engine
+from sqlmodel import select
+from app.models.job import Job
+from app.utils.logger import logger
+
+SEARCH_CONFIG = "english"
+
+RELEVANCE_WEIGHT = 0.7
+SCORE_WEIGHT = 0.3
+
+SCORE_RANK = func.coalesce(Job.score, literal_column("0"))
+
+POSTGRES_SEARCH_DDL = [
+    f"""ALTER TABLE jobs ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B')
+    ) STORED""",
+    "CREATE INDEX IF NOT EXISTS ix_jobs_search_vector ON jobs USING GIN (search_vector)"
+]
+
+SQLITE_SEARCH_DDL = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+        title, description, content='jobs', content_rowid='id', tokenize='porter unicode61'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS jobs_fts_insert AFTER INSERT ON jobs BEGIN
+        INSERT INTO jobs_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS jobs_fts_delete AFTER DELETE ON jobs BEGIN
+        INSERT INTO jobs_fts(jobs_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS jobs_fts_update AFTER UPDATE OF title, description ON jobs BEGIN
+        INSERT INTO jobs_fts(jobs_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO jobs_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END"""
+]
+
+
+def ensure_search_index(engine: Engine) -> None:
+    dialect = engine.dialect.name
+    
+    with engine.begin() as connection:
+        if dialect == "postgresql":
+            for statement in POSTGRES_SEARCH_DDL:
+                connection.execute(text(statement))
+        
+        elif dialect == "sqlite":
+            exists = connection.execute(
+                text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'jobs_fts'")
+            ).first()
+            
+            for statement in SQLITE_SEARCH_DDL:
+                connection.execute(text(statement))
+            
+            if not exists:
+                connection.execute(text("INSERT INTO jobs_fts(jobs_fts) VALUES ('rebuild')"))
+        
+        else:
+            logger.warning(f"Full-text search is not supported on {dialect}, falling back to LIKE search")
+
+
+def _fts5_query(query: str) -> Optional[str]:
+    included = []
+    excluded = []
+    for term in query.split():
+        tokens = re.findall(r"\w+", term)
+        if tokens:
+            phrase = '"' + " ".join(tokens) + '"'
+            (excluded if term.startswith("-") else included).append(phrase)
+    
+    if not included:
+        return None
+    
+    match = " ".join(included)
+    for token in excluded:
+        match = f"({match}) NOT {token}"
+    return match
+
+
+def _combined_rank(relevance):
+    return relevance * RELEVANCE_WEIGHT + SCORE_RANK / 100.0 * SCORE_WEIGHT
+
+
+def build_job_search(query: Optional[str], dialect: str):
+    if not query:
+        return select(Job), SCORE_RANK
+    
+    if dialect == "postgresql":
+        ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, query)
+        search_vector = literal_column("jobs.search_vector")
+        relevance = func.ts_rank_cd(search_vector, ts_query, 32)
+        
+        statement = select(Job).where(search_vector.op("@@")(ts_query))
+        return statement, _combined_rank(relevance)
+    
+    if dialect == "sqlite":
+        match = _fts5_query(query)
+        if match:
+            bm25 = func.bm25(literal_column("jobs_fts"), 2.0, 1.0)
+            matches = (
+                sa_select(literal_column("rowid").label("job_id"), (-bm25).label("bm25_score"))
+                .select_from(text("jobs_fts"))
+                .where(text("jobs_fts MATCH :fts_query").bindparams(fts_query=match))
+                .subquery()
+            )
+            relevance = matches.c.bm25_score / (matches.c.bm25_score + 1.0)
+            
+            statement = select(Job).join(matches, matches.c.job_id == Job.id)
+            return statement, _combined_rank(relevance)
+    
+    statement = select(Job).where(Job.title.contains(query) | Job.description.contains(query))
+    return statement, SCORE_RANK
@@ -0,0 +1,241 @@
+import io
+import json
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session
+from app.models.job import Job
+from app.models.user import User
+from app.schemas.job_schema import JobCreate
+from app.utils.classification import analyze_job
+from app.utils.batch_scoring import calculate_job_scores_for_user
+from app.utils.metrics_rollup import record_job_change, record_job_changes, rollup_key
+from app.utils.dedup import DuplicateMatch, dedup_keys, find_duplicates, index_job_bands, job_ids_by_hash, record_duplicate
+from app.utils.parser import CsvParseError
+from app.utils.logger import logger
+
+JOB_INSERT_COLUMNS = [column.name for column in Job.__table__.columns if column.name != "id"]
+
+JSON_COLUMNS = {"visa_keywords", "score_breakdown", "job_metadata", "minhash"}
+
+
+def build_job_row(job_create: JobCreate) -> Dict[str, Any]:
+    analysis = analyze_job(job_create.title, job_create.description)
+    
+    job = Job(
+        **job_create.dict(),
+        classification=analysis["classification"],
+        has_visa_sponsorship=analysis["has_visa"],
+        visa_keywords=analysis["visa_keywords"],
+        **dedup_keys(job_create.title, job_create.company, job_create.location, job_create.country, job_create.description, job_create.url)
+    )
+    
+    return {column: getattr(job, column) for column in JOB_INSERT_COLUMNS}
+
+
+def score_job_rows(rows: List[Dict[str, Any]], user: Optional[User]) -> None:
+    for row, result in zip(rows, calculate_job_scores_for_user(rows, user)):
+        row["score"] = result["score"]
+        row["score_breakdown"] = result["breakdown"]
+
+
+def _copy_value(column: str, value: Any) -> str:
+    if value is None:
+        return "\\N"
+    if column in JSON_COLUMNS:
+        value = json.dumps(value)
+    elif isinstance(value, bool):
+        return "t" if value else "f"
+    elif isinstance(value, datetime):
+        value = value.isoformat()
+    
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def _copy_job_rows(session: Session, rows: List[Dict[str, Any]]) -> None:
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write("\t".join(_copy_value(column, row[column]) for column in JOB_INSERT_COLUMNS))
+        buffer.write("\n")
+    buffer.seek(0)
+    
+    statement = f"COPY jobs ({', '.join(JOB_INSERT_COLUMNS)}) FROM STDIN"
+    raw_connection = session.connection().connection.driver_connection
+    with raw_connection.cursor() as cursor:
+        try:
+            cursor.copy_expert(statement, buffer)
+        except session.get_bind().dialect.dbapi.IntegrityError as e:
+            raise IntegrityError(statement, None, e) from e
+
+
+def bulk_insert_jobs(session: Session, rows: List[Dict[str, Any]], use_copy: bool = True) -> None:
+    if not rows:
+        return
+    
+    dialect = session.get_bind().dialect
+    
+    if use_copy and dialect.name == "postgresql" and dialect.driver == "psycopg2":
+        _copy_job_rows(session, rows)
+    else:
+        session.execute(insert(Job), rows)
+
+
+def _link_duplicate(session: Session, job: Job, match: DuplicateMatch) -> Tuple[Job, DuplicateMatch]:
+    record_duplicate(session, match.job_id, job, match)
+    logger.info(f"Linked duplicate '{job.title}' to job {match.job_id} ({match.match_type} match)")
+    return session.get(Job, match.job_id), match
+
+
+def ingest_job(session: Session, job: Job) -> Tuple[Job, Optional[DuplicateMatch]]:
+    match = find_duplicates(session, [job])[0]
+    if match:
+        return _link_duplicate(session, job, match)
+    
+    try:
+        with session.begin_nested():
+            session.add(job)
+            session.flush()
+    except IntegrityError:
+        match = find_duplicates(session, [job])[0]
+        if match is None:
+            raise
+        logger.info(f"Job '{job.title}' was inserted concurrently, linking it as a duplicate")
+        return _link_duplicate(session, job, match)
+    
+    index_job_bands(session, [(job.id, job.minhash)])
+    record_job_change(session, None, rollup_key(job))
+    return job, None
+
+
+def _insert_unique_rows(session: Session, rows: List[Tuple[int, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    matches = find_duplicates(session, [row for _, row in rows])
+    while True:
+        unique = [row for (_, row), match in zip(rows, matches) if match is None]
+        try:
+            with session.begin_nested():
+                bulk_insert_jobs(session, unique)
+            break
+        except IntegrityError:
+            rechecked = find_duplicates(session, [row for _, row in rows])
+            if rechecked == matches:
+                raise
+            matches = rechecked
+            logger.info(f"Jobs in a batch of {len(rows)} were inserted concurrently, linking them as duplicates")
+    
+    job_ids = job_ids_by_hash(session, [row["content_hash"] for row in unique])
+    index_job_bands(session, [(job_ids[row["content_hash"]], row["minhash"]) for row in unique])
+    record_job_changes(session, added=[rollup_key(row) for row in unique])
+    
+    duplicates = []
+    for (row_number, row), match in zip(rows, matches):
+        if match:
+            job_id = match.job_id if match.row_index is None else job_ids[rows[match.row_index][1]["content_hash"]]
+            record_duplicate(session, job_id, row, match)
+            duplicates.append({
+                "row": row_number,
+                "job_id": job_id,
+                "match": match.match_type,
+                "similarity": round(match.similarity, 4)
+            })
+    
+    return duplicates
+
+
+def _insert_batch(
+    session: Session,
+    rows: List[Tuple[int, Dict[str, Any]]]
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    try:
+        duplicates = _insert_unique_rows(session, rows)
+        session.commit()
+        return [], duplicates
+    except Exception as e:
+        session.rollback()
+        logger.warning(f"Bulk insert of {len(rows)} jobs failed, retrying row by row: {str(e)}")
+    
+    errors = []
+    duplicates = []
+    for row_number, row in rows:
+        try:
+            duplicates.extend(_insert_unique_rows(session, [(row_number, row)]))
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            errors.append({"row": row_number, "error": str(e)})
+    
+    return errors, duplicates
+
+
+def import_csv_batches(
+    session: Session,
+    rows: Iterator[Tuple[int, Optional[Dict[str, Any]], Optional[str]]],
+    batch_size: int = 500,
+    user: Optional[User] = None
+) -> Iterator[Dict[str, Any]]:
+    batch_number = 0
+    total_imported = 0
+    total_failed = 0
+    total_duplicates = 0
+    exhausted = False
+    
+    while not exhausted:
+        pending: List[Tuple[int, Dict[str, Any]]] = []
+        errors: List[Dict[str, Any]] = []
+        
+        while len(pending) + len(errors) < batch_size:
+            try:
+                row_number, job_data, parse_error = next(rows)
+            except StopIteration:
+                exhausted = True
+                break
+            except CsvParseError as e:
+                errors.append({"row": e.line_num, "error": str(e)})
+                exhausted = True
+                break
+            except Exception as e:
+                errors.append({"row": None, "error": f"Failed to parse CSV: {str(e)}"})
+                exhausted = True
+                break
+            
+            if parse_error:
+                errors.append({"row": row_number, "error": parse_error})
+                continue
+            
+            try:
+                pending.append((row_number, build_job_row(JobCreate(**job_data))))
+            except ValidationError as e:
+                errors.append({"row": row_number, "error": str(e)})
+        
+        if not pending and not errors:
+            break
+        
+        score_job_rows([row for _, row in pending], user)
+        
+        insert_errors, duplicates = _insert_batch(session, pending)
+        errors.extend(insert_errors)
+        
+        batch_number += 1
+        imported = len(pending) - len(insert_errors) - len(duplicates)
+        total_imported += imported
+        total_failed += len(errors)
+        total_duplicates += len(duplicates)
+        
+        yield {
+            "batch": batch_number,
+            "imported": imported,
+            "failed": len(errors),
+            "duplicates": len(duplicates),
+            "total_imported": total_imported,
+            "total_failed": total_failed,
+            "total_duplicates": total_duplicates,
+            "errors": errors,
+            "duplicate_rows": duplicates
+        }
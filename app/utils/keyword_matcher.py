@@ -0,0 +1,60 @@
+from typing import Dict, Iterable, List, Tuple
+
+MIN_FACTOR_LENGTH = 5
+
+
+def _shared_factors(keywords: Tuple[str, ...]) -> Dict[str, List[str]]:
+    groups: Dict[str, List[str]] = {}
+    remaining = set(keywords)
+    
+    while remaining:
+        counts: Dict[str, int] = {}
+        for keyword in remaining:
+            factors = {
+                keyword[start:end]
+                for start in range(len(keyword))
+                for end in range(start + MIN_FACTOR_LENGTH, len(keyword) + 1)
+            }
+            for factor in factors:
+                counts[factor] = counts.get(factor, 0) + 1
+        
+        shared = [factor for factor, count in counts.items() if count > 1]
+        if not shared:
+            break
+        
+        best = max(shared, key=lambda factor: (counts[factor] * len(factor), factor))
+        groups[best] = [keyword for keyword in keywords if keyword in remaining and best in keyword]
+        remaining.difference_update(groups[best])
+    
+    return groups
+
+
+class KeywordMatcher:
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: Tuple[str, ...] = tuple(dict.fromkeys(keyword.lower() for keyword in keywords))
+        self._position = {keyword: index for index, keyword in enumerate(self.keywords)}
+        
+        groups = _shared_factors(self.keywords)
+        grouped = {keyword for group in groups.values() for keyword in group}
+        
+        self.plan: Tuple[Tuple[str, Tuple[str, ...]], ...] = tuple(
+            (factor, tuple(keyword for keyword in group if keyword != factor))
+            for factor, group in groups.items()
+        )
+        self.factor_keywords = frozenset(factor for factor in groups if factor in self._position)
+        self.ungrouped: Tuple[str, ...] = tuple(k for k in self.keywords if k not in grouped)
+    
+    def find_all(self, text: str) -> List[str]:
+        return self.find_all_lower(text.lower())
+    
+    def find_all_lower(self, text: str) -> List[str]:
+        hits = [keyword for keyword in self.ungrouped if keyword in text]
+        
+        for factor, group in self.plan:
+            if factor in text:
+                if factor in self.factor_keywords:
+                    hits.append(factor)
+                hits.extend(keyword for keyword in group if keyword in text)
+        
+        hits.sort(key=self._position.__getitem__)
+        return hits
@@ -0,0 +1,79 @@
+import threading
+from collections import Counter, OrderedDict
+from typing import Callable, Dict, Generic, List, Optional, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    def __init__(self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: "OrderedDict[K, V]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def _expired(self, value: V) -> bool:
+        return False
+    
+    def _weight(self, value: V) -> int:
+        return len(value) if self.max_bytes is not None else 0
+    
+    def _over_capacity(self) -> bool:
+        if self.max_entries is not None and len(self._entries) > self.max_entries:
+            return True
+        return self.max_bytes is not None and self.size > self.max_bytes
+    
+    def _remove(self, key: K) -> None:
+        self.size -= self._weight(self._entries.pop(key))
+    
+    def get(self, key: K) -> Optional[V]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                return None
+            
+            if self._expired(value):
+                self._remove(key)
+                return None
+            
+            self._entries.move_to_end(key)
+            return value
+    
+    def set(self, key: K, value: V) -> None:
+        weight = self._weight(value)
+        if self.max_bytes is not None and weight > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = value
+            self.size += weight
+            while self._over_capacity():
+                self._remove(next(iter(self._entries)))
+    
+    def discard(self, predicate: Callable[[K, V], bool]) -> int:
+        with self._lock:
+            keys = [key for key, value in self._entries.items() if predicate(key, value)]
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class Counters:
+    def __init__(self, names: List[str]):
+        self.names = names
+        self._counts: Counter = Counter()
+        self._lock = threading.Lock()
+    
+    def count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counts[name] += amount
+    
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return {name: self._counts[name] for name in self.names}
@@ -1,5 +1,28 @@
-from typing import Optional
+from typing import Any, Callable, Dict, Optional, Tuple
+from app.config import settings
 from app.utils.ai_engine import AIEngine
+from app.utils.logger import logger
+
+
+def _message_result(message: str, source: str, fallback_reason: Optional[str] = None) -> Dict[str, Any]:
+    return {
+        "message": message,
+        "source": source,
+        "fallback_used": fallback_reason is not None,
+        "fallback_reason": fallback_reason
+    }
+
+
+def _generate_ai_message(ai_api_key: str, generate: Callable[[AIEngine], str]) -> Tuple[Optional[str], Optional[str]]:
+    ai_engine = AIEngine(api_key=ai_api_key, raise_errors=True, deadline=settings.ai_call_deadline)
+    if not ai_engine.is_available():
+        return None, "AI engine not available"
+    
+    try:
+        return generate(ai_engine), None
+    except Exception as e:
+        logger.warning(f"AI message generation failed, using default template: {str(e)}")
+        return None, str(e)
 
 
 def build_application_message(
@@ -9,13 +32,18 @@ def build_application_message(
     use_ai: bool = False,
     tone: str = "professional",
     ai_api_key: Optional[str] = None
-) -> str:
+) -> Dict[str, Any]:
     if custom_message:
-        return custom_message
+        return _message_result(custom_message, "custom")
     
+    fallback_reason = None
     if use_ai and ai_api_key:
-        ai_engine = AIEngine(api_key=ai_api_key)
-        return ai_engine.generate_recruiter_message(job_title, company, tone)
+        message, fallback_reason = _generate_ai_message(
+            ai_api_key,
+            lambda ai_engine: ai_engine.generate_recruiter_message(job_title, company, tone)
+        )
+        if message:
+            return _message_result(message, "ai")
     
     default_template = f"""Dear Hiring Manager,
 
@@ -27,7 +55,7 @@ Thank you for your consideration.
 
 Best regards"""
     
-    return default_template
+    return _message_result(default_template, "template", fallback_reason)
 
 
 def build_followup_message(
@@ -37,13 +65,18 @@ def build_followup_message(
     custom_message: Optional[str] = None,
     use_ai: bool = False,
     ai_api_key: Optional[str] = None
-) -> str:
+) -> Dict[str, Any]:
     if custom_message:
-        return custom_message
+        return _message_result(custom_message, "custom")
     
+    fallback_reason = None
     if use_ai and ai_api_key:
-        ai_engine = AIEngine(api_key=ai_api_key)
-        return ai_engine.generate_followup_message(job_title, company, days_since)
+        message, fallback_reason = _generate_ai_message(
+            ai_api_key,
+            lambda ai_engine: ai_engine.generate_followup_message(job_title, company, days_since)
+        )
+        if message:
+            return _message_result(message, "ai")
     
     default_template = f"""Dear Hiring Manager,
 
@@ -53,4 +86,4 @@ Thank you for your time and consideration.
 
 Best regards"""
     
-    return default_template
+    return _message_result(default_template, "template", fallback_reason)
@@ -0,0 +1,242 @@
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import delete, func, insert
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, select
+from app.models.email_log import EmailLog
+from app.models.job import Job
+from app.models.metrics_rollup import MetricsRollup
+from app.models.resume import Resume
+from app.utils.dashboard_metrics import CALLBACK_STATUSES, OFFER_STATUS
+from app.utils.upsert import UPSERT_INSERTS
+from app.utils.logger import logger
+
+ROLLUP_KEY_COLUMNS = ["country", "classification", "template_type", "application_status", "applied", "day"]
+
+APPLICATION_STATUSES = ["pending", "applied", "interviewing", "offered", "rejected"]
+
+APPLIED_TEMPLATE_KEY = "applied_template"
+
+RollupKey = Tuple[str, str, str, str, bool, str]
+
+
+def _field(job: Any, name: str) -> Any:
+    return job[name] if isinstance(job, dict) else getattr(job, name)
+
+
+def rollup_key(job: Any) -> RollupKey:
+    metadata = _field(job, "job_metadata") or {}
+    application_date = _field(job, "application_date")
+    
+    return (
+        _field(job, "country") or "",
+        _field(job, "classification") or "",
+        metadata.get(APPLIED_TEMPLATE_KEY) or "",
+        _field(job, "application_status") or "pending",
+        bool(_field(job, "applied")),
+        application_date.strftime("%Y-%m-%d") if application_date else ""
+    )
+
+
+def _upsert(session: Session, deltas: Dict[RollupKey, int]) -> None:
+    rows = [
+        {**dict(zip(ROLLUP_KEY_COLUMNS, key)), "job_count": delta}
+        for key, delta in deltas.items()
+        if delta != 0
+    ]
+    if not rows:
+        return
+    
+    statement = UPSERT_INSERTS[session.get_bind().dialect.name](MetricsRollup)
+    statement = statement.on_conflict_do_update(
+        index_elements=ROLLUP_KEY_COLUMNS,
+        set_={"job_count": MetricsRollup.job_count + statement.excluded.job_count}
+    )
+    session.execute(statement, rows)
+
+
+def record_job_changes(
+    session: Session,
+    removed: Iterable[RollupKey] = (),
+    added: Iterable[RollupKey] = ()
+) -> None:
+    deltas: Counter = Counter()
+    for key in removed:
+        deltas[key] -= 1
+    for key in added:
+        deltas[key] += 1
+    _upsert(session, deltas)
+
+
+def record_job_change(session: Session, before: Optional[RollupKey], after: Optional[RollupKey]) -> None:
+    if before == after:
+        return
+    record_job_changes(
+        session,
+        removed=[before] if before else [],
+        added=[after] if after else []
+    )
+
+
+def _application_day(dialect: str):
+    if dialect == "postgresql":
+        return func.to_char(Job.application_date, "YYYY-MM-DD")
+    return func.date(Job.application_date)
+
+
+def rebuild_metrics_rollups(session: Session) -> int:
+    dialect = session.get_bind().dialect.name
+    
+    key_columns = [
+        func.coalesce(Job.country, "").label("country"),
+        func.coalesce(Job.classification, "").label("classification"),
+        func.coalesce(Job.job_metadata[APPLIED_TEMPLATE_KEY].as_string(), "").label("template_type"),
+        Job.application_status.label("application_status"),
+        Job.applied.label("applied"),
+        func.coalesce(_application_day(dialect), "").label("day")
+    ]
+    grouped = select(*key_columns, func.count().label("job_count")).group_by(*key_columns)
+    
+    session.execute(delete(MetricsRollup))
+    session.execute(
+        insert(MetricsRollup).from_select(ROLLUP_KEY_COLUMNS + ["job_count"], grouped)
+    )
+    session.commit()
+    
+    groups = session.exec(select(func.count()).select_from(MetricsRollup)).one()
+    logger.info(f"Rebuilt metrics rollups: {groups} groups")
+    return groups
+
+
+def backfill_applied_templates(session: Session) -> int:
+    latest_application = (
+        select(EmailLog.job_id, func.max(EmailLog.id).label("email_log_id"))
+        .where(EmailLog.email_type == "application", EmailLog.status == "sent", EmailLog.resume_id.is_not(None))
+        .group_by(EmailLog.job_id)
+        .subquery()
+    )
+    rows = session.exec(
+        select(Job, Resume.template_type)
+        .join(latest_application, latest_application.c.job_id == Job.id)
+        .join(EmailLog, EmailLog.id == latest_application.c.email_log_id)
+        .join(Resume, Resume.id == EmailLog.resume_id)
+        .where(Job.applied == True, Job.job_metadata[APPLIED_TEMPLATE_KEY].as_string().is_(None))
+    ).all()
+    
+    for job, template_type in rows:
+        job.job_metadata = {**(job.job_metadata or {}), APPLIED_TEMPLATE_KEY: template_type}
+        session.add(job)
+    session.commit()
+    
+    if rows:
+        logger.info(f"Backfilled the applied template of {len(rows)} jobs from their application emails")
+    return len(rows)
+
+
+def ensure_metrics_rollups(engine: Engine) -> None:
+    if engine.dialect.name not in UPSERT_INSERTS:
+        raise ValueError(f"Metrics rollups are not supported on {engine.dialect.name}")
+    
+    with Session(engine) as session:
+        backfilled = backfill_applied_templates(session)
+        has_rollups = session.exec(select(MetricsRollup.id).limit(1)).first() is not None
+        has_jobs = session.exec(select(Job.id).limit(1)).first() is not None
+        
+        if has_jobs and (backfilled or not has_rollups):
+            rebuild_metrics_rollups(session)
+
+
+def _count(condition=None):
+    total = func.coalesce(func.sum(MetricsRollup.job_count), 0)
+    if condition is None:
+        return total
+    return func.coalesce(func.sum(MetricsRollup.job_count).filter(condition), 0)
+
+
+def _rollup_breakdown(session: Session, column, labels: Tuple[str, str, str]) -> Dict[str, Dict[str, int]]:
+    applied = _count()
+    statement = (
+        select(
+            column,
+            applied,
+            _count(MetricsRollup.application_status.in_(CALLBACK_STATUSES)),
+            _count(MetricsRollup.application_status == OFFER_STATUS)
+        )
+        .where(MetricsRollup.applied == True, column != "")
+        .group_by(column)
+        .having(applied > 0)
+    )
+    
+    return {
+        key: dict(zip(labels, (int(first), int(callbacks), int(offers))))
+        for key, first, callbacks, offers in session.exec(statement).all()
+    }
+
+
+def _rollup_timeline(session: Session) -> List[Dict[str, Any]]:
+    applications = _count()
+    statement = (
+        select(MetricsRollup.day, applications)
+        .where(MetricsRollup.applied == True, MetricsRollup.day != "")
+        .group_by(MetricsRollup.day)
+        .having(applications > 0)
+        .order_by(MetricsRollup.day)
+    )
+    return [{"date": day, "applications": int(count)} for day, count in session.exec(statement).all()]
+
+
+def compute_rollup_metrics(session: Session) -> Dict[str, Any]:
+    total_jobs, total_applications, callback_count, offer_count = (
+        int(value) for value in session.exec(
+            select(
+                _count(),
+                _count(MetricsRollup.applied == True),
+                _count(MetricsRollup.application_status.in_(CALLBACK_STATUSES)),
+                _count(MetricsRollup.application_status == OFFER_STATUS)
+            )
+        ).one()
+    )
+    
+    callback_rate = (callback_count / total_applications * 100) if total_applications > 0 else 0
+    offer_rate = (offer_count / total_applications * 100) if total_applications > 0 else 0
+    
+    return {
+        "overview": {
+            "total_jobs": total_jobs,
+            "total_applications": total_applications,
+            "pending_applications": total_jobs - total_applications,
+            "callback_count": callback_count,
+            "offer_count": offer_count,
+            "callback_rate": round(callback_rate, 2),
+            "offer_rate": round(offer_rate, 2)
+        },
+        "country_success": _rollup_breakdown(session, MetricsRollup.country, ("applied", "callbacks", "offers")),
+        "role_success": _rollup_breakdown(session, MetricsRollup.classification, ("applied", "callbacks", "offers")),
+        "template_success": _rollup_breakdown(session, MetricsRollup.template_type, ("used", "callbacks", "offers")),
+        "timeline": _rollup_timeline(session)
+    }
+
+
+def compute_status_overview(session: Session) -> Dict[str, Any]:
+    statement = (
+        select(MetricsRollup.application_status, MetricsRollup.applied, _count())
+        .group_by(MetricsRollup.application_status, MetricsRollup.applied)
+    )
+    
+    total_count = 0
+    applied_count = 0
+    by_status = {status: 0 for status in APPLICATION_STATUSES}
+    for status, applied, count in session.exec(statement).all():
+        count = int(count)
+        total_count += count
+        if applied:
+            applied_count += count
+        if status in by_status:
+            by_status[status] += count
+    
+    return {
+        "total_jobs": total_count,
+        "applied": applied_count,
+        "pending": total_count - applied_count,
+        "by_status": by_status
+    }
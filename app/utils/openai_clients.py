@@ -0,0 +1,48 @@
+import threading
+from typing import Dict
+import httpx
+from openai import OpenAI
+from app.config import settings
+from app.utils.logger import logger
+
+_clients: Dict[str, OpenAI] = {}
+_lock = threading.Lock()
+
+
+def build_openai_client(api_key: str) -> OpenAI:
+    timeout = httpx.Timeout(settings.openai_timeout, connect=settings.openai_connect_timeout)
+    
+    return OpenAI(
+        api_key=api_key,
+        base_url=settings.openai_base_url,
+        timeout=timeout,
+        max_retries=settings.openai_max_retries,
+        http_client=httpx.Client(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=settings.openai_max_connections,
+                max_keepalive_connections=settings.openai_max_connections
+            )
+        )
+    )
+
+
+def get_openai_client(api_key: str) -> OpenAI:
+    with _lock:
+        client = _clients.get(api_key)
+        if client is None or client.is_closed():
+            client = build_openai_client(api_key)
+            _clients[api_key] = client
+        return client
+
+
+def close_openai_clients() -> None:
+    with _lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    
+    for client in clients:
+        try:
+            client.close()
+        except Exception as e:
+            logger.warning(f"Failed to close OpenAI client: {str(e)}")
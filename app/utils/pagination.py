@@ -0,0 +1,86 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
+from sqlalchemy import tuple_
+from sqlalchemy.schema import CreateIndex
+from sqlalchemy.engine import Engine
+from sqlmodel import SQLModel
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+KEYSET_INDEXES = {
+    "ix_jobs_created_at_id",
+    "ix_jobs_score_id",
+    "ix_resumes_created_at_id",
+    "ix_followups_scheduled_date_id"
+}
+
+
+def encode_cursor(scope: str, values: Sequence[Any]) -> str:
+    payload = [scope] + [
+        {"datetime": value.isoformat()} if isinstance(value, datetime) else value
+        for value in values
+    ]
+    token = base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode()
+    return token.rstrip("=")
+
+
+def decode_cursor(token: str, scope: str, size: int) -> List[Any]:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+        if not isinstance(payload, list) or len(payload) != size + 1 or payload[0] != scope:
+            raise ValueError
+        return [
+            datetime.fromisoformat(value["datetime"]) if isinstance(value, dict) else value
+            for value in payload[1:]
+        ]
+    except (ValueError, TypeError, KeyError):
+        raise ValueError("Invalid pagination cursor")
+
+
+def keyset_query(
+    statement,
+    scope: str,
+    keys: Sequence[Any],
+    limit: int,
+    cursor: Optional[str] = None,
+    offset: int = 0,
+    descending: bool = False
+):
+    if cursor and offset:
+        raise ValueError("Use either a cursor or an offset, not both")
+    
+    if cursor:
+        values = decode_cursor(cursor, scope, len(keys))
+        if None in values:
+            raise ValueError("Invalid pagination cursor")
+        
+        row_key = tuple_(*keys)
+        if descending:
+            statement = statement.where(keys[0] <= values[0], row_key < tuple_(*values))
+        else:
+            statement = statement.where(keys[0] >= values[0], row_key > tuple_(*values))
+    elif offset:
+        statement = statement.offset(offset)
+    
+    return (
+        statement
+        .add_columns(*keys)
+        .order_by(*(key.desc() if descending else key.asc() for key in keys))
+        .limit(limit + 1)
+    )
+
+
+def split_page(rows: Sequence[Any], scope: str, limit: int) -> Tuple[List[Any], Optional[str]]:
+    items = [row[0] for row in rows[:limit]]
+    next_cursor = encode_cursor(scope, tuple(rows[limit - 1])[1:]) if len(rows) > limit else None
+    return items, next_cursor
+
+
+def ensure_keyset_indexes(engine: Engine) -> None:
+    with engine.begin() as connection:
+        for table in SQLModel.metadata.sorted_tables:
+            for index in table.indexes:
+                if index.name in KEYSET_INDEXES:
+                    connection.execute(CreateIndex(index, if_not_exists=True))
@@ -1,6 +1,25 @@
+import codecs
 import csv
 import io
-from typing import List, Dict, Any
+from typing import List, Dict, Any, IO, Iterator, Optional, Tuple
+
+
+class CsvParseError(ValueError):
+    def __init__(self, line_num: int, message: str):
+        super().__init__(f"Failed to parse CSV near line {line_num}: {message}")
+        self.line_num = line_num
+
+
+def _csv_row_to_job(row: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "title": row.get("title", row.get("Title", "")),
+        "company": row.get("company", row.get("Company", "")),
+        "location": row.get("location", row.get("Location", "")),
+        "country": row.get("country", row.get("Country", None)),
+        "description": row.get("description", row.get("Description", "")),
+        "url": row.get("url", row.get("URL", None)),
+        "source": "csv_import"
+    }
 
 
 def parse_csv_jobs(csv_content: str) -> List[Dict[str, Any]]:
@@ -11,15 +30,7 @@ def parse_csv_jobs(csv_content: str) -> List[Dict[str, Any]]:
         reader = csv.DictReader(csv_file)
         
         for row in reader:
-            job = {
-                "title": row.get("title", row.get("Title", "")),
-                "company": row.get("company", row.get("Company", "")),
-                "location": row.get("location", row.get("Location", "")),
-                "country": row.get("country", row.get("Country", None)),
-                "description": row.get("description", row.get("Description", "")),
-                "url": row.get("url", row.get("URL", None)),
-                "source": "csv_import"
-            }
+            job = _csv_row_to_job(row)
             
             if job["title"] and job["company"]:
                 jobs.append(job)
@@ -30,6 +41,47 @@ def parse_csv_jobs(csv_content: str) -> List[Dict[str, Any]]:
     return jobs
 
 
+def iter_csv_jobs(
+    binary_file: IO[bytes],
+    encoding: str = "utf-8"
+) -> Iterator[Tuple[int, Optional[Dict[str, Any]], Optional[str]]]:
+    text_file = io.TextIOWrapper(binary_file, encoding=encoding, newline="")
+    reader = csv.DictReader(text_file)
+    
+    try:
+        for row in reader:
+            row_number = reader.line_num
+            job = _csv_row_to_job(row)
+            
+            if not job["title"] or not job["company"]:
+                yield row_number, None, "Missing required title or company"
+                continue
+            
+            yield row_number, job, None
+    except (UnicodeDecodeError, csv.Error) as e:
+        raise CsvParseError(reader.line_num, str(e))
+    finally:
+        text_file.detach()
+
+
+def validate_csv_encoding(binary_file: IO[bytes], encoding: str = "utf-8", chunk_size: int = 64 * 1024) -> None:
+    decoder = codecs.getincrementaldecoder(encoding)()
+    line_num = 1
+    
+    try:
+        while True:
+            chunk = binary_file.read(chunk_size)
+            try:
+                decoder.decode(chunk, final=not chunk)
+            except UnicodeDecodeError as e:
+                raise CsvParseError(line_num + chunk[:max(e.start, 0)].count(b"\n"), str(e))
+            if not chunk:
+                break
+            line_num += chunk.count(b"\n")
+    finally:
+        binary_file.seek(0)
+
+
 def extract_job_from_text(text: str) -> Dict[str, Any]:
     lines = [line.strip() for line in text.split('\n') if line.strip()]
     
@@ -0,0 +1,148 @@
+import asyncio
+import functools
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional, Tuple
+from app.config import settings
+from app.utils.ai_metrics import LATENCY_BUCKETS, Histogram
+from app.utils.concurrency import get_executor
+from app.utils.pdf_resume import render_resume_buffer, render_resume_pdf, warm_up
+from app.utils.logger import logger
+
+RENDER_MODES = ["process", "thread"]
+
+
+class PdfPoolBusy(Exception):
+    pass
+
+
+class PdfRenderPool:
+    def __init__(self, mode: str, workers: int, max_pending: int):
+        if mode not in RENDER_MODES:
+            raise ValueError(f"Unknown PDF render mode: {mode}")
+        
+        self.mode = mode
+        self.workers = workers
+        self.max_pending = max_pending
+        self.pending = 0
+        self.rendered = 0
+        self.failed = 0
+        self.rejected = 0
+        self.render_time = Histogram(LATENCY_BUCKETS, settings.ai_metrics_window)
+        self.queue_wait = Histogram(LATENCY_BUCKETS, settings.ai_metrics_window)
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+    
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                if self.mode == "process":
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                        initializer=warm_up
+                    )
+                else:
+                    warm_up()
+                    self._executor = get_executor("pdf")
+            return self._executor
+    
+    def start(self) -> None:
+        executor = self._get_executor()
+        if self.mode == "process":
+            wait([executor.submit(time.sleep, 0) for _ in range(self.workers)])
+        logger.info(f"PDF render pool ready: {self.workers} {self.mode} workers, {self.max_pending} pending max")
+    
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None and self.mode == "process":
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    async def render(self, **options: Any) -> str:
+        return await self._submit(render_resume_pdf, options)
+    
+    async def render_bytes(self, **options: Any) -> bytes:
+        return await self._submit(render_resume_buffer, options)
+    
+    async def _submit(self, render: Callable[[Dict[str, Any]], Tuple[Any, float]], options: Dict[str, Any]) -> Any:
+        with self._lock:
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                raise PdfPoolBusy(f"PDF renderer is busy ({self.pending} renders pending), try again shortly")
+            self.pending += 1
+        
+        start = time.perf_counter()
+        executor = self._get_executor()
+        try:
+            loop = asyncio.get_running_loop()
+            output, render_seconds = await loop.run_in_executor(
+                executor,
+                functools.partial(render, options)
+            )
+        except BrokenProcessPool:
+            logger.error("PDF render process pool broke, starting a new one")
+            with self._lock:
+                self.failed += 1
+                if self._executor is executor:
+                    self._executor = None
+            raise
+        except Exception:
+            with self._lock:
+                self.failed += 1
+            raise
+        finally:
+            with self._lock:
+                self.pending -= 1
+        
+        with self._lock:
+            self.rendered += 1
+            self.render_time.observe(render_seconds)
+            self.queue_wait.observe(max(0.0, time.perf_counter() - start - render_seconds))
+        return output
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "mode": self.mode,
+                "workers": self.workers,
+                "max_pending": self.max_pending,
+                "pending": self.pending,
+                "rendered": self.rendered,
+                "failed": self.failed,
+                "rejected": self.rejected,
+                "render_time": self.render_time.summary(),
+                "queue_wait": self.queue_wait.summary()
+            }
+
+
+_pool: Optional[PdfRenderPool] = None
+
+
+def get_pdf_pool() -> PdfRenderPool:
+    global _pool
+    if _pool is None:
+        _pool = PdfRenderPool(settings.pdf_render_mode, settings.pdf_workers, settings.pdf_max_pending)
+    return _pool
+
+
+async def render_resume(**options: Any) -> str:
+    return await get_pdf_pool().render(**options)
+
+
+async def render_resume_bytes(**options: Any) -> bytes:
+    return await get_pdf_pool().render_bytes(**options)
+
+
+def start_pdf_pool() -> None:
+    get_pdf_pool().start()
+
+
+def shutdown_pdf_pool() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.shutdown()
+        _pool = None
@@ -0,0 +1,160 @@
+import hashlib
+import re
+from typing import List, NamedTuple, Optional, Tuple
+from app.config import settings
+from app.models.job import Job
+from app.utils.keyword_matcher import KeywordMatcher
+from app.utils.lru import LRUCache
+from app.utils.scoring import CLOUD_KEYWORDS
+
+TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+WORD_PATTERN = re.compile(r"[a-z0-9+#]+")
+SENTENCE_SPLIT = re.compile(r"(?<=[.!?;])\s+(?=[A-Z0-9(])")
+BULLET_PREFIX = re.compile(r"^\s*(?:[-*•●▪◦·–—>]+|\d{1,2}[.)])\s*")
+
+DROP_SECTIONS = re.compile(
+    r"benefit|perk|what we offer|we offer|compensation|salary|pay range|why join|why work|life at|"
+    r"equal (?:employment )?opportunit|\beeo\b|diversity|inclusion|accommodation|about (?:us|the company|our company)|"
+    r"who we are|our (?:story|mission|culture|values)|how to apply|application process|privacy|disclaimer|legal",
+    re.IGNORECASE
+)
+KEEP_SECTIONS = re.compile(
+    r"requirement|qualification|responsibilit|what you(?:'ll| will) do|what you(?:'ll| will) bring|"
+    r"you have|you bring|skills|experience|must have|nice to have|preferred|the role|your role|duties",
+    re.IGNORECASE
+)
+
+BOILERPLATE = re.compile(
+    r"equal opportunity|without regard to|race, colou?r|sexual orientation|gender identity|protected veteran|"
+    r"reasonable accommodation|e-verify|background check|401\s?\(?k\)?|health,? dental|dental and vision|"
+    r"paid time off|\bpto\b|parental leave|stock options|free (?:lunch|snacks)|gym membership|wellness|"
+    r"click (?:the )?apply|apply now|submit your (?:resume|application)|send (?:us )?your (?:cv|resume)|"
+    r"recruitment agenc|privacy (?:notice|policy)|we are (?:an|a) (?:leading|fast-growing|global)|"
+    r"founded in \d{4}|follow us on|learn more about",
+    re.IGNORECASE
+)
+REQUIREMENT_CUES = re.compile(
+    r"\bmust\b|\brequired?\b|\brequirements?\b|experience (?:with|in)|\d\+? years|proficien|knowledge of|"
+    r"familiar|expertise|hands-on|strong|ability to|understanding of|certif|degree|responsible for|"
+    r"you will|you'll|design|build|implement|maintain|manage|automat|deploy|migrat|troubleshoot",
+    re.IGNORECASE
+)
+
+SKILL_KEYWORDS = CLOUD_KEYWORDS + [
+    "ec2", "s3", "lambda", "eks", "aks", "gke", "iam", "vpc", "cloudformation", "ansible", "pulumi", "helm",
+    "jenkins", "gitlab", "github actions", "ci/cd", "linux", "networking", "python", "bash", "go", "sql",
+    "prometheus", "grafana", "datadog", "observability", "monitoring", "security", "devops", "sre",
+    "microservices", "serverless", "infrastructure as code", "containers", "openshift", "vmware"
+]
+SKILL_MATCHER = KeywordMatcher(SKILL_KEYWORDS)
+
+NEAR_DUPLICATE_THRESHOLD = 0.8
+MAX_HEADING_WORDS = 8
+
+
+class Sentence(NamedTuple):
+    position: int
+    text: str
+    tokens: int
+    score: float
+
+
+def estimate_tokens(text: str) -> int:
+    return sum((len(piece) + 3) // 4 for piece in TOKEN_PATTERN.findall(text))
+
+
+def _heading(line: str) -> Optional[str]:
+    stripped = line.strip().strip("#*_").strip()
+    words = stripped.rstrip(":").split()
+    if not words or len(words) > MAX_HEADING_WORDS:
+        return None
+    if stripped.endswith(":") or stripped.isupper() or line.lstrip().startswith("#"):
+        return stripped.rstrip(":")
+    return None
+
+
+def _section_lines(description: str) -> List[Tuple[str, float]]:
+    lines = []
+    weight = 0.0
+    dropping = False
+    
+    for line in description.splitlines():
+        if not line.strip():
+            continue
+        
+        heading = _heading(line)
+        if heading is not None:
+            dropping = bool(DROP_SECTIONS.search(heading)) and not KEEP_SECTIONS.search(heading)
+            weight = 2.0 if KEEP_SECTIONS.search(heading) else 0.0
+            continue
+        
+        if not dropping:
+            lines.append((BULLET_PREFIX.sub("", line).strip(), weight))
+    
+    return lines
+
+
+def _word_set(text: str) -> frozenset:
+    return frozenset(WORD_PATTERN.findall(text.lower()))
+
+
+def _sentences(description: str) -> List[Sentence]:
+    sentences: List[Sentence] = []
+    seen: List[frozenset] = []
+    
+    for line, weight in _section_lines(description):
+        for text in SENTENCE_SPLIT.split(line):
+            text = text.strip()
+            if len(text) < 3 or BOILERPLATE.search(text):
+                continue
+            
+            words = _word_set(text)
+            if not words:
+                continue
+            if any(len(words & other) / len(words | other) >= NEAR_DUPLICATE_THRESHOLD for other in seen):
+                continue
+            seen.append(words)
+            
+            score = weight
+            score += 2.0 * len(REQUIREMENT_CUES.findall(text))
+            score += 1.5 * len(SKILL_MATCHER.find_all(text))
+            sentences.append(Sentence(len(sentences), text, estimate_tokens(text), score))
+    
+    return sentences
+
+
+def compress_job_description(description: str, token_budget: Optional[int] = None) -> str:
+    token_budget = token_budget or settings.ai_prompt_token_budget
+    sentences = _sentences(description or "")
+    
+    if sum(sentence.tokens for sentence in sentences) > token_budget:
+        selected = []
+        used = 0
+        for sentence in sorted(sentences, key=lambda s: (-s.score, s.position)):
+            if sentence.score <= 0 and selected:
+                break
+            if used + sentence.tokens > token_budget:
+                continue
+            selected.append(sentence)
+            used += sentence.tokens
+        sentences = sorted(selected, key=lambda s: s.position)
+    
+    return "\n".join(f"- {sentence.text}" for sentence in sentences)
+
+
+_cache: LRUCache[Tuple[int, str, int], str] = LRUCache(max_entries=settings.ai_cache_max_entries)
+
+
+def job_prompt_description(job: Optional[Job]) -> str:
+    if not job or not job.description:
+        return ""
+    if not settings.ai_prompt_compression:
+        return job.description
+    
+    token_budget = settings.ai_prompt_token_budget
+    key = (job.id or 0, hashlib.sha1(job.description.encode()).hexdigest(), token_budget)
+    compressed = _cache.get(key)
+    if compressed is None:
+        compressed = compress_job_description(job.description, token_budget) or job.description[:token_budget * 4]
+        _cache.set(key, compressed)
+    return compressed
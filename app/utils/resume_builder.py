@@ -0,0 +1,185 @@
+import asyncio
+from typing import AsyncIterator, Dict, List, NamedTuple, Optional
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.config import settings as app_settings
+from app.models.resume import Resume
+from app.models.job import Job
+from app.models.user import User
+from app.models.settings import Settings
+from app.schemas.resume_schema import ResumeBatchCreate, ResumeCreate
+from app.utils.pdf_pool import PdfPoolBusy
+from app.utils.ai_engine import AIEngine
+from app.utils.concurrency import run_blocking
+from app.utils.prompt_compression import job_prompt_description
+from app.utils.resume_store import store_resume_pdf
+from app.utils.logger import logger
+
+
+class ResumeBatchPlan(NamedTuple):
+    user: User
+    settings: Optional[Settings]
+    jobs: List[Job]
+    request: ResumeBatchCreate
+
+
+class ResumeBatchResult(NamedTuple):
+    job: Job
+    resume: Optional[Resume]
+    error: Optional[str]
+
+
+async def _resume_user(session: AsyncSession) -> User:
+    user = (await session.exec(select(User).where(User.id == 1))).first()
+    if not user:
+        user = User(
+            name="Vishwas",
+            email="user@example.com",
+            role_preferences=["cloud engineer"]
+        )
+        session.add(user)
+        await session.commit()
+        await session.refresh(user)
+    return user
+
+
+async def _render_resume(
+    user: User,
+    settings: Optional[Settings],
+    job: Optional[Job],
+    resume_data: ResumeCreate
+) -> Resume:
+    bullets = resume_data.bullets
+    summary = resume_data.summary or "Experienced cloud professional"
+    is_ai_generated = False
+    
+    job_title = job.title if job else None
+    
+    if resume_data.use_ai and settings and settings.ai_mode_enabled:
+        ai_engine = AIEngine(api_key=settings.openai_api_key)
+        job_desc = job_prompt_description(job)
+        
+        if ai_engine.is_available():
+            needs_bullets = not bullets
+            needs_summary = not summary or summary == "Experienced cloud professional"
+            
+            if needs_bullets and needs_summary:
+                content = await run_blocking("ai", ai_engine.generate_resume_content, job_desc, resume_data.template_type)
+                if content:
+                    bullets = content["bullets"]
+                    summary = content["summary"]
+                    needs_bullets = needs_summary = False
+            
+            bullets_task = None
+            if needs_bullets:
+                bullets_task = asyncio.ensure_future(
+                    run_blocking("ai", ai_engine.generate_resume_bullets, job_desc, resume_data.template_type, "")
+                )
+            
+            if needs_summary:
+                summary = await run_blocking("ai", ai_engine.generate_summary, job_desc)
+            
+            if bullets_task:
+                bullets_text = await bullets_task
+                bullets = [b.strip() for b in bullets_text.split('\n') if b.strip()]
+            
+            is_ai_generated = True
+    
+    try:
+        content_hash, output_path = await store_resume_pdf(
+            name=user.name,
+            email=user.email,
+            phone=user.phone,
+            linkedin_url=user.linkedin_url,
+            summary=summary,
+            bullets=bullets,
+            template_type=resume_data.template_type,
+            job_title=job_title
+        )
+    except PdfPoolBusy:
+        raise
+    except Exception as e:
+        logger.error(f"PDF generation failed: {str(e)}")
+        raise RuntimeError(f"Failed to generate PDF: {str(e)}")
+    
+    return Resume(
+        user_id=user.id,
+        job_id=resume_data.job_id,
+        resume_name="",
+        template_type=resume_data.template_type,
+        file_path=output_path,
+        content_hash=content_hash,
+        content=resume_data.content or {},
+        bullets=bullets,
+        summary=summary,
+        is_ai_generated=is_ai_generated,
+        generation_mode="ai" if is_ai_generated else "manual"
+    )
+
+
+async def _save_resumes(session: AsyncSession, resumes: List[Resume]) -> None:
+    session.add_all(resumes)
+    await session.flush()
+    for resume in resumes:
+        resume.resume_name = f"Vishwas_Cloud_Resume_{resume.id:03d}.pdf"
+    await session.commit()
+
+
+async def build_resume(session: AsyncSession, resume_data: ResumeCreate) -> Resume:
+    user = await _resume_user(session)
+    settings = (await session.exec(select(Settings).where(Settings.user_id == 1))).first()
+    job = await session.get(Job, resume_data.job_id) if resume_data.job_id else None
+    
+    resume = await _render_resume(user, settings, job, resume_data)
+    
+    await _save_resumes(session, [resume])
+    await session.refresh(resume)
+    
+    return resume
+
+
+async def plan_resume_batch(session: AsyncSession, batch: ResumeBatchCreate) -> ResumeBatchPlan:
+    job_ids = list(dict.fromkeys(batch.job_ids))
+    jobs: Dict[int, Job] = {
+        job.id: job for job in (await session.exec(select(Job).where(Job.id.in_(job_ids)))).all()
+    }
+    missing = [job_id for job_id in job_ids if job_id not in jobs]
+    if missing:
+        raise ValueError(f"Jobs not found: {', '.join(str(job_id) for job_id in missing)}")
+    
+    user = await _resume_user(session)
+    settings = (await session.exec(select(Settings).where(Settings.user_id == 1))).first()
+    
+    return ResumeBatchPlan(user, settings, [jobs[job_id] for job_id in job_ids], batch)
+
+
+async def build_resume_batch(session: AsyncSession, plan: ResumeBatchPlan) -> AsyncIterator[ResumeBatchResult]:
+    batch = plan.request
+    concurrency = batch.concurrency or app_settings.pdf_workers * 2
+    semaphore = asyncio.Semaphore(min(concurrency, app_settings.pdf_max_pending))
+    
+    async def render(job: Job) -> ResumeBatchResult:
+        resume_data = ResumeCreate(
+            job_id=job.id,
+            template_type=batch.template_type,
+            bullets=batch.bullets,
+            summary=batch.summary,
+            use_ai=batch.use_ai
+        )
+        async with semaphore:
+            try:
+                return ResumeBatchResult(job, await _render_resume(plan.user, plan.settings, job, resume_data), None)
+            except Exception as e:
+                logger.error(f"Batch resume generation failed for job {job.id}: {str(e)}")
+                return ResumeBatchResult(job, None, str(e))
+    
+    tasks = [asyncio.ensure_future(render(job)) for job in plan.jobs]
+    try:
+        for completed in asyncio.as_completed(tasks):
+            result = await completed
+            if result.resume is not None:
+                await _save_resumes(session, [result.resume])
+            yield result
+    finally:
+        for task in tasks:
+            task.cancel()
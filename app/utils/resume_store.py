@@ -0,0 +1,225 @@
+import asyncio
+import hashlib
+import json
+import os
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.config import settings
+from app.models.job import Job
+from app.models.resume import Resume
+from app.models.user import User
+from app.utils.concurrency import run_blocking
+from app.utils.lru import Counters, LRUCache
+from app.utils.pdf_pool import render_resume_bytes
+from app.utils.resume_templates import LAYOUT_VERSION, get_template
+from app.utils.logger import logger
+
+STORE_COUNTERS = ["memory_hits", "disk_hits", "renders", "coalesced", "memory_reads", "disk_reads", "regenerated", "collected"]
+RENDER_INPUTS = ["name", "email", "phone", "linkedin_url", "summary", "bullets", "template_type", "job_title"]
+
+_memory: LRUCache[str, bytes] = LRUCache(max_bytes=settings.pdf_memory_cache_mb * 1024 * 1024)
+_in_flight: Dict[str, "asyncio.Future[Optional[str]]"] = {}
+_counters = Counters(STORE_COUNTERS)
+
+
+def resume_content_hash(options: Dict[str, Any]) -> str:
+    payload = json.dumps(
+        {
+            "inputs": {name: options.get(name) for name in RENDER_INPUTS},
+            "template": list(get_template(options["template_type"]).template),
+            "layout_version": LAYOUT_VERSION
+        },
+        sort_keys=True,
+        separators=(",", ":")
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def resume_file_path(content_hash: str) -> str:
+    return f"{settings.resume_dir}/{content_hash}.pdf"
+
+
+def _touch(path: str) -> bool:
+    try:
+        os.utime(path)
+        return True
+    except FileNotFoundError:
+        return False
+
+
+def _write_file(output_path: str, data: bytes) -> None:
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    temp_path = f"{Path(output_path).parent}/.{Path(output_path).stem}.{uuid.uuid4().hex}.tmp"
+    try:
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, output_path)
+    except BaseException:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
+
+
+async def store_resume_pdf(**options: Any) -> Tuple[str, Optional[str]]:
+    content_hash = resume_content_hash(options)
+    output_path = resume_file_path(content_hash) if settings.resume_disk_copy else None
+    
+    data = _memory.get(content_hash)
+    if data is not None:
+        if output_path is not None and not await run_blocking("pdf", _touch, output_path):
+            await run_blocking("pdf", _write_file, output_path, data)
+        _counters.count("memory_hits")
+        return content_hash, output_path
+    if output_path is not None and await run_blocking("pdf", _touch, output_path):
+        _counters.count("disk_hits")
+        return content_hash, output_path
+    
+    pending = _in_flight.get(content_hash)
+    if pending is not None:
+        _counters.count("coalesced")
+        return content_hash, await asyncio.shield(pending)
+    
+    future = asyncio.get_running_loop().create_future()
+    _in_flight[content_hash] = future
+    try:
+        data = await render_resume_bytes(**options)
+        _memory.set(content_hash, data)
+        if output_path is not None:
+            await run_blocking("pdf", _write_file, output_path, data)
+    except BaseException as e:
+        if isinstance(e, asyncio.CancelledError):
+            future.cancel()
+        else:
+            future.set_exception(e)
+            future.exception()
+        raise
+    finally:
+        _in_flight.pop(content_hash, None)
+    
+    _counters.count("renders")
+    future.set_result(output_path)
+    return content_hash, output_path
+
+
+def load_resume_pdf(content_hash: Optional[str], file_path: Optional[str]) -> Optional[bytes]:
+    data = _memory.get(content_hash) if content_hash else None
+    if data is not None:
+        _counters.count("memory_reads")
+        return data
+    
+    if not file_path:
+        return None
+    try:
+        data = Path(file_path).read_bytes()
+    except FileNotFoundError:
+        return None
+    
+    _counters.count("disk_reads")
+    if content_hash:
+        _memory.set(content_hash, data)
+    return data
+
+
+async def resume_pdf_bytes(session: AsyncSession, resume: Resume) -> Optional[bytes]:
+    data = await run_blocking("pdf", load_resume_pdf, resume.content_hash, resume.file_path)
+    if data is not None or resume.content_hash is None:
+        return data
+    
+    user = await session.get(User, resume.user_id)
+    if user is None:
+        return None
+    job = await session.get(Job, resume.job_id) if resume.job_id else None
+    
+    content_hash, file_path = await store_resume_pdf(
+        name=user.name,
+        email=user.email,
+        phone=user.phone,
+        linkedin_url=user.linkedin_url,
+        summary=resume.summary,
+        bullets=resume.bullets,
+        template_type=resume.template_type,
+        job_title=job.title if job else None
+    )
+    _counters.count("regenerated")
+    if content_hash != resume.content_hash:
+        logger.warning(f"Resume {resume.id} was regenerated from changed inputs")
+    return await run_blocking("pdf", load_resume_pdf, content_hash, file_path)
+
+
+def remove_unreferenced_file(session: Session, file_path: Optional[str]) -> bool:
+    if not file_path:
+        return False
+    
+    still_used = session.exec(select(Resume.id).where(Resume.file_path == file_path).limit(1)).first()
+    if still_used is not None:
+        return False
+    
+    path = Path(file_path)
+    try:
+        if path.stat().st_mtime > time.time() - settings.resume_gc_grace_seconds:
+            return False
+        path.unlink()
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def collect_orphaned_resume_files(session: Session, grace_seconds: Optional[int] = None) -> int:
+    directory = Path(settings.resume_dir)
+    if not directory.is_dir():
+        return 0
+    
+    grace = settings.resume_gc_grace_seconds if grace_seconds is None else grace_seconds
+    referenced = {
+        Path(file_path).resolve()
+        for file_path in session.exec(select(Resume.file_path).where(Resume.file_path.is_not(None))).all()
+    }
+    cutoff = time.time() - grace
+    
+    removed: List[str] = []
+    for path in directory.iterdir():
+        if not path.is_file() or path.resolve() in referenced:
+            continue
+        try:
+            if path.stat().st_mtime > cutoff:
+                continue
+            path.unlink()
+            removed.append(path.name)
+        except FileNotFoundError:
+            continue
+    
+    _counters.count("collected", len(removed))
+    logger.info(f"Collected {len(removed)} orphaned resume files from {directory}")
+    return len(removed)
+
+
+def resume_store_stats() -> Dict[str, Any]:
+    counters = _counters.snapshot()
+    
+    hits = counters["memory_hits"] + counters["disk_hits"] + counters["coalesced"]
+    lookups = hits + counters["renders"]
+    return {
+        **counters,
+        "in_flight": len(_in_flight),
+        "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+        "disk_copy": settings.resume_disk_copy,
+        "memory_entries": len(_memory),
+        "memory_bytes": _memory.size,
+        "memory_capacity_bytes": _memory.max_bytes
+    }
+
+
+def ensure_resume_store_schema(engine: Engine) -> None:
+    existing = {column["name"] for column in inspect(engine).get_columns("resumes")}
+    if "content_hash" in existing:
+        return
+    
+    with engine.begin() as connection:
+        column_type = Resume.__table__.c["content_hash"].type.compile(dialect=engine.dialect)
+        connection.execute(text(f"ALTER TABLE resumes ADD COLUMN content_hash {column_type}"))
+        connection.execute(text("CREATE INDEX IF NOT EXISTS ix_resumes_content_hash ON resumes (content_hash)"))
@@ -0,0 +1,171 @@
+import copy
+import threading
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Optional
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import inch
+from reportlab.platypus import Flowable, Paragraph, Spacer
+
+LAYOUT_VERSION = 1
+
+
+class ResumeTemplate(NamedTuple):
+    template_type: str
+    expertise_heading: Optional[str] = None
+    expertise_text: Optional[str] = None
+    summary_heading: str = "Professional Summary"
+    experience_heading: str = "Key Skills & Experience"
+    title_color: str = "#1a365d"
+    accent_color: str = "#2c5282"
+
+
+@lru_cache(maxsize=None)
+def resume_styles(title_color: str = "#1a365d", accent_color: str = "#2c5282") -> Dict[str, ParagraphStyle]:
+    styles = getSampleStyleSheet()
+    
+    return {
+        "normal": styles['Normal'],
+        "title": ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=24,
+            textColor=colors.HexColor(title_color),
+            spaceAfter=6,
+            alignment=TA_CENTER
+        ),
+        "heading": ParagraphStyle(
+            'CustomHeading',
+            parent=styles['Heading2'],
+            fontSize=14,
+            textColor=colors.HexColor(accent_color),
+            spaceAfter=6,
+            spaceBefore=12,
+            borderWidth=1,
+            borderColor=colors.HexColor(accent_color),
+            borderPadding=4
+        ),
+        "contact": ParagraphStyle(
+            'Contact',
+            parent=styles['Normal'],
+            fontSize=10,
+            alignment=TA_CENTER,
+            spaceAfter=12
+        ),
+        "bullet": ParagraphStyle(
+            'Bullet',
+            parent=styles['Normal'],
+            fontSize=11,
+            leftIndent=20,
+            spaceAfter=6
+        )
+    }
+
+
+class CompiledTemplate:
+    page_layout: Dict[str, Any] = {
+        "pagesize": letter,
+        "rightMargin": 0.75*inch,
+        "leftMargin": 0.75*inch,
+        "topMargin": 0.75*inch,
+        "bottomMargin": 0.75*inch
+    }
+    
+    def __init__(self, template: ResumeTemplate):
+        self.template = template
+        self.styles = resume_styles(template.title_color, template.accent_color)
+        
+        self.header_gap = Spacer(1, 0.2*inch)
+        self.objective_gap = Spacer(1, 0.1*inch)
+        self.summary_heading = Paragraph(template.summary_heading, self.styles["heading"])
+        self.summary_gap = Spacer(1, 0.15*inch)
+        self.experience_heading = Paragraph(template.experience_heading, self.styles["heading"])
+        
+        self.closing: List[Flowable] = [Spacer(1, 0.15*inch)]
+        if template.expertise_heading:
+            self.closing.append(Paragraph(template.expertise_heading, self.styles["heading"]))
+        if template.expertise_text:
+            self.closing.append(Paragraph(template.expertise_text, self.styles["normal"]))
+    
+    def story(
+        self,
+        name: str,
+        email: str,
+        phone: Optional[str],
+        linkedin_url: Optional[str],
+        summary: str,
+        bullets: List[str],
+        template_type: str,
+        job_title: Optional[str] = None
+    ) -> List[Flowable]:
+        styles = self.styles
+        
+        contact_info = f"{email}"
+        if phone:
+            contact_info += f" | {phone}"
+        if linkedin_url:
+            contact_info += f" | LinkedIn: {linkedin_url}"
+        
+        story = [
+            Paragraph(name, styles["title"]),
+            Paragraph(contact_info, styles["contact"]),
+            copy.copy(self.header_gap)
+        ]
+        
+        if job_title:
+            story.append(Paragraph(f"Objective: {template_type.title()} position in {job_title}", styles["normal"]))
+            story.append(copy.copy(self.objective_gap))
+        
+        story.append(copy.copy(self.summary_heading))
+        story.append(Paragraph(summary, styles["normal"]))
+        story.append(copy.copy(self.summary_gap))
+        
+        story.append(copy.copy(self.experience_heading))
+        for bullet in bullets:
+            bullet_text = bullet.strip()
+            if bullet_text.startswith('-') or bullet_text.startswith('•'):
+                bullet_text = bullet_text[1:].strip()
+            story.append(Paragraph(f"• {bullet_text}", styles["bullet"]))
+        
+        story.extend(copy.copy(flowable) for flowable in self.closing)
+        return story
+
+
+_registry: Dict[str, CompiledTemplate] = {}
+_registry_lock = threading.Lock()
+
+
+def register_template(template: ResumeTemplate) -> CompiledTemplate:
+    compiled = CompiledTemplate(template)
+    with _registry_lock:
+        _registry[template.template_type] = compiled
+    return compiled
+
+
+def get_template(template_type: str) -> CompiledTemplate:
+    return _registry.get(template_type) or DEFAULT_TEMPLATE
+
+
+def registered_templates() -> List[str]:
+    return sorted(_registry)
+
+
+DEFAULT_TEMPLATE = CompiledTemplate(ResumeTemplate("default"))
+
+register_template(ResumeTemplate(
+    "architect",
+    expertise_heading="Cloud Architecture Expertise",
+    expertise_text="Specialized in designing and implementing scalable cloud solutions across AWS, Azure, and GCP platforms."
+))
+register_template(ResumeTemplate(
+    "support",
+    expertise_heading="Technical Support Excellence",
+    expertise_text="Proven track record in providing exceptional cloud infrastructure support and troubleshooting."
+))
+register_template(ResumeTemplate(
+    "devops",
+    expertise_heading="DevOps & Automation",
+    expertise_text="Expert in CI/CD pipelines, infrastructure as code, and cloud automation tools."
+))
@@ -1,5 +1,7 @@
 from typing import Dict, Any, Optional, List
 
+CLOUD_KEYWORDS = ["cloud", "aws", "azure", "gcp", "kubernetes", "docker", "terraform"]
+
 
 def calculate_job_score(
     job_title: str,
@@ -35,8 +37,7 @@ def calculate_job_score(
     breakdown["role_match"] = role_match_score
     score += role_match_score
     
-    cloud_keywords = ["cloud", "aws", "azure", "gcp", "kubernetes", "docker", "terraform"]
-    cloud_count = sum(1 for kw in cloud_keywords if kw in job_description.lower())
+    cloud_count = sum(1 for kw in CLOUD_KEYWORDS if kw in job_description.lower())
     cloud_score = min(cloud_count * 3, 20)
     breakdown["cloud_match"] = cloud_score
     score += cloud_score
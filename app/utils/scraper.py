@@ -1,36 +1,160 @@
-import requests
+import asyncio
+from typing import Any, AsyncIterator, Dict, Iterable, Optional, Tuple
+from urllib.parse import urlsplit
+import httpx
 from bs4 import BeautifulSoup
-from typing import Optional, Dict, Any
+from app.utils.concurrency import run_blocking
 from app.utils.logger import logger
 
+SCRAPE_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
 
-def scrape_job_from_url(url: str) -> Optional[Dict[str, Any]]:
+SCRAPE_TIMEOUT = 10.0
+SCRAPE_MAX_CONNECTIONS = 50
+SCRAPE_MAX_CONCURRENCY = 20
+
+TIMEOUT_BUDGET_ERROR = "Timeout budget exhausted"
+
+_client: Optional[Tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    global _client
+    loop = asyncio.get_running_loop()
+    
+    if _client is None or _client[0] is not loop or _client[1].is_closed:
+        client = httpx.AsyncClient(
+            headers=SCRAPE_HEADERS,
+            timeout=SCRAPE_TIMEOUT,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=SCRAPE_MAX_CONNECTIONS,
+                max_keepalive_connections=SCRAPE_MAX_CONNECTIONS
+            )
+        )
+        _client = (loop, client)
+    
+    return _client[1]
+
+
+async def close_http_client() -> None:
+    global _client
+    if _client is not None:
+        await _client[1].aclose()
+        _client = None
+
+
+def parse_job_html(url: str, html: str) -> Dict[str, Any]:
+    soup = BeautifulSoup(html, 'html.parser')
+    
+    title = soup.find('h1')
+    title_text = title.get_text(strip=True) if title else "Unknown Title"
+    
+    body_text = soup.get_text(separator='\n', strip=True)
+    
+    return {
+        "title": title_text,
+        "company": "Scraped Company",
+        "location": "Not specified",
+        "description": body_text[:5000],
+        "url": url,
+        "source": "url_scrape"
+    }
+
+
+async def _fetch_job(client: httpx.AsyncClient, url: str) -> Dict[str, Any]:
+    response = await client.get(url)
+    response.raise_for_status()
+    return await run_blocking("scrape", parse_job_html, url, response.text)
+
+
+async def scrape_job_from_url(url: str) -> Optional[Dict[str, Any]]:
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        title = soup.find('h1')
-        title_text = title.get_text(strip=True) if title else "Unknown Title"
-        
-        body_text = soup.get_text(separator='\n', strip=True)
-        
-        job = {
-            "title": title_text,
-            "company": "Scraped Company",
-            "location": "Not specified",
-            "description": body_text[:5000],
-            "url": url,
-            "source": "url_scrape"
-        }
-        
-        return job
+        return await _fetch_job(get_http_client(), url)
     
     except Exception as e:
         logger.error(f"Failed to scrape URL {url}: {str(e)}")
         return None
+
+
+class HostThrottle:
+    def __init__(self, per_host_limit: int, politeness_delay: float):
+        self.per_host_limit = per_host_limit
+        self.politeness_delay = politeness_delay
+        self._slots: Dict[str, asyncio.Semaphore] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._next_start: Dict[str, float] = {}
+    
+    def slot(self, host: str) -> asyncio.Semaphore:
+        return self._slots.setdefault(host, asyncio.Semaphore(self.per_host_limit))
+    
+    async def wait_turn(self, host: str) -> None:
+        async with self._locks.setdefault(host, asyncio.Lock()):
+            loop = asyncio.get_running_loop()
+            delay = self._next_start.get(host, 0) - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_start[host] = loop.time() + self.politeness_delay
+
+
+async def _scrape_one(
+    client: httpx.AsyncClient,
+    throttle: HostThrottle,
+    slots: asyncio.Semaphore,
+    url: str
+) -> Dict[str, Any]:
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        return {"url": url, "job": None, "error": "Unsupported URL"}
+    
+    try:
+        async with throttle.slot(parts.hostname), slots:
+            await throttle.wait_turn(parts.hostname)
+            job = await _fetch_job(client, url)
+        return {"url": url, "job": job, "error": None}
+    
+    except Exception as e:
+        logger.warning(f"Failed to scrape URL {url}: {str(e)}")
+        return {"url": url, "job": None, "error": str(e) or e.__class__.__name__}
+
+
+async def scrape_jobs_concurrently(
+    urls: Iterable[str],
+    per_host_limit: int = 2,
+    politeness_delay: float = 0.5,
+    timeout_budget: float = 120,
+    max_concurrency: int = SCRAPE_MAX_CONCURRENCY,
+    client: Optional[httpx.AsyncClient] = None
+) -> AsyncIterator[Dict[str, Any]]:
+    client = client or get_http_client()
+    throttle = HostThrottle(per_host_limit, politeness_delay)
+    slots = asyncio.Semaphore(max_concurrency)
+    
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout_budget
+    
+    pending = {
+        asyncio.create_task(_scrape_one(client, throttle, slots, url)): url
+        for url in dict.fromkeys(urls)
+    }
+    
+    try:
+        while pending:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            
+            done, _ = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                del pending[task]
+                yield task.result()
+        
+        for task, url in list(pending.items()):
+            task.cancel()
+            del pending[task]
+            yield {"url": url, "job": None, "error": TIMEOUT_BUDGET_ERROR}
+    
+    finally:
+        for task in pending:
+            task.cancel()
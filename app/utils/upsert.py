@@ -0,0 +1,6 @@
+from sqlalchemy.dialects import postgresql, sqlite
+
+UPSERT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert
+}
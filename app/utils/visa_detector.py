@@ -1,4 +1,5 @@
 from typing import List, Tuple
+from app.utils.keyword_matcher import KeywordMatcher
 
 VISA_KEYWORDS = [
     "visa sponsorship",
@@ -17,13 +18,11 @@ VISA_KEYWORDS = [
 ]
 
 
+VISA_MATCHER = KeywordMatcher(VISA_KEYWORDS)
+
+
 def detect_visa_sponsorship(description: str) -> Tuple[bool, List[str]]:
-    desc_lower = description.lower()
-    found_keywords = []
-    
-    for keyword in VISA_KEYWORDS:
-        if keyword in desc_lower:
-            found_keywords.append(keyword)
+    found_keywords = VISA_MATCHER.find_all(description)
     
     has_visa = len(found_keywords) > 0
     
@@ -0,0 +1,63 @@
+import io
+import zipfile
+from typing import Iterator
+
+
+class _ChunkBuffer(io.RawIOBase):
+    def __init__(self):
+        self._pending = bytearray()
+        self._offset = 0
+    
+    def writable(self) -> bool:
+        return True
+    
+    def write(self, data) -> int:
+        self._pending += data
+        self._offset += len(data)
+        return len(data)
+    
+    def tell(self) -> int:
+        return self._offset
+    
+    def drain(self) -> bytes:
+        data = bytes(self._pending)
+        self._pending.clear()
+        return data
+
+
+class ZipStream:
+    def __init__(self, compression: int = zipfile.ZIP_DEFLATED, chunk_size: int = 64 * 1024):
+        self.compression = compression
+        self.chunk_size = chunk_size
+        self._buffer = _ChunkBuffer()
+        self._zip = zipfile.ZipFile(self._buffer, "w", compression=compression)
+    
+    @property
+    def bytes_written(self) -> int:
+        return self._buffer.tell()
+    
+    def add_file(self, arcname: str, path: str) -> Iterator[bytes]:
+        info = zipfile.ZipInfo.from_file(path, arcname)
+        info.compress_type = self.compression
+        
+        with open(path, "rb") as source, self._zip.open(info, "w") as target:
+            while True:
+                chunk = source.read(self.chunk_size)
+                if not chunk:
+                    break
+                target.write(chunk)
+                data = self._buffer.drain()
+                if data:
+                    yield data
+        
+        data = self._buffer.drain()
+        if data:
+            yield data
+    
+    def add_bytes(self, arcname: str, data: bytes) -> bytes:
+        self._zip.writestr(arcname, data)
+        return self._buffer.drain()
+    
+    def close(self) -> bytes:
+        self._zip.close()
+        return self._buffer.drain()
@@ -0,0 +1,81 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient
+
+from benchmarks.mock_openai import MockOpenAIServer
+
+CONTENT_TYPES = ["resume_bullets", "recruiter_message"]
+
+
+def seed(count):
+    from sqlmodel import Session
+    from app.db import engine
+    from app.models.job import Job
+    from app.models.settings import Settings
+    
+    with Session(engine) as session:
+        session.add(Settings(user_id=1, ai_mode_enabled=True, openai_api_key="sk-benchmark"))
+        for i in range(count):
+            session.add(Job(
+                title=f"Cloud Engineer {i}",
+                company=f"Company {i}",
+                location="Remote",
+                description=f"Cloud engineer {i} working with AWS, Kubernetes and Terraform"
+            ))
+        session.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sequential /api/ai/generate calls versus one batch request")
+    parser.add_argument("--jobs", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.5, help="Simulated model latency per request")
+    parser.add_argument("--concurrency", type=int, default=None, help="Defaults to AI_BATCH_CONCURRENCY")
+    parser.add_argument("--database-url", default=None, help="Defaults to a temporary SQLite file")
+    args = parser.parse_args()
+    
+    server = MockOpenAIServer(latency=args.latency).start()
+    
+    os.environ["DATABASE_URL"] = args.database_url or f"sqlite:///{tempfile.mkdtemp()}/ai_batch_bench.db"
+    os.environ["OPENAI_BASE_URL"] = server.base_url
+    os.environ["AI_CACHE_ENABLED"] = "false"
+    os.environ.setdefault("ENVIRONMENT", "benchmark")
+    
+    from app.main import app
+    
+    items = [
+        {"job_id": job_id, "content_type": content_type, "tone": "professional"}
+        for job_id in range(1, args.jobs + 1)
+        for content_type in CONTENT_TYPES
+    ]
+    
+    try:
+        with TestClient(app) as client:
+            seed(args.jobs)
+            
+            start = time.perf_counter()
+            for item in items:
+                assert client.post("/api/ai/generate", json=item).json()["success"]
+            sequential = time.perf_counter() - start
+            
+            requests = server.requests
+            start = time.perf_counter()
+            response = client.post("/api/ai/generate/batch", json={"items": items, "concurrency": args.concurrency}).json()
+            batch = time.perf_counter() - start
+            assert response["succeeded"] == len(items), response["failed"]
+            upstream = server.requests - requests
+    finally:
+        server.stop()
+    
+    print(f"{len(items)} items, {args.latency * 1000:.0f} ms simulated model latency")
+    print(f"sequential   {sequential:>8.2f} s")
+    print(f"batch        {batch:>8.2f} s   speedup {sequential / batch:.1f}x")
+    print(f"upstream requests for batch: {upstream}")
+
+
+if __name__ == "__main__":
+    main()
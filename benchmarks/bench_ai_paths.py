@@ -0,0 +1,271 @@
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from unittest import mock
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+
+from benchmarks.bench_ai_streaming import start_api
+from benchmarks.mock_openai import add_server_arguments, server_from_arguments
+
+SCENARIOS = ["engine", "generate", "stream", "resume", "followups"]
+CONTENT_TYPES = ["summary", "resume_bullets", "recruiter_message"]
+DESCRIPTION = (
+    "Responsibilities:\n"
+    "- Design and operate AWS infrastructure with Terraform and Kubernetes.\n"
+    "- Automate CI/CD pipelines and improve observability with Prometheus.\n"
+    "Requirements:\n"
+    "- 5+ years of experience with AWS, Docker and Linux.\n"
+    "- Strong Python or Bash scripting skills.\n"
+)
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def seed(count):
+    from sqlmodel import Session
+    from app.db import engine
+    from app.models.job import Job
+    from app.models.settings import Settings
+    from app.models.user import User
+    
+    with Session(engine) as session:
+        session.add(User(name="Benchmark", email="benchmark@example.com", role_preferences=["cloud engineer"]))
+        session.add(Settings(user_id=1, ai_mode_enabled=True, openai_api_key="sk-benchmark"))
+        for i in range(count):
+            session.add(Job(
+                title=f"Cloud Engineer {i}",
+                company=f"Company {i}",
+                location="Remote",
+                description=DESCRIPTION,
+                applied=True,
+                application_date=datetime.utcnow()
+            ))
+        session.commit()
+
+
+def seed_followups(count):
+    from sqlmodel import Session
+    from app.db import engine
+    from app.models.followup import Followup
+    
+    with Session(engine) as session:
+        for i in range(count):
+            session.add(Followup(job_id=i % 50 + 1, scheduled_date=datetime.utcnow()))
+        session.commit()
+
+
+class Report:
+    def __init__(self, label):
+        self.label = label
+        self.latencies = []
+        self.first_bytes = []
+        self.outcomes = Counter()
+        self.elapsed = 0.0
+        self.upstream = {}
+    
+    def record(self, outcome, latency, first_byte=None):
+        self.outcomes[outcome] += 1
+        if latency is not None:
+            self.latencies.append(latency)
+        if first_byte is not None:
+            self.first_bytes.append(first_byte)
+    
+    def print(self):
+        total = sum(self.outcomes.values())
+        line = (
+            f"{self.label:<10} n={total:<5} ok={self.outcomes['ok']:<5} "
+            f"{total / self.elapsed:>7.1f} req/s   "
+        )
+        if self.latencies:
+            line += (
+                f"p50 {percentile(self.latencies, 0.50) * 1000:>7.0f}  "
+                f"p95 {percentile(self.latencies, 0.95) * 1000:>7.0f}  "
+                f"p99 {percentile(self.latencies, 0.99) * 1000:>7.0f}  "
+                f"max {max(self.latencies) * 1000:>7.0f} ms"
+            )
+        print(line.rstrip())
+        if self.first_bytes:
+            print(
+                f"{'':<10} first byte p50 {percentile(self.first_bytes, 0.50) * 1000:.0f} ms  "
+                f"p95 {percentile(self.first_bytes, 0.95) * 1000:.0f} ms"
+            )
+        errors = {outcome: count for outcome, count in self.outcomes.items() if outcome != "ok"}
+        if errors:
+            print(f"{'':<10} errors {errors}")
+        print(f"{'':<10} upstream {self.upstream}")
+
+
+def run_engine(args, report):
+    from app.utils.ai_engine import AIEngine
+    
+    def call(i):
+        ai_engine = AIEngine(api_key="sk-benchmark", bypass_cache=True, raise_errors=True)
+        start = time.perf_counter()
+        try:
+            ai_engine.generate_summary(f"{DESCRIPTION}\nReference {i}")
+            report.record("ok", time.perf_counter() - start)
+        except Exception as e:
+            report.record(e.__class__.__name__, time.perf_counter() - start)
+    
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        list(pool.map(call, range(args.requests)))
+
+
+async def run_http(args, report, base_url, send):
+    semaphore = asyncio.Semaphore(args.concurrency)
+    limits = httpx.Limits(max_connections=args.concurrency + 4)
+    
+    async with httpx.AsyncClient(base_url=base_url, timeout=300, limits=limits) as client:
+        async def one(i):
+            async with semaphore:
+                start = time.perf_counter()
+                try:
+                    outcome, first_byte = await send(client, i, start)
+                except httpx.HTTPError as e:
+                    outcome, first_byte = e.__class__.__name__, None
+                report.record(outcome, time.perf_counter() - start, first_byte)
+        
+        await asyncio.gather(*(one(i) for i in range(args.requests)))
+
+
+async def send_generate(client, i, start):
+    response = await client.post("/api/ai/generate", json={
+        "content_type": CONTENT_TYPES[i % len(CONTENT_TYPES)],
+        "job_id": i % 50 + 1,
+        "bypass_cache": True
+    })
+    if response.status_code != 200:
+        return f"http_{response.status_code}", None
+    return ("ok" if response.json()["success"] else "failed"), None
+
+
+async def send_stream(client, i, start):
+    first_byte = None
+    outcome = "empty"
+    async with client.stream(
+        "POST",
+        "/api/ai/generate",
+        params={"stream": True},
+        json={"content_type": "recruiter_message", "job_id": i % 50 + 1, "bypass_cache": True}
+    ) as response:
+        if response.status_code != 200:
+            return f"http_{response.status_code}", None
+        async for line in response.aiter_lines():
+            if first_byte is None:
+                first_byte = time.perf_counter() - start
+            if line.startswith("event: "):
+                outcome = {"done": "ok", "error": "failed"}.get(line[7:], outcome)
+    return outcome, first_byte
+
+
+async def send_resume(client, i, start):
+    response = await client.post("/api/resumes/new", json={"job_id": i % 50 + 1, "use_ai": True})
+    if response.status_code != 200:
+        return f"http_{response.status_code}", None
+    return ("ok" if response.json()["is_ai_generated"] else "fallback"), None
+
+
+def run_followups(args, report):
+    from sqlmodel import Session, select
+    from app.db import engine
+    from app.models.email_log import EmailLog
+    from worker.worker_main import process_pending_followups
+    
+    seed_followups(args.requests)
+    process_pending_followups()
+    
+    with Session(engine) as session:
+        for email_log in session.exec(select(EmailLog).where(EmailLog.email_type == "followup")).all():
+            source = (email_log.email_metadata or {}).get("message_source")
+            report.record("ok" if email_log.status == "sent" and source == "ai" else source or email_log.status, None)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Throughput and latency of the AI paths against a local mock OpenAI server")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help=f"Comma separated subset of {','.join(SCENARIOS)}")
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--smtp-delay", type=float, default=0.0, help="Seconds each simulated SMTP send blocks for")
+    parser.add_argument("--database-url", default=None, help="Defaults to a temporary SQLite file")
+    add_server_arguments(parser)
+    args = parser.parse_args()
+    
+    scenarios = [scenario.strip() for scenario in args.scenarios.split(",") if scenario.strip()]
+    unknown = set(scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+    
+    server = server_from_arguments(args).start()
+    
+    workdir = tempfile.mkdtemp()
+    os.environ["DATABASE_URL"] = args.database_url or f"sqlite:///{workdir}/ai_paths_bench.db"
+    os.environ["OPENAI_BASE_URL"] = server.base_url
+    os.environ["AI_CACHE_ENABLED"] = "false"
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    os.environ.setdefault("ENVIRONMENT", "benchmark")
+    os.chdir(workdir)
+    os.makedirs("logs", exist_ok=True)
+    
+    from app.main import app
+    from app.utils.ai_metrics import ai_metrics
+    from app.utils.circuit_breaker import openai_breaker
+    from app.utils.email_sender import EmailSender
+    
+    def fake_send(self, recipient, subject, body, attachment_path=None):
+        time.sleep(args.smtp_delay)
+        return {"success": True, "sender": "benchmark@example.com"}
+    
+    api, thread, base_url = start_api(app)
+    seed(50)
+    
+    print(
+        f"mock: {args.distribution} latency {args.latency * 1000:.0f} ms (jitter {args.jitter}), "
+        f"errors {server.errors or 'none'}; {args.requests} requests per scenario, concurrency {args.concurrency}"
+    )
+    
+    try:
+        with mock.patch.object(EmailSender, "send_email", fake_send):
+            for scenario in scenarios:
+                report = Report(scenario)
+                server.reset_stats()
+                start = time.perf_counter()
+                
+                if scenario == "engine":
+                    run_engine(args, report)
+                elif scenario == "followups":
+                    run_followups(args, report)
+                else:
+                    send = {"generate": send_generate, "stream": send_stream, "resume": send_resume}[scenario]
+                    asyncio.run(run_http(args, report, base_url, send))
+                
+                report.elapsed = time.perf_counter() - start
+                report.upstream = server.stats()["responses"]
+                report.print()
+    finally:
+        api.should_exit = True
+        thread.join()
+        server.stop()
+    
+    breaker = openai_breaker.snapshot()
+    print(f"circuit breaker: {breaker['state']}, {breaker['trips']} trips")
+    for call in ai_metrics()["calls"]:
+        latency = call["latency"]
+        print(
+            f"server-side {call['content_type']:<18} {call['outcomes']}  "
+            f"p50 {latency['p50_ms']} ms  p95 {latency['p95_ms']} ms  p99 {latency['p99_ms']} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
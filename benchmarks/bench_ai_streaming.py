@@ -0,0 +1,100 @@
+import argparse
+import os
+import socket
+import statistics
+import sys
+import tempfile
+import threading
+import time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+import uvicorn
+
+from benchmarks.mock_openai import MockOpenAIServer
+
+CONTENT = (
+    "Hi team, I came across the Cloud Engineer opening and would love to be considered. "
+    "Over the last five years I have built and operated AWS infrastructure with Terraform and Kubernetes, "
+    "and I enjoy making deployments boring and repeatable. I would welcome the chance to talk about how "
+    "I could help your platform team. Thank you for your time."
+)
+
+
+def seed():
+    from sqlmodel import Session
+    from app.db import engine
+    from app.models.job import Job
+    from app.models.settings import Settings
+    
+    with Session(engine) as session:
+        session.add(Settings(user_id=1, ai_mode_enabled=True, openai_api_key="sk-benchmark"))
+        session.add(Job(title="Cloud Engineer", company="Acme", location="Remote", description="AWS, Kubernetes and Terraform"))
+        session.commit()
+
+
+def start_api(app):
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+    return server, thread, f"http://127.0.0.1:{port}"
+
+
+def time_request(client, stream):
+    start = time.perf_counter()
+    first_byte = None
+    with client.stream(
+        "POST",
+        "/api/ai/generate",
+        params={"stream": stream},
+        json={"content_type": "recruiter_message", "job_id": 1, "bypass_cache": True}
+    ) as response:
+        response.raise_for_status()
+        for _ in response.iter_raw():
+            if first_byte is None:
+                first_byte = time.perf_counter() - start
+    return first_byte, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time to first byte of /api/ai/generate with and without streaming")
+    parser.add_argument("--requests", type=int, default=10)
+    parser.add_argument("--first-token", type=float, default=0.3, help="Simulated latency before the first token")
+    parser.add_argument("--token-interval", type=float, default=0.03, help="Simulated delay between tokens")
+    args = parser.parse_args()
+    
+    mock = MockOpenAIServer(latency=args.first_token, token_interval=args.token_interval, content=CONTENT).start()
+    
+    os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/ai_streaming_bench.db"
+    os.environ["OPENAI_BASE_URL"] = mock.base_url
+    os.environ.setdefault("ENVIRONMENT", "benchmark")
+    
+    from app.main import app
+    
+    server, thread, base_url = start_api(app)
+    try:
+        seed()
+        with httpx.Client(base_url=base_url, timeout=60) as client:
+            for stream in (False, True):
+                timings = [time_request(client, stream) for _ in range(args.requests)]
+                print(
+                    f"{'stream' if stream else 'buffered':<9} "
+                    f"first byte {statistics.median(t[0] for t in timings) * 1000:>8.1f} ms   "
+                    f"complete {statistics.median(t[1] for t in timings) * 1000:>8.1f} ms"
+                )
+    finally:
+        server.should_exit = True
+        thread.join()
+        mock.stop()
+    
+    print(f"{len(CONTENT.split())} tokens, {args.first_token * 1000:.0f} ms to first token, {args.token_interval * 1000:.0f} ms between tokens")
+
+
+if __name__ == "__main__":
+    main()
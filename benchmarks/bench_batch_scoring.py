@@ -0,0 +1,98 @@
+import argparse
+import random
+import sys
+import os
+import time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.scoring import calculate_job_score, CLOUD_KEYWORDS
+from app.utils.batch_scoring import calculate_job_scores
+
+CLASSIFICATIONS = [None, "cloud engineer", "cloud architect", "devops", "it support", "sysadmin", "helpdesk"]
+TITLES = ["Cloud Engineer", "Senior DevOps Engineer", "Platform Specialist", "IT Support Analyst", "SRE"]
+COUNTRIES = [None, "", "Germany", "United States", "Canada", "Netherlands", "India"]
+LOCATIONS = ["Berlin", "Remote - Canada", "Austin, TX", "Amsterdam", "Bangalore"]
+FILLER = "we value ownership collaboration and continuous learning across distributed teams".split()
+
+PROFILES = [
+    {"role_preferences": ["cloud engineer", "devops"], "country_preferences": ["germany", "canada"], "min_salary": 80000, "visa_required": True},
+    {"role_preferences": [], "country_preferences": [], "min_salary": None, "visa_required": False},
+    {"role_preferences": ["Support"], "country_preferences": ["United"], "min_salary": 0, "visa_required": False},
+    {"role_preferences": ["architect"], "country_preferences": ["remote"], "min_salary": 120000, "visa_required": True}
+]
+
+
+def build_jobs(size, seed=7):
+    rng = random.Random(seed)
+    jobs = []
+    for _ in range(size):
+        words = [rng.choice(FILLER + CLOUD_KEYWORDS) for _ in range(rng.randint(20, 400))]
+        jobs.append({
+            "title": rng.choice(TITLES),
+            "description": " ".join(words),
+            "classification": rng.choice(CLASSIFICATIONS),
+            "location": rng.choice(LOCATIONS),
+            "country": rng.choice(COUNTRIES),
+            "has_visa_sponsorship": rng.random() < 0.3,
+            "salary_min": rng.choice([None, 0, 50000, 70000, 90000, 150000])
+        })
+    return jobs
+
+
+def score_one_by_one(jobs, profile):
+    return [
+        calculate_job_score(
+            job_title=job["title"],
+            job_description=job["description"],
+            job_classification=job["classification"],
+            job_location=job["location"],
+            job_country=job["country"],
+            has_visa=job["has_visa_sponsorship"],
+            salary_min=job["salary_min"],
+            salary_max=None,
+            user_role_preferences=profile["role_preferences"],
+            user_country_preferences=profile["country_preferences"],
+            user_min_salary=profile["min_salary"],
+            user_visa_required=profile["visa_required"]
+        )
+        for job in jobs
+    ]
+
+
+def score_batch(jobs, profile):
+    return calculate_job_scores(
+        jobs,
+        user_role_preferences=profile["role_preferences"],
+        user_country_preferences=profile["country_preferences"],
+        user_min_salary=profile["min_salary"],
+        user_visa_required=profile["visa_required"]
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch scoring benchmark")
+    parser.add_argument("--jobs", type=int, default=20000)
+    args = parser.parse_args()
+    
+    jobs = build_jobs(args.jobs)
+    
+    for index, profile in enumerate(PROFILES):
+        start = time.perf_counter()
+        expected = score_one_by_one(jobs, profile)
+        single_elapsed = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        actual = score_batch(jobs, profile)
+        batch_elapsed = time.perf_counter() - start
+        
+        assert actual == expected, f"profile {index} diverged"
+        print(
+            f"profile {index}: {len(jobs)} jobs identical  "
+            f"calculate_job_score {single_elapsed * 1000:.1f} ms  "
+            f"calculate_job_scores {batch_elapsed * 1000:.1f} ms  "
+            f"({single_elapsed / batch_elapsed:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import socket
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+import requests
+import uvicorn
+
+STUB_HOSTS = ["127.0.0.1", "127.0.0.2", "127.0.0.3"]
+
+SCHEDULING_TOLERANCE = 0.015
+
+DESCRIPTION_WORDS = [
+    "platform", "migration", "observability", "networking", "security", "automation", "pipelines", "serverless",
+    "databases", "storage", "compliance", "incident", "capacity", "latency", "billing", "identity", "edge",
+    "analytics", "streaming", "containers", "budgets", "reliability", "tooling", "onboarding", "hybrid"
+]
+
+
+class StubStats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.in_flight = defaultdict(int)
+        self.max_in_flight = defaultdict(int)
+        self.starts = defaultdict(list)
+    
+    def enter(self, host):
+        with self.lock:
+            self.in_flight[host] += 1
+            self.max_in_flight[host] = max(self.max_in_flight[host], self.in_flight[host])
+            self.starts[host].append(time.perf_counter())
+    
+    def leave(self, host):
+        with self.lock:
+            self.in_flight[host] -= 1
+    
+    def snapshot(self):
+        with self.lock:
+            return {
+                host: {
+                    "requests": len(starts),
+                    "max_in_flight": self.max_in_flight[host],
+                    "min_gap": min((b - a for a, b in zip(sorted(starts), sorted(starts)[1:])), default=0)
+                }
+                for host, starts in self.starts.items()
+            }
+
+
+def serve_stub(port_queue, latency, slow_delay):
+    stats = StubStats()
+    
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        
+        def do_GET(self):
+            if self.path == "/__stats":
+                self.respond(200, json.dumps(stats.snapshot()).encode())
+                return
+            
+            host = self.headers["Host"].split(":")[0]
+            stats.enter(host)
+            try:
+                time.sleep(slow_delay if self.path.startswith("/slow") else latency)
+                
+                if self.path.startswith("/job/"):
+                    job_number = self.path.rsplit("/", 1)[-1]
+                    details = " ".join(random.Random(f"{host}{self.path}").choices(DESCRIPTION_WORDS, k=40))
+                    self.respond(200, (
+                        f"<html><body><h1>Cloud Engineer {job_number}</h1>"
+                        f"<p>Kubernetes, Terraform and AWS on {host}: {details}. Visa sponsorship available.</p></body></html>"
+                    ).encode())
+                else:
+                    self.respond(404, b"not found")
+            finally:
+                stats.leave(host)
+        
+        def respond(self, status, body):
+            try:
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+        
+        def log_message(self, *args):
+            pass
+    
+    server = ThreadingHTTPServer(("0.0.0.0", 0), Handler)
+    server.daemon_threads = True
+    port_queue.put(server.server_address[1])
+    server.serve_forever()
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk URL import against a local stub HTTP server")
+    parser.add_argument("--jobs-per-host", type=int, default=40)
+    parser.add_argument("--latency", type=float, default=0.1, help="Stub response latency per request")
+    parser.add_argument("--per-host-limit", type=int, default=3)
+    parser.add_argument("--politeness-delay", type=float, default=0.05)
+    parser.add_argument("--timeout-budget", type=float, default=5.0)
+    parser.add_argument("--database-url", default=None, help="Defaults to a temporary SQLite file")
+    parser.add_argument("--skip-sequential", action="store_true", help="Skip the one-at-a-time requests baseline")
+    args = parser.parse_args()
+    
+    os.environ["DATABASE_URL"] = args.database_url or f"sqlite:///{tempfile.mkdtemp()}/url_import_bench.db"
+    os.environ.setdefault("ENVIRONMENT", "benchmark")
+    
+    from sqlalchemy import func
+    from sqlmodel import Session, select
+    from app.main import app
+    from app.db import engine
+    from app.models.job import Job
+    
+    port_queue = multiprocessing.Queue()
+    stub = multiprocessing.Process(
+        target=serve_stub,
+        args=(port_queue, args.latency, args.timeout_budget + 5),
+        daemon=True
+    )
+    stub.start()
+    stub_port = port_queue.get(timeout=10)
+    
+    job_urls = [
+        f"http://{host}:{stub_port}/job/{i}"
+        for i in range(args.jobs_per_host)
+        for host in STUB_HOSTS
+    ]
+    missing_urls = [f"http://{host}:{stub_port}/missing" for host in STUB_HOSTS]
+    slow_urls = [f"http://127.0.0.1:{stub_port}/slow/{i}" for i in range(2)]
+    invalid_urls = ["ftp://example.com/job", "not a url"]
+    urls = job_urls + missing_urls + slow_urls + invalid_urls + job_urls[:5]
+    
+    port = free_port()
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="critical"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+    
+    lines = []
+    start = time.perf_counter()
+    first_line = None
+    last_import = None
+    try:
+        with httpx.stream(
+            "POST",
+            f"http://127.0.0.1:{port}/api/jobs/import/urls",
+            json={
+                "urls": urls,
+                "per_host_limit": args.per_host_limit,
+                "politeness_delay": args.politeness_delay,
+                "timeout_budget": args.timeout_budget
+            },
+            timeout=args.timeout_budget + 30
+        ) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if line:
+                    first_line = first_line or time.perf_counter() - start
+                    lines.append(json.loads(line))
+                    if lines[-1].get("status") == "imported":
+                        last_import = time.perf_counter() - start
+        elapsed = time.perf_counter() - start
+    finally:
+        server.should_exit = True
+        thread.join()
+    
+    summary = lines[-1]
+    results = {line["url"]: line for line in lines[:-1]}
+    
+    with Session(engine) as session:
+        stored = session.exec(select(func.count()).select_from(Job)).one()
+    
+    assert summary["done"] and len(results) == len(lines) - 1, "Duplicate URLs should be fetched once"
+    assert summary["imported"] == len(job_urls) == stored, summary
+    assert all(results[url]["status"] == "imported" for url in job_urls)
+    assert all(results[url]["status"] == "failed" for url in missing_urls + invalid_urls)
+    assert all(results[url]["error"] == "Timeout budget exhausted" for url in slow_urls)
+    
+    stats = httpx.get(f"http://127.0.0.1:{stub_port}/__stats").json()
+    for host in STUB_HOSTS:
+        host_stats = stats[host]
+        assert host_stats["max_in_flight"] <= args.per_host_limit, (host, host_stats)
+        assert host_stats["min_gap"] >= args.politeness_delay - SCHEDULING_TOLERANCE, (host, host_stats)
+        print(f"{host:<10} requests {host_stats['requests']:>4}   max in flight {host_stats['max_in_flight']}   min start gap {host_stats['min_gap'] * 1000:.1f} ms")
+    
+    print(f"Imported {summary['imported']}, failed {summary['failed']} of {len(results)} unique URLs")
+    print(
+        f"bulk         first result {first_line * 1000:.0f} ms   last import {last_import:.2f}s   "
+        f"total {elapsed:.2f}s (slow URLs cut off by the {args.timeout_budget:.1f}s budget)"
+    )
+    
+    if not args.skip_sequential:
+        start = time.perf_counter()
+        with requests.Session() as session:
+            for url in job_urls:
+                session.get(url, timeout=10).raise_for_status()
+        print(f"sequential   {len(job_urls)} job URLs fetched one at a time in {time.perf_counter() - start:.2f}s")
+    
+    stub.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+import argparse
+import random
+import sys
+import os
+import tempfile
+import time
+import tracemalloc
+from collections import defaultdict
+from datetime import datetime, timedelta
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import insert
+from sqlmodel import SQLModel, Session, create_engine, select
+from app.models import Job, Resume
+from app.utils.dashboard_metrics import compute_dashboard_metrics
+from app.utils.metrics_rollup import compute_rollup_metrics, rebuild_metrics_rollups
+
+STATUSES = ["pending", "applied", "interviewing", "offered", "rejected"]
+COUNTRIES = [None, "Germany", "United States", "Canada", "Netherlands", "India", "Ireland"]
+CLASSIFICATIONS = [None, "cloud engineer", "devops", "cloud support", "sysadmin", "it support"]
+TEMPLATES = ["architect", "support", "devops"]
+
+
+def legacy_dashboard_metrics(session):
+    all_jobs = session.exec(select(Job)).all()
+    all_resumes = session.exec(select(Resume)).all()
+    
+    total_applications = len([j for j in all_jobs if j.applied])
+    
+    callback_count = len([j for j in all_jobs if j.application_status in ["interviewing", "offered"]])
+    offer_count = len([j for j in all_jobs if j.application_status == "offered"])
+    
+    callback_rate = (callback_count / total_applications * 100) if total_applications > 0 else 0
+    offer_rate = (offer_count / total_applications * 100) if total_applications > 0 else 0
+    
+    country_stats = defaultdict(lambda: {"applied": 0, "callbacks": 0, "offers": 0})
+    role_stats = defaultdict(lambda: {"applied": 0, "callbacks": 0, "offers": 0})
+    for job in all_jobs:
+        for key, stats in ((job.country, country_stats), (job.classification, role_stats)):
+            if job.applied and key:
+                stats[key]["applied"] += 1
+                if job.application_status in ["interviewing", "offered"]:
+                    stats[key]["callbacks"] += 1
+                if job.application_status == "offered":
+                    stats[key]["offers"] += 1
+    
+    template_stats = defaultdict(lambda: {"used": 0, "callbacks": 0, "offers": 0})
+    for resume in all_resumes:
+        template = resume.template_type
+        template_stats[template]["used"] += resume.times_used
+        template_stats[template]["callbacks"] += resume.callback_count
+        template_stats[template]["offers"] += resume.offer_count
+    
+    date_groups = defaultdict(int)
+    for job in all_jobs:
+        if job.applied and job.application_date:
+            date_groups[job.application_date.strftime("%Y-%m-%d")] += 1
+    
+    return {
+        "overview": {
+            "total_jobs": len(all_jobs),
+            "total_applications": total_applications,
+            "pending_applications": len(all_jobs) - total_applications,
+            "callback_count": callback_count,
+            "offer_count": offer_count,
+            "callback_rate": round(callback_rate, 2),
+            "offer_rate": round(offer_rate, 2)
+        },
+        "country_success": dict(country_stats),
+        "role_success": dict(role_stats),
+        "template_success": dict(template_stats),
+        "timeline": [{"date": key, "applications": date_groups[key]} for key in sorted(date_groups)]
+    }
+
+
+def populate(engine, job_count, desc_length, seed=3):
+    rng = random.Random(seed)
+    start_date = datetime(2024, 1, 1)
+    description = ("cloud infrastructure reliability " * (desc_length // 32 + 1))[:desc_length]
+    
+    with Session(engine) as session:
+        batch = []
+        for i in range(job_count):
+            applied = rng.random() < 0.6
+            batch.append({
+                "title": f"Cloud Engineer {i}",
+                "company": f"Company {i % 500}",
+                "location": "Remote",
+                "country": rng.choice(COUNTRIES),
+                "description": description,
+                "source": "benchmark",
+                "classification": rng.choice(CLASSIFICATIONS),
+                "has_visa_sponsorship": False,
+                "visa_keywords": [],
+                "score": rng.randint(0, 100),
+                "applied": applied,
+                "application_date": start_date + timedelta(minutes=rng.randint(0, 60 * 24 * 365)) if applied else None,
+                "application_status": rng.choice(STATUSES[1:]) if applied else "pending",
+                "created_at": start_date,
+                "updated_at": start_date
+            })
+            if len(batch) == 5000:
+                session.execute(insert(Job), batch)
+                batch = []
+        if batch:
+            session.execute(insert(Job), batch)
+        
+        session.execute(insert(Resume), [
+            {
+                "resume_name": f"resume_{i}.pdf",
+                "template_type": rng.choice(TEMPLATES),
+                "content": {},
+                "bullets": [],
+                "times_used": rng.randint(0, 20),
+                "callback_count": rng.randint(0, 5),
+                "offer_count": rng.randint(0, 2),
+                "created_at": start_date
+            }
+            for i in range(job_count // 100)
+        ])
+        session.commit()
+
+
+def measure(label, func, engine):
+    with Session(engine) as session:
+        tracemalloc.start()
+        start = time.perf_counter()
+        result = func(session)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    
+    print(f"{label:<12} {elapsed * 1000:>10.1f} ms   peak {peak / 1024 / 1024:>8.1f} MiB")
+    return result, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dashboard metrics benchmark")
+    parser.add_argument("--jobs", type=int, default=100000)
+    parser.add_argument("--desc-length", type=int, default=2000)
+    parser.add_argument("--database-url", default=None, help="Defaults to a temporary SQLite file; its tables are dropped and recreated")
+    args = parser.parse_args()
+    
+    database_url = args.database_url or f"sqlite:///{tempfile.mkdtemp()}/dashboard_bench.db"
+    engine = create_engine(database_url)
+    SQLModel.metadata.drop_all(engine)
+    SQLModel.metadata.create_all(engine)
+    
+    start = time.perf_counter()
+    populate(engine, args.jobs, args.desc_length)
+    print(f"Inserted {args.jobs} jobs into {engine.dialect.name} in {time.perf_counter() - start:.1f}s")
+    
+    legacy, legacy_elapsed = measure("legacy", legacy_dashboard_metrics, engine)
+    aggregated, aggregated_elapsed = measure("sql", compute_dashboard_metrics, engine)
+    
+    assert legacy == aggregated, "SQL aggregation diverged from the legacy implementation"
+    print(f"Results identical, speedup {legacy_elapsed / aggregated_elapsed:.1f}x")
+    
+    _, rebuild_elapsed = measure("rebuild", rebuild_metrics_rollups, engine)
+    rollup, rollup_elapsed = measure("rollup", compute_rollup_metrics, engine)
+    
+    without_templates = lambda metrics: {k: v for k, v in metrics.items() if k != "template_success"}
+    assert without_templates(rollup) == without_templates(aggregated), "Rollup metrics diverged from the SQL aggregation"
+    print(f"Rollup results identical, speedup {legacy_elapsed / rollup_elapsed:.1f}x over legacy, {aggregated_elapsed / rollup_elapsed:.1f}x over sql")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+VOCABULARY = [f"term{i}" for i in range(5000)]
+DESCRIPTION_LENGTH = 250
+
+
+def build_description(rng):
+    return " ".join(rng.choice(VOCABULARY) for _ in range(DESCRIPTION_LENGTH))
+
+
+def edit_description(rng, description, edits):
+    words = description.split()
+    for index in rng.sample(range(len(words)), edits):
+        words[index] = rng.choice(VOCABULARY)
+    return " ".join(words)
+
+
+def shingles(description):
+    from app.utils.dedup import SHINGLE_SIZE
+    
+    words = description.split()
+    return {" ".join(words[start:start + SHINGLE_SIZE]) for start in range(len(words) - SHINGLE_SIZE + 1)}
+
+
+def jaccard(first, second):
+    return len(first & second) / len(first | second)
+
+
+def populate(session, descriptions, offset):
+    from app.models.job import Job
+    from app.utils.dedup import dedup_keys, index_job_bands
+    from app.utils.job_importer import bulk_insert_jobs, JOB_INSERT_COLUMNS
+    
+    rows = []
+    for index, description in enumerate(descriptions, start=offset):
+        job = Job(
+            title=f"Cloud Engineer {index}",
+            company="Benchmark",
+            location="Remote",
+            description=description,
+            source="benchmark",
+            visa_keywords=[],
+            **dedup_keys(f"Cloud Engineer {index}", "Benchmark", "Remote", None, description, None)
+        )
+        rows.append({column: getattr(job, column) for column in JOB_INSERT_COLUMNS})
+    
+    bulk_insert_jobs(session, rows)
+    session.flush()
+    job_ids = dict(session.exec(
+        Job.__table__.select().with_only_columns(Job.content_hash, Job.id).where(Job.id > offset)
+    ).all())
+    index_job_bands(session, [(job_ids[row["content_hash"]], row["minhash"]) for row in rows])
+    session.commit()
+
+
+def brute_force(session, queries):
+    from app.models.job import Job
+    from app.utils.dedup import NEAR_DUPLICATE_THRESHOLD, signature_similarity
+    
+    signatures = session.exec(Job.__table__.select().with_only_columns(Job.id, Job.minhash)).all()
+    matches = []
+    for query in queries:
+        best = max(
+            ((signature_similarity(query["minhash"], signature), job_id) for job_id, signature in signatures),
+            default=(0, None)
+        )
+        matches.append(best[1] if best[0] >= NEAR_DUPLICATE_THRESHOLD else None)
+    return matches
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Near-duplicate lookup through the LSH band index versus a full scan")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 20000])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--database-url", default=None, help="Defaults to a temporary SQLite file")
+    args = parser.parse_args()
+    
+    os.environ["DATABASE_URL"] = args.database_url or f"sqlite:///{tempfile.mkdtemp()}/dedup_bench.db"
+    os.environ.setdefault("ENVIRONMENT", "benchmark")
+    
+    from sqlmodel import Session
+    from app.db import engine, create_db_and_tables
+    from app.utils.dedup import NEAR_DUPLICATE_THRESHOLD, dedup_keys, find_duplicates
+    
+    create_db_and_tables()
+    rng = random.Random(11)
+    descriptions = []
+    
+    with Session(engine) as session:
+        for size in sorted(args.sizes):
+            added = [build_description(rng) for _ in range(size - len(descriptions))]
+            populate(session, added, len(descriptions))
+            descriptions.extend(added)
+            
+            sources = [rng.randrange(len(descriptions)) for _ in range(args.queries)]
+            query_descriptions = [
+                edit_description(rng, descriptions[source], rng.choice([2, 5, 10, 25])) if index % 2 == 0 else build_description(rng)
+                for index, source in enumerate(sources)
+            ]
+            queries = [
+                {
+                    "title": f"Query {index}",
+                    "company": "Benchmark",
+                    "location": "Remote",
+                    "country": None,
+                    "url": None,
+                    "source": "benchmark",
+                    **dedup_keys(f"Query {index}", "Benchmark", "Remote", None, description, None)
+                }
+                for index, description in enumerate(query_descriptions)
+            ]
+            
+            start = time.perf_counter()
+            matches = find_duplicates(session, queries)
+            lsh_elapsed = time.perf_counter() - start
+            
+            start = time.perf_counter()
+            scanned = brute_force(session, queries)
+            scan_elapsed = time.perf_counter() - start
+            
+            expected = [
+                index % 2 == 0 and jaccard(shingles(description), shingles(descriptions[source])) >= NEAR_DUPLICATE_THRESHOLD
+                for index, (source, description) in enumerate(zip(sources, query_descriptions))
+            ]
+            found = [match is not None for match in matches]
+            true_positives = sum(1 for hit, truth in zip(found, expected) if hit and truth)
+            precision = true_positives / max(1, sum(found))
+            recall = true_positives / max(1, sum(expected))
+            agreement = sum(1 for match, other in zip(matches, scanned) if (match and match.job_id) == other) / len(queries)
+            
+            print(
+                f"jobs {size:>7}   lsh {lsh_elapsed / len(queries) * 1000:>7.2f} ms/query   "
+                f"scan {scan_elapsed / len(queries) * 1000:>8.2f} ms/query   "
+                f"precision {precision:.2f}   recall {recall:.2f}   agrees with scan {agreement:.0%}"
+            )
+
+
+if __name__ == "__main__":
+    main()
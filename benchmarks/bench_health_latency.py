@@ -0,0 +1,153 @@
+import argparse
+import asyncio
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import Executor, Future
+from unittest import mock
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+import uvicorn
+
+
+class InlineExecutor(Executor):
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+        return future
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def seed_jobs(count):
+    from sqlalchemy import insert
+    from sqlmodel import Session
+    from app.db import engine
+    from app.models.job import Job
+    
+    with Session(engine) as session:
+        result = session.execute(
+            insert(Job).returning(Job.id),
+            [
+                {
+                    "title": f"Cloud Engineer {i}",
+                    "company": "Benchmark",
+                    "location": "Remote",
+                    "description": "aws kubernetes terraform",
+                    "source": "benchmark",
+                    "visa_keywords": []
+                }
+                for i in range(count)
+            ]
+        )
+        job_ids = [row[0] for row in result]
+        session.commit()
+    return job_ids
+
+
+async def poll_health(client, stop, interval, latencies):
+    while not stop.is_set():
+        start = time.perf_counter()
+        response = await client.get("/api/health")
+        response.raise_for_status()
+        latencies.append(time.perf_counter() - start)
+        await asyncio.sleep(interval)
+
+
+async def run_phase(client, job_ids, interval):
+    latencies = []
+    stop = asyncio.Event()
+    poller = asyncio.create_task(poll_health(client, stop, interval, latencies))
+    
+    failed = 0
+    start = time.perf_counter()
+    if job_ids:
+        responses = await asyncio.gather(*(
+            client.post(f"/api/apply/{job_id}", json={"job_id": job_id}) for job_id in job_ids
+        ))
+        failed = sum(1 for response in responses if response.status_code != 200)
+    else:
+        await asyncio.sleep(1)
+    elapsed = time.perf_counter() - start
+    
+    stop.set()
+    await poller
+    return latencies, elapsed, failed
+
+
+def report(label, latencies, elapsed, failed):
+    print(
+        f"{label:<8} health n={len(latencies):<5} "
+        f"p50 {percentile(latencies, 0.50) * 1000:>8.1f} ms   "
+        f"p99 {percentile(latencies, 0.99) * 1000:>8.1f} ms   "
+        f"max {max(latencies) * 1000:>8.1f} ms   wall {elapsed:.2f}s   failed {failed}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="/api/health latency while /api/apply calls are in flight")
+    parser.add_argument("--apply-calls", type=int, default=20)
+    parser.add_argument("--smtp-delay", type=float, default=0.5, help="Seconds each simulated SMTP send blocks for")
+    parser.add_argument("--interval", type=float, default=0.01, help="Delay between health probes")
+    parser.add_argument("--inline", action="store_true", help="Run blocking work on the event loop, as the handlers did before")
+    parser.add_argument("--database-url", default=None, help="Defaults to a temporary SQLite file")
+    args = parser.parse_args()
+    
+    os.environ["DATABASE_URL"] = args.database_url or f"sqlite:///{tempfile.mkdtemp()}/health_bench.db"
+    os.environ.setdefault("ENVIRONMENT", "benchmark")
+    
+    from app.main import app
+    from app.utils import concurrency
+    from app.utils.email_sender import EmailSender
+    
+    if args.inline:
+        concurrency._executors.update({pool: InlineExecutor() for pool in concurrency.BLOCKING_POOL_SIZES})
+    
+    def slow_send(self, recipient, subject, body, attachment_path=None):
+        time.sleep(args.smtp_delay)
+        return {"success": True, "sender": "benchmark@example.com"}
+    
+    port = free_port()
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="critical"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+    
+    job_ids = seed_jobs(args.apply_calls)
+    
+    async def run():
+        limits = httpx.Limits(max_connections=args.apply_calls + 10)
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", timeout=300, limits=limits) as client:
+            report("idle", *await run_phase(client, [], args.interval))
+            with mock.patch.object(EmailSender, "send_email", slow_send):
+                report("apply", *await run_phase(client, job_ids, args.interval))
+    
+    try:
+        asyncio.run(run())
+    finally:
+        server.should_exit = True
+        thread.join()
+    
+    mode = "inline (blocking)" if args.inline else "offloaded"
+    print(f"{args.apply_calls} concurrent apply calls, {args.smtp_delay}s SMTP each, blocking work {mode}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+import argparse
+import random
+import sys
+import os
+import time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.classification import (
+    CODING_HEAVY_ROLES,
+    ROLE_CLASSIFICATIONS,
+    classify_job,
+    is_excluded_role,
+    analyze_job
+)
+from app.utils.visa_detector import VISA_KEYWORDS, detect_visa_sponsorship
+
+
+def legacy_classify_job(title, description):
+    title_lower = title.lower()
+    desc_lower = description.lower()
+    
+    for coding_role in CODING_HEAVY_ROLES:
+        if coding_role in title_lower:
+            return None
+    
+    for classification, keywords in ROLE_CLASSIFICATIONS.items():
+        for keyword in keywords:
+            if keyword in title_lower:
+                return classification
+    
+    for classification, keywords in ROLE_CLASSIFICATIONS.items():
+        for keyword in keywords:
+            if keyword in desc_lower:
+                return classification
+    
+    return None
+
+
+def legacy_is_excluded_role(title, description, excluded_roles=None):
+    if excluded_roles is None:
+        excluded_roles = []
+    
+    title_lower = title.lower()
+    desc_lower = description.lower()
+    
+    for coding_role in CODING_HEAVY_ROLES:
+        if coding_role in title_lower:
+            return True
+    
+    for excluded in excluded_roles:
+        if excluded.lower() in title_lower or excluded.lower() in desc_lower:
+            return True
+    
+    return False
+
+
+def legacy_detect_visa_sponsorship(description):
+    desc_lower = description.lower()
+    found_keywords = [keyword for keyword in VISA_KEYWORDS if keyword in desc_lower]
+    return len(found_keywords) > 0, found_keywords
+
+
+FILLER_WORDS = (
+    "we are looking for a motivated engineer to join our growing team you will work with "
+    "stakeholders across regions to measure and improve reliability of our platform "
+    "experience with linux networking scripting monitoring and incident response is a plus "
+    "we offer competitive salary flexible hours health insurance and a generous learning budget"
+).split()
+
+TITLES = [
+    "Cloud Engineer", "Senior Cloud Architect", "DevOps Engineer", "Platform Specialist",
+    "Senior Python Developer", "IT Support Technician", "Site Reliability Engineer",
+    "Operations Analyst", "Service Desk Analyst", "Account Manager"
+]
+
+SPRINKLE = (
+    [k for keywords in ROLE_CLASSIFICATIONS.values() for k in keywords]
+    + VISA_KEYWORDS
+    + ["AWS", "Kubernetes", "Terraform", "Sales"]
+)
+
+
+def build_corpus(size, desc_length, hit_rate, seed=42):
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(size):
+        words = []
+        length = 0
+        while length < desc_length:
+            word = rng.choice(SPRINKLE) if rng.random() < hit_rate else rng.choice(FILLER_WORDS)
+            if rng.random() < 0.05:
+                word = word.capitalize()
+            words.append(word)
+            length += len(word) + 1
+        corpus.append((rng.choice(TITLES), " ".join(words)[:desc_length]))
+    return corpus
+
+
+def run_legacy(corpus, excluded_roles):
+    for title, description in corpus:
+        legacy_classify_job(title, description)
+        legacy_is_excluded_role(title, description, excluded_roles)
+        legacy_detect_visa_sponsorship(description)
+
+
+def run_functions(corpus, excluded_roles):
+    for title, description in corpus:
+        classify_job(title, description)
+        is_excluded_role(title, description, excluded_roles)
+        detect_visa_sponsorship(description)
+
+
+def run_analyze(corpus, excluded_roles):
+    for title, description in corpus:
+        analyze_job(title, description, excluded_roles)
+
+
+def verify(corpus, excluded_roles):
+    for title, description in corpus:
+        expected_visa = legacy_detect_visa_sponsorship(description)
+        expected = {
+            "classification": legacy_classify_job(title, description),
+            "is_excluded": legacy_is_excluded_role(title, description, excluded_roles),
+            "has_visa": expected_visa[0],
+            "visa_keywords": expected_visa[1]
+        }
+        
+        assert classify_job(title, description) == expected["classification"], title
+        assert is_excluded_role(title, description, excluded_roles) == expected["is_excluded"], title
+        assert detect_visa_sponsorship(description) == expected_visa, title
+        assert analyze_job(title, description, excluded_roles) == expected, title
+
+
+def time_it(label, func, corpus, excluded_roles, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(corpus, excluded_roles)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    
+    per_job_us = best / len(corpus) * 1e6
+    print(f"{label:<28} {best * 1000:>10.1f} ms  {per_job_us:>8.1f} us/job")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Keyword matcher microbenchmark")
+    parser.add_argument("--jobs", type=int, default=5000)
+    parser.add_argument("--desc-length", type=int, default=10000)
+    parser.add_argument("--hit-rate", type=float, default=0.002)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    
+    excluded_roles = ["Sales", "account manager"]
+    corpus = build_corpus(args.jobs, args.desc_length, args.hit_rate)
+    
+    verify(corpus, excluded_roles)
+    print(f"Verified identical results on {len(corpus)} synthetic jobs ({args.desc_length} chars each)")
+    
+    legacy = time_it("legacy (3 functions)", run_legacy, corpus, excluded_roles, args.repeat)
+    functions = time_it("matcher (3 functions)", run_functions, corpus, excluded_roles, args.repeat)
+    analyze = time_it("matcher (analyze_job)", run_analyze, corpus, excluded_roles, args.repeat)
+    
+    print(f"speedup 3 functions: {legacy / functions:.2f}x")
+    print(f"speedup analyze_job: {legacy / analyze:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+import argparse
+import os
+import statistics
+import sys
+import time
+from unittest import mock
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.mock_openai import MockOpenAIServer
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def time_calls(calls, job_description):
+    from app.utils.ai_engine import AIEngine
+    
+    timings = []
+    for i in range(calls):
+        start = time.perf_counter()
+        content = AIEngine(api_key="sk-benchmark").generate_summary(f"{job_description} {i}")
+        timings.append(time.perf_counter() - start)
+        assert not content.startswith("AI generation error"), content
+    return timings
+
+
+def report(label, timings, connections):
+    print(
+        f"{label:<8} median {statistics.median(timings) * 1000:>7.2f} ms   "
+        f"p95 {percentile(timings, 0.95) * 1000:>7.2f} ms   "
+        f"connections opened {connections}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-call latency of a fresh OpenAI client versus the shared registry")
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.0, help="Simulated model latency per request")
+    parser.add_argument("--no-tls", action="store_true", help="Serve the mock over plain HTTP")
+    args = parser.parse_args()
+    
+    server = MockOpenAIServer(latency=args.latency, tls=not args.no_tls).start()
+    
+    os.environ["OPENAI_BASE_URL"] = server.base_url
+    os.environ["AI_CACHE_ENABLED"] = "false"
+    os.environ.setdefault("ENVIRONMENT", "benchmark")
+    if server.cert_path:
+        os.environ["SSL_CERT_FILE"] = server.cert_path
+    
+    from app.utils import ai_engine
+    from app.utils.openai_clients import build_openai_client, close_openai_clients
+    
+    job_description = "Cloud engineer working with AWS, Kubernetes and Terraform"
+    time_calls(5, job_description)
+    
+    try:
+        connections = server.connections
+        with mock.patch.object(ai_engine, "get_openai_client", build_openai_client):
+            fresh = time_calls(args.calls, job_description)
+        report("fresh", fresh, server.connections - connections)
+        
+        connections = server.connections
+        shared = time_calls(args.calls, job_description)
+        report("shared", shared, server.connections - connections)
+    finally:
+        close_openai_clients()
+        server.stop()
+    
+    saved = statistics.median(fresh) - statistics.median(shared)
+    transport = "https" if server.tls else "http"
+    print(f"{args.calls} calls over {transport}, shared client saves {saved * 1000:.2f} ms per call at the median")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient
+
+PAGE_SIZE = 50
+
+
+def seed_jobs(count):
+    from sqlalchemy import insert
+    from sqlmodel import Session
+    from app.db import engine
+    from app.models.job import Job
+    
+    start = datetime(2026, 1, 1)
+    with Session(engine) as session:
+        for offset in range(0, count, 10000):
+            session.execute(insert(Job), [
+                {
+                    "title": f"Cloud Engineer {i}",
+                    "company": "Benchmark",
+                    "location": "Remote",
+                    "description": "aws kubernetes terraform",
+                    "source": "benchmark",
+                    "visa_keywords": [],
+                    "score": i % 101,
+                    "created_at": start + timedelta(seconds=i // 2)
+                }
+                for i in range(offset, min(count, offset + 10000))
+            ])
+        session.commit()
+
+
+def cursors_at(client, path, depths):
+    cursors = {}
+    cursor = None
+    position = 0
+    while position <= max(depths):
+        if position in depths:
+            cursors[position] = cursor
+        response = client.get(path, params={"limit": PAGE_SIZE, **({"cursor": cursor} if cursor else {})})
+        response.raise_for_status()
+        cursor = response.headers.get("X-Next-Cursor")
+        position += PAGE_SIZE
+        if not cursor:
+            break
+    return cursors
+
+
+def median_request_time(client, path, params, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        client.get(path, params=params).raise_for_status()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offset versus keyset pagination at increasing page depth")
+    parser.add_argument("--jobs", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=9)
+    parser.add_argument("--database-url", default=None, help="Defaults to a temporary SQLite file")
+    args = parser.parse_args()
+    
+    os.environ["DATABASE_URL"] = args.database_url or f"sqlite:///{tempfile.mkdtemp()}/pagination_bench.db"
+    os.environ.setdefault("ENVIRONMENT", "benchmark")
+    
+    from app.main import app
+    
+    depths = [depth - depth % PAGE_SIZE for depth in (0, args.jobs // 10, args.jobs // 2, args.jobs - PAGE_SIZE)]
+    
+    with TestClient(app) as client:
+        seed_jobs(args.jobs)
+        
+        for path, offset_param in (("/api/jobs", "skip"), ("/api/jobs/search", "offset")):
+            cursors = cursors_at(client, path, depths)
+            for depth in depths:
+                offset = median_request_time(client, path, {"limit": PAGE_SIZE, offset_param: depth}, args.repeat)
+                keyset = median_request_time(
+                    client, path, {"limit": PAGE_SIZE, **({"cursor": cursors[depth]} if cursors[depth] else {})}, args.repeat
+                )
+                print(
+                    f"{path:<18} depth {depth:>7}   offset {offset * 1000:>8.2f} ms   "
+                    f"cursor {keyset * 1000:>8.2f} ms"
+                )
+
+
+if __name__ == "__main__":
+    main()
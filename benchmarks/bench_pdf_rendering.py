@@ -0,0 +1,113 @@
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+BULLET = (
+    "Designed and operated multi-region AWS infrastructure with Terraform, Kubernetes and GitOps, "
+    "cutting deployment lead time by 60% while keeping availability above 99.95% for customer-facing services."
+)
+
+
+def resume_options(directory, index, bullets):
+    return {
+        "name": f"Benchmark Candidate {index}",
+        "email": "candidate@example.com",
+        "phone": "+1 555 0100",
+        "linkedin_url": "https://linkedin.com/in/benchmark",
+        "summary": "Cloud engineer with a decade of experience building reliable platforms. " * 4,
+        "bullets": [f"- {BULLET} ({i})" for i in range(bullets)],
+        "template_type": "architect",
+        "output_path": os.path.join(directory, f"resume_{index}.pdf"),
+        "job_title": "Senior Cloud Engineer"
+    }
+
+
+async def measure_loop_lag(stop, interval, lags):
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - start - interval)
+
+
+async def run_mode(mode, args, directory):
+    from app.utils.pdf_pool import PdfPoolBusy, PdfRenderPool
+    from app.utils.pdf_resume import render_resume_pdf
+    
+    pool = None if mode == "inline" else PdfRenderPool(mode, args.workers, args.max_pending)
+    if pool:
+        pool.start()
+    
+    async def render(index):
+        options = resume_options(directory, index, args.bullets)
+        if pool is None:
+            render_resume_pdf(options)
+            await asyncio.sleep(0)
+            return True
+        try:
+            await pool.render(**options)
+            return True
+        except PdfPoolBusy:
+            return False
+    
+    lags = []
+    stop = asyncio.Event()
+    ticker = asyncio.ensure_future(measure_loop_lag(stop, 0.005, lags))
+    await asyncio.sleep(0.05)
+    
+    start = time.perf_counter()
+    results = await asyncio.gather(*(render(index) for index in range(args.resumes)))
+    elapsed = time.perf_counter() - start
+    
+    stop.set()
+    await ticker
+    stats = pool.stats() if pool else None
+    if pool:
+        pool.shutdown()
+    
+    rendered = sum(results)
+    lags.sort()
+    print(
+        f"{mode:<8} {rendered:>5} rendered {len(results) - rendered:>5} rejected  {elapsed:>7.2f} s  "
+        f"{rendered / elapsed:>7.1f} pdf/s   loop lag p99 {lags[int(len(lags) * 0.99)] * 1000:>7.1f} ms  "
+        f"max {lags[-1] * 1000:>7.1f} ms"
+    )
+    if stats:
+        print(
+            f"{'':<8} render p50 {stats['render_time']['p50_ms']} ms  p95 {stats['render_time']['p95_ms']} ms  "
+            f"queue wait p95 {stats['queue_wait']['p95_ms']} ms"
+        )
+    return rendered / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent resume PDF rendering: inline vs thread pool vs process pool")
+    parser.add_argument("--resumes", type=int, default=200)
+    parser.add_argument("--bullets", type=int, default=40, help="Bullets per resume; more bullets means more layout work")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    parser.add_argument("--max-pending", type=int, default=None, help="Defaults to --resumes, so nothing is rejected")
+    parser.add_argument("--modes", default="inline,thread,process")
+    args = parser.parse_args()
+    args.max_pending = args.max_pending or args.resumes
+    
+    os.environ["PDF_WORKERS"] = str(args.workers)
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    
+    directory = tempfile.mkdtemp()
+    print(f"{args.resumes} resumes with {args.bullets} bullets, {args.workers} workers, {args.max_pending} pending max")
+    
+    throughput = {}
+    for mode in args.modes.split(","):
+        throughput[mode] = asyncio.run(run_mode(mode, args, directory))
+    
+    if "inline" in throughput:
+        for mode, value in throughput.items():
+            if mode != "inline":
+                print(f"{mode} vs inline: {value / throughput['inline']:.2f}x throughput")
+
+
+if __name__ == "__main__":
+    main()
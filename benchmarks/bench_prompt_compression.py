@@ -0,0 +1,181 @@
+import argparse
+import os
+import random
+import sys
+import time
+from types import SimpleNamespace
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("AI_CACHE_ENABLED", "false")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from app.utils.ai_engine import AIEngine
+from app.utils.prompt_compression import SKILL_MATCHER, compress_job_description, estimate_tokens
+
+ABOUT = [
+    "{company} is a leading global provider of cloud software trusted by thousands of customers in over 40 countries.",
+    "Founded in 2009, {company} has grown into a fast-growing team of passionate people who love solving hard problems.",
+    "Our mission is to make infrastructure invisible so that every team can ship faster and sleep better at night.",
+    "We are proud of our culture of ownership, curiosity and kindness, and we celebrate wins together every week."
+]
+
+RESPONSIBILITIES = [
+    "Design, build and maintain highly available infrastructure on {cloud} using Terraform and {tool}.",
+    "Manage production Kubernetes clusters and automate deployments through CI/CD pipelines.",
+    "Troubleshoot incidents across networking, Linux and container workloads and lead blameless postmortems.",
+    "Implement monitoring and observability with Prometheus and Grafana to track service level objectives.",
+    "Migrate legacy workloads from on-premise VMware environments to {cloud}.",
+    "Partner with security to enforce IAM least-privilege policies and VPC network segmentation.",
+    "Collaborate with stakeholders across regions to plan capacity and control cloud spend.",
+    "Mentor junior engineers and contribute to internal documentation and runbooks."
+]
+
+REQUIREMENTS = [
+    "{years}+ years of experience with {cloud} in a production environment.",
+    "Strong hands-on experience with Docker, Kubernetes and Helm.",
+    "Proficiency with infrastructure as code tools such as Terraform, Pulumi or CloudFormation.",
+    "Solid scripting skills in Python or Bash.",
+    "Knowledge of networking fundamentals including DNS, load balancing and TLS.",
+    "Experience with {tool} or GitHub Actions for continuous delivery.",
+    "A {cloud} associate or professional certification is required.",
+    "Bachelor's degree in Computer Science or equivalent practical experience.",
+    "Excellent written and verbal communication skills."
+]
+
+NICE_TO_HAVE = [
+    "Familiarity with serverless architectures such as AWS Lambda.",
+    "Experience running Datadog or another observability platform at scale.",
+    "Exposure to OpenShift or other managed Kubernetes distributions."
+]
+
+BENEFITS = [
+    "Competitive salary and equity package with stock options.",
+    "Comprehensive health, dental and vision insurance for you and your family.",
+    "401(k) plan with a generous company match.",
+    "Unlimited paid time off and 16 weeks of parental leave.",
+    "Home office stipend, gym membership and a monthly wellness allowance.",
+    "Free lunch and snacks in all of our offices.",
+    "Annual learning budget for conferences, courses and certifications."
+]
+
+EEO = [
+    "{company} is an equal opportunity employer. All qualified applicants will receive consideration for employment "
+    "without regard to race, color, religion, sex, sexual orientation, gender identity, national origin, disability "
+    "or protected veteran status.",
+    "We provide reasonable accommodation to individuals with disabilities throughout the application process.",
+    "We participate in E-Verify and all offers are contingent on a background check.",
+    "Please review our privacy notice to learn more about how we handle your personal data.",
+    "Recruitment agencies: please do not send unsolicited resumes."
+]
+
+APPLY = [
+    "Click the apply button below and submit your resume to be considered.",
+    "Follow us on LinkedIn to learn more about life at {company}."
+]
+
+CLOUDS = ["AWS", "Azure", "GCP"]
+TOOLS = ["Jenkins", "GitLab", "Ansible"]
+
+
+def build_description(rng, index):
+    values = {
+        "company": f"Company {index}",
+        "cloud": rng.choice(CLOUDS),
+        "tool": rng.choice(TOOLS),
+        "years": rng.randint(2, 8)
+    }
+    
+    def section(heading, sentences, count, bullets=True):
+        chosen = rng.sample(sentences, min(count, len(sentences)))
+        lines = [f"- {sentence.format(**values)}" if bullets else sentence.format(**values) for sentence in chosen]
+        return [heading] + lines if heading else [" ".join(lines)]
+    
+    lines = []
+    lines += section("About Us:", ABOUT, rng.randint(2, 4), bullets=False)
+    lines += section("Responsibilities:", RESPONSIBILITIES, rng.randint(5, 8))
+    lines += section("Requirements:", REQUIREMENTS, rng.randint(5, 9))
+    if rng.random() < 0.6:
+        lines += section("Nice to have:", NICE_TO_HAVE, rng.randint(1, 3))
+    lines += section("What We Offer:", BENEFITS, rng.randint(4, 7))
+    lines += section("Equal Opportunity:", EEO, rng.randint(2, 5), bullets=False)
+    lines += section(None, APPLY, 2)
+    if rng.random() < 0.5:
+        lines += section(None, ABOUT, 1) + section(None, APPLY, 1)
+    
+    return "\n".join(lines)[:10000]
+
+
+def build_corpus(size, seed=42):
+    rng = random.Random(seed)
+    return [build_description(rng, index) for index in range(size)]
+
+
+class PromptRecorder:
+    def __init__(self):
+        self.prompts = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+    
+    def create(self, messages, **kwargs):
+        self.prompts.append(" ".join(message["content"] for message in messages))
+        content = '{"bullets": ["Built cloud infrastructure"], "summary": "Cloud engineer."}'
+        return SimpleNamespace(usage=None, choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+def prompt_tokens(descriptions):
+    recorder = PromptRecorder()
+    ai_engine = AIEngine(api_key="sk-benchmark", bypass_cache=True, raise_errors=True)
+    ai_engine.client = recorder
+    
+    for description in descriptions:
+        ai_engine.generate_resume_content(description, "architect")
+        ai_engine.generate_summary(description)
+    
+    return sum(estimate_tokens(prompt) for prompt in recorder.prompts), len(recorder.prompts)
+
+
+def keyword_retention(original, compressed):
+    kept = 0
+    total = 0
+    for before, after in zip(original, compressed):
+        keywords = set(SKILL_MATCHER.find_all(before))
+        total += len(keywords)
+        kept += len(keywords & set(SKILL_MATCHER.find_all(after)))
+    return kept / total if total else 1.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prompt token counts with and without job description compression")
+    parser.add_argument("--jobs", type=int, default=200)
+    parser.add_argument("--budget", type=int, default=None, help="Defaults to AI_PROMPT_TOKEN_BUDGET")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    
+    corpus = build_corpus(args.jobs, args.seed)
+    
+    start = time.perf_counter()
+    compressed = [compress_job_description(description, args.budget) for description in corpus]
+    elapsed = time.perf_counter() - start
+    
+    original_tokens = sum(estimate_tokens(description) for description in corpus)
+    compressed_tokens = sum(estimate_tokens(description) for description in compressed)
+    original_prompt_tokens, calls = prompt_tokens(corpus)
+    compressed_prompt_tokens, _ = prompt_tokens(compressed)
+    
+    print(f"{len(corpus)} synthetic job descriptions, {sum(len(d) for d in corpus) / len(corpus):.0f} chars on average")
+    print(f"{'':<28} {'original':>10} {'compressed':>11} {'reduction':>10}")
+    print(
+        f"{'description tokens':<28} {original_tokens:>10} {compressed_tokens:>11} "
+        f"{1 - compressed_tokens / original_tokens:>9.1%}"
+    )
+    print(
+        f"{'prompt tokens (' + str(calls) + ' calls)':<28} {original_prompt_tokens:>10} {compressed_prompt_tokens:>11} "
+        f"{1 - compressed_prompt_tokens / original_prompt_tokens:>9.1%}"
+    )
+    print(f"skill keyword retention: {keyword_retention(corpus, compressed):.1%}")
+    print(f"compression time: {elapsed / len(corpus) * 1000:.2f} ms/job")
+    print()
+    print("sample compressed description:")
+    print(compressed[0])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from pathlib import Path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+BULLET = (
+    "Designed and operated multi-region AWS infrastructure with Terraform, Kubernetes and GitOps, "
+    "cutting deployment lead time by 60% while keeping availability above 99.95% for customer-facing services."
+)
+
+
+def build_message(attachment):
+    msg = MIMEMultipart()
+    msg['From'] = "candidate@example.com"
+    msg['To'] = "hr@example.com"
+    msg['Subject'] = "Application for Senior Cloud Engineer position"
+    msg.attach(MIMEText("Please find my resume attached.", 'plain'))
+    msg.attach(attachment)
+    return msg
+
+
+def run(label, sends, make_attachment, flatten):
+    start = time.perf_counter()
+    size = 0
+    for _ in range(sends):
+        msg = build_message(make_attachment())
+        if flatten:
+            size = len(msg.as_bytes())
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed * 1000 / sends:>8.3f} ms per send  {sends / elapsed:>9.0f} sends/s" + (f"  {size / 1024:.0f} KiB message" if flatten else ""))
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Attachment cost per application email: re-read and re-encode vs cached MIME part")
+    parser.add_argument("--sends", type=int, default=2000)
+    parser.add_argument("--bullets", type=int, default=40)
+    parser.add_argument("--flatten", action="store_true", help="Also serialise each message, as smtplib does before sending")
+    args = parser.parse_args()
+    
+    from app.utils.email_sender import pdf_attachment
+    from app.utils.pdf_resume import generate_resume_pdf
+    
+    path = generate_resume_pdf(
+        name="Benchmark Candidate",
+        email="candidate@example.com",
+        phone="+1 555 0100",
+        linkedin_url="https://linkedin.com/in/benchmark",
+        summary="Cloud engineer with a decade of experience building reliable platforms. " * 4,
+        bullets=[f"{BULLET} ({i})" for i in range(args.bullets)],
+        template_type="architect",
+        output_path=os.path.join(tempfile.mkdtemp(), "resume.pdf"),
+        job_title="Senior Cloud Engineer"
+    )
+    print(f"{args.sends} sends of a {os.path.getsize(path) / 1024:.0f} KiB resume")
+    
+    cached = pdf_attachment(Path(path).read_bytes(), "resume.pdf")
+    uncached = run("read + encode per send", args.sends, lambda: pdf_attachment(Path(path).read_bytes(), "resume.pdf"), args.flatten)
+    reused = run("cached MIME part", args.sends, lambda: cached, args.flatten)
+    print(f"cached vs per-send encoding: {uncached / reused:.1f}x faster")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+import uuid
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+
+from benchmarks.bench_ai_streaming import start_api
+
+BULLET = (
+    "Designed and operated multi-region AWS infrastructure with Terraform, Kubernetes and GitOps, "
+    "cutting deployment lead time by 60% while keeping availability above 99.95% for customer-facing services."
+)
+
+
+def seed(count):
+    from sqlmodel import Session
+    from app.db import engine
+    from app.models.job import Job
+    
+    with Session(engine) as session:
+        for i in range(count):
+            session.add(Job(title=f"Cloud Engineer {i}", company=f"Company {i}", location="Remote", description=BULLET))
+        session.commit()
+
+
+def request_body(args, job_ids):
+    return {
+        "template_type": "architect",
+        "summary": f"Cloud engineer with a decade of experience building reliable platforms ({uuid.uuid4().hex})",
+        "bullets": [f"{BULLET} ({i})" for i in range(args.bullets)],
+        "job_ids": job_ids
+    }
+
+
+def run_sequential(client, args):
+    body = request_body(args, [])
+    start = time.perf_counter()
+    for job_id in range(1, args.jobs + 1):
+        response = client.post("/api/resumes/new", json={**{k: v for k, v in body.items() if k != "job_ids"}, "job_id": job_id})
+        response.raise_for_status()
+    elapsed = time.perf_counter() - start
+    print(f"sequential {args.jobs:>4} x /api/resumes/new   total {elapsed:>6.2f} s  {args.jobs / elapsed:>6.1f} resumes/s")
+    return elapsed
+
+
+def run_batch(client, args):
+    body = request_body(args, list(range(1, args.jobs + 1)))
+    start = time.perf_counter()
+    first_byte = None
+    chunks = 0
+    size = 0
+    with client.stream("POST", "/api/resumes/batch", json=body) as response:
+        response.raise_for_status()
+        for chunk in response.iter_bytes():
+            if first_byte is None:
+                first_byte = time.perf_counter() - start
+            chunks += 1
+            size += len(chunk)
+    elapsed = time.perf_counter() - start
+    print(
+        f"batch      {args.jobs:>4} in /api/resumes/batch total {elapsed:>6.2f} s  {args.jobs / elapsed:>6.1f} resumes/s  "
+        f"first byte {first_byte * 1000:.0f} ms  {chunks} chunks, {size / 1024:.0f} KiB zip"
+    )
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-job resume requests vs one streamed ZIP batch")
+    parser.add_argument("--jobs", type=int, default=40)
+    parser.add_argument("--bullets", type=int, default=40)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    args = parser.parse_args()
+    
+    workdir = tempfile.mkdtemp()
+    os.environ["DATABASE_URL"] = f"sqlite:///{workdir}/resume_batch_bench.db"
+    os.environ["PDF_WORKERS"] = str(args.workers)
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    os.environ.setdefault("ENVIRONMENT", "benchmark")
+    os.chdir(workdir)
+    os.makedirs("logs", exist_ok=True)
+    
+    from app.main import app
+    
+    api, thread, base_url = start_api(app)
+    seed(args.jobs)
+    print(f"{args.jobs} jobs, {args.bullets} bullets per resume, {args.workers} PDF workers")
+    
+    try:
+        with httpx.Client(base_url=base_url, timeout=600) as client:
+            sequential = run_sequential(client, args)
+            batch = run_batch(client, args)
+    finally:
+        api.should_exit = True
+        thread.join()
+    
+    print(f"batch vs sequential: {sequential / batch:.2f}x faster")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,365 @@
+import argparse
+import json
+import math
+import os
+import random
+import ssl
+import subprocess
+import tempfile
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def create_self_signed_certificate(directory):
+    cert_path = os.path.join(directory, "mock_openai.pem")
+    key_path = os.path.join(directory, "mock_openai.key")
+    subprocess.run(
+        [
+            "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+            "-subj", "/CN=127.0.0.1", "-addext", "subjectAltName=IP:127.0.0.1",
+            "-keyout", key_path, "-out", cert_path
+        ],
+        check=True,
+        capture_output=True
+    )
+    return cert_path, key_path
+
+
+def chunk_payload(model, content=None, finish_reason=None):
+    delta = {"content": content} if content is not None else {}
+    return {
+        "id": "chatcmpl-mock",
+        "object": "chat.completion.chunk",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}]
+    }
+
+
+def completion_payload(model, content, prompt_tokens=0, completion_tokens=0):
+    return {
+        "id": "chatcmpl-mock",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [
+            {"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}
+        ],
+        "usage": {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens
+        }
+    }
+
+
+def error_payload(status):
+    error_types = {429: "rate_limit_exceeded", 500: "server_error", 503: "service_unavailable"}
+    return {
+        "error": {
+            "message": f"Injected mock error {status}",
+            "type": error_types.get(status, "server_error"),
+            "param": None,
+            "code": None
+        }
+    }
+
+
+DEFAULT_CONTENT = "- Built cloud infrastructure\n- Automated deployments"
+RESUME_CONTENT = json.dumps({
+    "bullets": [
+        "Built multi-account AWS landing zones with Terraform",
+        "Cut deployment time 60% by moving services to Kubernetes",
+        "Automated CI/CD pipelines for 40 microservices"
+    ],
+    "summary": "Cloud engineer with hands-on AWS, Kubernetes and Terraform experience."
+})
+
+LATENCY_DISTRIBUTIONS = ["fixed", "uniform", "exponential", "lognormal"]
+ERROR_KINDS = ["429", "500", "503", "timeout", "disconnect"]
+
+
+def default_content(body):
+    system = " ".join(message.get("content", "") for message in body.get("messages", []) if message.get("role") == "system")
+    return RESUME_CONTENT if "JSON" in system else DEFAULT_CONTENT
+
+
+def parse_error_rates(specs):
+    errors = {}
+    for spec in specs or []:
+        kind, _, rate = spec.partition("=")
+        if kind not in ERROR_KINDS:
+            raise ValueError(f"Unknown error kind {kind!r}, expected one of {', '.join(ERROR_KINDS)}")
+        errors[kind] = float(rate)
+    return errors
+
+
+class MockOpenAIServer:
+    def __init__(
+        self,
+        latency=0.0,
+        tls=False,
+        token_interval=0.0,
+        content=None,
+        distribution="fixed",
+        jitter=0.0,
+        errors=None,
+        hang=30.0,
+        retry_after=1.0,
+        port=0,
+        seed=None
+    ):
+        if distribution not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution {distribution!r}")
+        
+        self.latency = latency
+        self.token_interval = token_interval
+        self.content = content
+        self.distribution = distribution
+        self.jitter = jitter
+        self.errors = dict(errors or {})
+        self.hang = hang
+        self.retry_after = retry_after
+        self.port = port
+        self.tls = tls
+        self.cert_path = None
+        self.requests = 0
+        self.connections = 0
+        self.responses = Counter()
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+    
+    @property
+    def base_url(self):
+        scheme = "https" if self.tls else "http"
+        return f"{scheme}://127.0.0.1:{self._server.server_address[1]}/v1"
+    
+    def sample_latency(self):
+        if not self.latency:
+            return 0.0
+        with self._lock:
+            if self.distribution == "uniform":
+                return self._random.uniform(self.latency * (1 - self.jitter), self.latency * (1 + self.jitter))
+            if self.distribution == "exponential":
+                return self._random.expovariate(1 / self.latency)
+            if self.distribution == "lognormal":
+                return self.latency * math.exp(self._random.gauss(0, self.jitter))
+        return self.latency
+    
+    def sample_error(self):
+        with self._lock:
+            roll = self._random.random()
+        for kind, rate in self.errors.items():
+            if roll < rate:
+                return kind
+            roll -= rate
+        return None
+    
+    def reply(self, body):
+        if self.content is None:
+            return default_content(body)
+        return self.content(body) if callable(self.content) else self.content
+    
+    def count(self, outcome, prompt_tokens=0, completion_tokens=0):
+        with self._lock:
+            self.responses[outcome] += 1
+            self.prompt_tokens += prompt_tokens
+            self.completion_tokens += completion_tokens
+    
+    def stats(self):
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "connections": self.connections,
+                "responses": dict(self.responses),
+                "prompt_tokens": self.prompt_tokens,
+                "completion_tokens": self.completion_tokens
+            }
+    
+    def reset_stats(self):
+        with self._lock:
+            self.requests = 0
+            self.connections = 0
+            self.responses.clear()
+            self.prompt_tokens = 0
+            self.completion_tokens = 0
+    
+    def start(self):
+        mock = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+            
+            def setup(self):
+                super().setup()
+                with mock._lock:
+                    mock.connections += 1
+            
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+                with mock._lock:
+                    mock.requests += 1
+                
+                error = mock.sample_error()
+                if error == "429":
+                    mock.count(error)
+                    self.respond(429, json.dumps(error_payload(429)).encode(), {"Retry-After": str(mock.retry_after)})
+                    return
+                
+                time.sleep(mock.sample_latency())
+                
+                if error in ("500", "503"):
+                    mock.count(error)
+                    self.respond(int(error), json.dumps(error_payload(int(error))).encode())
+                    return
+                if error == "timeout":
+                    mock.count(error)
+                    time.sleep(mock.hang)
+                    self.close_connection = True
+                    return
+                if error == "disconnect" and not body.get("stream"):
+                    mock.count(error)
+                    self.close_connection = True
+                    return
+                
+                model = body.get("model", "mock")
+                content = mock.reply(body)
+                prompt = " ".join(message.get("content", "") for message in body.get("messages", []))
+                prompt_tokens = len(prompt.split())
+                
+                if body.get("stream"):
+                    self.stream_tokens(model, content, prompt_tokens, drop=error == "disconnect")
+                    return
+                
+                if mock.token_interval:
+                    time.sleep(mock.token_interval * (len(content.split(" ")) - 1))
+                
+                payload = completion_payload(
+                    model,
+                    content,
+                    prompt_tokens=prompt_tokens,
+                    completion_tokens=len(content.split())
+                )
+                mock.count("200", payload["usage"]["prompt_tokens"], payload["usage"]["completion_tokens"])
+                self.respond(200, json.dumps(payload).encode())
+            
+            def stream_tokens(self, model, content, prompt_tokens, drop=False):
+                try:
+                    self.send_response(200)
+                    self.send_header("Content-Type", "text/event-stream")
+                    self.send_header("Transfer-Encoding", "chunked")
+                    self.end_headers()
+                    
+                    words = content.split(" ")
+                    for i, word in enumerate(words):
+                        if drop and i >= len(words) // 2:
+                            mock.count("disconnect")
+                            self.close_connection = True
+                            return
+                        if i and mock.token_interval:
+                            time.sleep(mock.token_interval)
+                        self.write_event(chunk_payload(model, word if i == 0 else f" {word}"))
+                    self.write_event(chunk_payload(model, finish_reason="stop"))
+                    self.write_chunk(b"data: [DONE]\n\n")
+                    self.write_chunk(b"")
+                    mock.count("200", prompt_tokens, len(words))
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+            
+            def write_event(self, payload):
+                self.write_chunk(f"data: {json.dumps(payload)}\n\n".encode())
+            
+            def write_chunk(self, data):
+                self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+                self.wfile.flush()
+            
+            def respond(self, status, body, headers=None):
+                try:
+                    self.send_response(status)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(body)))
+                    for name, value in (headers or {}).items():
+                        self.send_header(name, value)
+                    self.end_headers()
+                    self.wfile.write(body)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+            
+            def log_message(self, *args):
+                pass
+        
+        self._server = ThreadingHTTPServer(("127.0.0.1", self.port), Handler)
+        self._server.daemon_threads = True
+        
+        if self.tls:
+            self.cert_path, key_path = create_self_signed_certificate(tempfile.mkdtemp())
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(self.cert_path, key_path)
+            self._server.socket = context.wrap_socket(self._server.socket, server_side=True)
+        
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def add_server_arguments(parser):
+    parser.add_argument("--latency", type=float, default=0.5, help="Median simulated model latency in seconds")
+    parser.add_argument("--distribution", choices=LATENCY_DISTRIBUTIONS, default="lognormal")
+    parser.add_argument("--jitter", type=float, default=0.5, help="Spread: +/- fraction for uniform, sigma for lognormal")
+    parser.add_argument("--token-interval", type=float, default=0.0, help="Delay between streamed tokens")
+    parser.add_argument(
+        "--error",
+        action="append",
+        default=[],
+        metavar="KIND=RATE",
+        help=f"Inject errors, e.g. --error 429=0.05 --error timeout=0.01 ({', '.join(ERROR_KINDS)})"
+    )
+    parser.add_argument("--hang", type=float, default=30.0, help="Seconds a 'timeout' error stalls before closing")
+    parser.add_argument("--seed", type=int, default=None)
+
+
+def server_from_arguments(args, **kwargs):
+    return MockOpenAIServer(
+        latency=args.latency,
+        token_interval=args.token_interval,
+        distribution=args.distribution,
+        jitter=args.jitter,
+        errors=parse_error_rates(args.error),
+        hang=args.hang,
+        seed=args.seed,
+        **kwargs
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the OpenAI chat completions API")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--tls", action="store_true")
+    add_server_arguments(parser)
+    args = parser.parse_args()
+    
+    server = server_from_arguments(args, port=args.port, tls=args.tls).start()
+    print(f"Mock OpenAI listening, set OPENAI_BASE_URL={server.base_url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        print(json.dumps(server.stats(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
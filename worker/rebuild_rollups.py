@@ -0,0 +1,20 @@
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlmodel import Session
+from app.db import engine, create_db_and_tables
+from app.utils.metrics_rollup import rebuild_metrics_rollups
+
+
+def main():
+    create_db_and_tables()
+    
+    with Session(engine) as session:
+        groups = rebuild_metrics_rollups(session)
+    
+    print(f"Rebuilt metrics rollups with {groups} groups")
+
+
+if __name__ == "__main__":
+    main()
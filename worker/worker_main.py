@@ -10,6 +10,9 @@ from app.db import engine
 from app.models.followup import Followup
 from app.models.job import Job
 from app.models.settings import Settings
+from app.utils.openai_clients import close_openai_clients
+from app.utils.ai_tasks import start_ai_task_worker
+from app.utils.pdf_pool import shutdown_pdf_pool
 from app.utils.logger import logger
 
 
@@ -50,7 +53,7 @@ def process_pending_followups():
                 days_since = (datetime.utcnow() - job.application_date).days if job.application_date else 7
                 
                 use_ai = settings and settings.ai_mode_enabled
-                message = build_followup_message(
+                built = build_followup_message(
                     job_title=job.title,
                     company=job.company,
                     days_since=days_since,
@@ -58,6 +61,9 @@ def process_pending_followups():
                     use_ai=use_ai,
                     ai_api_key=settings.openai_api_key if settings else None
                 )
+                message = built["message"]
+                if built["fallback_used"]:
+                    logger.warning(f"Follow-up {followup.id} used the default template: {built['fallback_reason']}")
                 
                 followup.message = message
                 
@@ -87,6 +93,7 @@ def process_pending_followups():
                     subject=subject,
                     body=message,
                     email_type="followup",
+                    email_metadata={"message_source": built["source"], "ai_fallback_reason": built["fallback_reason"]},
                     status="sent" if result["success"] else "failed",
                     error_message=result.get("error"),
                     sent_at=datetime.utcnow() if result["success"] else None
@@ -136,10 +143,35 @@ def auto_apply_workflow():
         logger.info(f"Found {len(jobs)} high-scoring jobs for auto-apply")
 
 
+def rescore_jobs_on_profile_change():
+    logger.info("Checking scoring profile for changes...")
+    
+    from app.utils.batch_scoring import rescore_jobs_if_profile_changed
+    
+    with Session(engine) as session:
+        result = rescore_jobs_if_profile_changed(session)
+    
+    logger.info(result["message"])
+
+
 def cleanup_old_logs():
     logger.info("Cleaning up old logs...")
 
 
+def purge_expired_ai_cache():
+    from app.utils.ai_cache import purge_expired_responses
+    
+    removed = purge_expired_responses()
+    logger.info(f"Purged {removed} expired AI cache entries")
+
+
+def collect_orphaned_resumes():
+    from app.utils.resume_store import collect_orphaned_resume_files
+    
+    with Session(engine) as session:
+        collect_orphaned_resume_files(session)
+
+
 def main():
     logger.info("Starting CloudHire Nexus Worker...")
     
@@ -161,6 +193,14 @@ def main():
         next_run_time=datetime.now() + timedelta(minutes=1)
     )
     
+    scheduler.add_job(
+        rescore_jobs_on_profile_change,
+        'interval',
+        minutes=15,
+        id='rescore_jobs',
+        next_run_time=datetime.now() + timedelta(minutes=2)
+    )
+    
     scheduler.add_job(
         cleanup_old_logs,
         'interval',
@@ -168,6 +208,22 @@ def main():
         id='cleanup_logs'
     )
     
+    scheduler.add_job(
+        purge_expired_ai_cache,
+        'interval',
+        hours=6,
+        id='purge_ai_cache'
+    )
+    
+    scheduler.add_job(
+        collect_orphaned_resumes,
+        'interval',
+        hours=6,
+        id='collect_orphaned_resumes'
+    )
+    
+    ai_task_stop, ai_task_thread = start_ai_task_worker()
+    
     logger.info("Worker scheduler started")
     
     try:
@@ -175,6 +231,10 @@ def main():
     except (KeyboardInterrupt, SystemExit):
         logger.info("Worker shutting down...")
         scheduler.shutdown()
+        ai_task_stop.set()
+        ai_task_thread.join()
+        shutdown_pdf_pool()
+        close_openai_clients()
 
 
 if __name__ == "__main__":